@@ -7,7 +7,7 @@ The Event Bus is a simple, synchronous dispatcher for domain events.
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from home_topology.core.manager import LocationManager
 
@@ -19,7 +19,7 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     A domain event in the home topology system.
@@ -45,7 +45,7 @@ class EventFilter:
     """
     Filter for event subscriptions.
 
-    Allows subscribers to filter events by type, location, ancestors, or descendants.
+    Allows subscribers to filter events by type, entity, location, ancestors, or descendants.
     """
 
     def __init__(
@@ -54,6 +54,8 @@ class EventFilter:
         location_id: Optional[str] = None,
         include_ancestors: bool = False,
         include_descendants: bool = False,
+        event_types: Optional[Iterable[str]] = None,
+        entity_id: Optional[str] = None,
     ):
         """
         Initialize an event filter.
@@ -63,12 +65,31 @@ class EventFilter:
             location_id: Filter by location ID (None = all locations)
             include_ancestors: Include events from ancestor locations
             include_descendants: Include events from descendant locations
+            event_types: Filter by any of several event types (None = all types),
+                so one subscription can cover related events
+            entity_id: Filter by entity ID (None = all entities)
         """
         self.event_type = event_type
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self.entity_id = entity_id
         self.location_id = location_id
         self.include_ancestors = include_ancestors
         self.include_descendants = include_descendants
 
+    def accepts_type(self, event_type: str) -> bool:
+        """
+        Check whether the type constraints of this filter admit an event type.
+
+        Args:
+            event_type: The event type to check
+
+        Returns:
+            True if events of this type can match the filter
+        """
+        if self.event_type and event_type != self.event_type:
+            return False
+        return self.event_types is None or event_type in self.event_types
+
     def matches(self, event: Event, location_manager: Optional[LocationManager] = None) -> bool:
         """
         Check if an event matches this filter.
@@ -81,7 +102,11 @@ class EventFilter:
             True if the event matches the filter
         """
         # Check event type
-        if self.event_type and event.type != self.event_type:
+        if not self.accepts_type(event.type):
+            return False
+
+        # Check entity
+        if self.entity_id and event.entity_id != self.entity_id:
             return False
 
         # Check location
@@ -117,11 +142,18 @@ class EventBus:
     Simple, synchronous event bus for home topology events.
 
     Handlers are wrapped in try/except to prevent one bad module from crashing the kernel.
+
+    The subscriber list is copy-on-write: subscribe/unsubscribe replace the tuple
+    rather than mutating it, so a publish always iterates a consistent snapshot
+    without copying or locking. Each snapshot is also indexed lazily by event type,
+    so a publish only visits subscribers whose filter can accept that type.
     """
 
     def __init__(self) -> None:
         """Initialize the event bus."""
-        self._handlers: List[tuple[EventFilter, EventHandler]] = []
+        self._handlers: tuple[tuple[EventFilter, EventHandler], ...] = ()
+        # event type -> subscribers (in subscription order) for the current snapshot
+        self._handlers_by_type: Dict[str, tuple[tuple[EventFilter, EventHandler], ...]] = {}
         self._location_manager: Optional[LocationManager] = None
 
     def set_location_manager(self, location_manager: LocationManager) -> None:
@@ -148,8 +180,9 @@ class EventBus:
         if event_filter is None:
             event_filter = EventFilter()
 
-        self._handlers.append((event_filter, handler))
-        logger.debug(f"Subscribed handler {handler.__name__} with filter {event_filter}")
+        self._handlers = (*self._handlers, (event_filter, handler))
+        self._handlers_by_type = {}
+        logger.debug("Subscribed handler %s with filter %s", handler.__name__, event_filter)
 
     def publish(self, event: Event) -> None:
         """
@@ -160,16 +193,77 @@ class EventBus:
         Args:
             event: The event to publish
         """
-        logger.debug(f"Publishing event: {event.type} from {event.source}")
+        logger.debug("Publishing event: %s from %s", event.type, event.source)
+        handlers = self._handlers_for(event.type, self._handlers, self._handlers_by_type)
+        self._dispatch(event, handlers, self._location_manager)
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        """
+        Publish a batch of events in order.
+
+        Equivalent to calling publish() for each event, but resolves the subscriber
+        snapshot once for the whole batch. Handlers subscribed while the batch is
+        being delivered start receiving events from the next publish call.
+
+        Args:
+            events: The events to publish
+        """
+        handlers = self._handlers
+        handlers_by_type = self._handlers_by_type
+        location_manager = self._location_manager
+        for event in events:
+            logger.debug("Publishing event: %s from %s", event.type, event.source)
+            self._dispatch(
+                event,
+                self._handlers_for(event.type, handlers, handlers_by_type),
+                location_manager,
+            )
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """
+        Check whether any subscriber could receive events of a type.
 
-        for event_filter, handler in self._handlers:
-            if event_filter.matches(event, self._location_manager):
+        Publishers can use this to skip building expensive payloads nobody will
+        see. Location constraints are not considered, so this may report True for
+        a subscriber that a particular event would not reach.
+
+        Args:
+            event_type: The event type to check
+
+        Returns:
+            True if at least one subscription accepts the event type
+        """
+        return bool(self._handlers_for(event_type, self._handlers, self._handlers_by_type))
+
+    @staticmethod
+    def _handlers_for(
+        event_type: str,
+        handlers: tuple[tuple[EventFilter, EventHandler], ...],
+        handlers_by_type: Dict[str, tuple[tuple[EventFilter, EventHandler], ...]],
+    ) -> tuple[tuple[EventFilter, EventHandler], ...]:
+        """Return the subscribers whose filter accepts event_type, caching per snapshot."""
+        selected = handlers_by_type.get(event_type)
+        if selected is None:
+            selected = tuple(entry for entry in handlers if entry[0].accepts_type(event_type))
+            handlers_by_type[event_type] = selected
+        return selected
+
+    @staticmethod
+    def _dispatch(
+        event: Event,
+        handlers: Iterable[tuple[EventFilter, EventHandler]],
+        location_manager: Optional[LocationManager],
+    ) -> None:
+        for event_filter, handler in handlers:
+            if event_filter.matches(event, location_manager):
                 try:
                     handler(event)
                 except Exception as e:
                     logger.error(
-                        f"Error in event handler {handler.__name__} "
-                        f"for event {event.type}: {e}",
+                        "Error in event handler %s for event %s: %s",
+                        handler.__name__,
+                        event.type,
+                        e,
                         exc_info=True,
                     )
 
@@ -180,5 +274,6 @@ class EventBus:
         Args:
             handler: The handler to unsubscribe
         """
-        self._handlers = [(f, h) for f, h in self._handlers if h != handler]
-        logger.debug(f"Unsubscribed handler {handler.__name__}")
+        self._handlers = tuple((f, h) for f, h in self._handlers if h != handler)
+        self._handlers_by_type = {}
+        logger.debug("Unsubscribed handler %s", handler.__name__)
@@ -33,6 +33,17 @@ class LocationManager:
         self._entity_to_location: Dict[str, str] = {}
         self._adjacency_edges: Dict[str, AdjacencyEdge] = {}
         self._event_bus: Any | None = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped on every location, entity mapping, or module config change.
+
+        Modules can compare it against a remembered value to reuse data derived from
+        the topology. Adjacency edge changes do not bump it.
+        """
+        return self._version
 
     def set_event_bus(self, event_bus: Any) -> None:
         """Attach an optional event bus for topology mutation events."""
@@ -114,6 +125,7 @@ class LocationManager:
         )
 
         self._locations[id] = location
+        self._version += 1
         logger.info(f"Created location: {id} ({name})")
         self._emit_event(
             "location.created",
@@ -180,6 +192,7 @@ class LocationManager:
             raise ValueError(f"Location '{location_id}' has a parent; cannot be root")
 
         location.is_explicit_root = True
+        self._version += 1
         logger.info(f"Marked location as root: {location_id}")
 
     def get_location(self, location_id: str) -> Optional[Location]:
@@ -478,7 +491,8 @@ class LocationManager:
             location.entity_ids.append(entity_id)
 
         self._entity_to_location[entity_id] = location_id
-        logger.debug(f"Mapped entity {entity_id} to location {location_id}")
+        self._version += 1
+        logger.debug("Mapped entity %s to location %s", entity_id, location_id)
 
     def get_entity_location(self, entity_id: str) -> Optional[str]:
         """
@@ -514,6 +528,7 @@ class LocationManager:
             raise ValueError(f"Location '{location_id}' does not exist")
 
         location.modules[module_id] = config
+        self._version += 1
         logger.debug(f"Set config for module '{module_id}' on location '{location_id}'")
 
     def get_module_config(
@@ -558,6 +573,7 @@ class LocationManager:
 
         if alias and alias not in location.aliases:
             location.aliases.append(alias)
+            self._version += 1
             logger.debug(f"Added alias '{alias}' to location '{location_id}'")
 
     def add_aliases(self, location_id: str, aliases: List[str]) -> None:
@@ -595,6 +611,7 @@ class LocationManager:
 
         if alias in location.aliases:
             location.aliases.remove(alias)
+            self._version += 1
             logger.debug(f"Removed alias '{alias}' from location '{location_id}'")
 
     def set_aliases(self, location_id: str, aliases: List[str]) -> None:
@@ -613,6 +630,7 @@ class LocationManager:
             raise ValueError(f"Location '{location_id}' does not exist")
 
         location.aliases = aliases.copy()
+        self._version += 1
         logger.debug(f"Set aliases for location '{location_id}': {aliases}")
 
     def find_by_alias(self, alias: str) -> Optional[Location]:
@@ -685,7 +703,8 @@ class LocationManager:
                 if location and entity_id in location.entity_ids:
                     location.entity_ids.remove(entity_id)
                 del self._entity_to_location[entity_id]
-                logger.debug(f"Removed entity {entity_id} from location {location_id}")
+                self._version += 1
+                logger.debug("Removed entity %s from location %s", entity_id, location_id)
 
     def move_entities(self, entity_ids: List[str], to_location_id: str) -> None:
         """
@@ -800,6 +819,7 @@ class LocationManager:
         if old_parent_id != location.parent_id:
             self._normalize_sibling_orders(old_parent_id)
 
+        self._version += 1
         logger.info(f"Updated location: {location_id}")
         if location.name != old_name:
             self._emit_event(
@@ -867,6 +887,7 @@ class LocationManager:
         siblings.insert(insert_at, location)
         for idx, sibling in enumerate(siblings):
             sibling.order = idx
+        self._version += 1
 
         if old_parent_id != new_parent_id:
             self._normalize_sibling_orders(old_parent_id)
@@ -933,6 +954,7 @@ class LocationManager:
                     child.parent_id = None
                     child.is_explicit_root = False
                     logger.info(f"Orphaned child location: {child.id}")
+                self._version += 1
             else:
                 raise ValueError(
                     f"Cannot delete location '{location_id}': has {len(children)} children. "
@@ -968,11 +990,12 @@ class LocationManager:
         for entity_id in location.entity_ids.copy():
             if self._entity_to_location.get(entity_id) == location_id:
                 del self._entity_to_location[entity_id]
-                logger.debug(f"Unmapped entity {entity_id} from deleted location {location_id}")
+                logger.debug("Unmapped entity %s from deleted location %s", entity_id, location_id)
 
         # Delete location
         metadata = dict(location.modules.get("_meta", {}))
         del self._locations[location_id]
+        self._version += 1
         logger.info(f"Deleted location: {location_id} ({location.name})")
         self._emit_event(
             "location.deleted",
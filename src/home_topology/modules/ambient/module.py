@@ -8,6 +8,7 @@ and automatic fallback strategies.
 import logging
 from collections.abc import Callable, Sequence
 from datetime import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
 from home_topology.modules.base import LocationModule
@@ -19,6 +20,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_LUX_ID_PATTERNS = ("lux", "illuminance", "light_level")
+# Without a platform adapter there is no device class/unit to check, so also accept
+# the looser "brightness" naming.
+_LUX_ID_FALLBACK_PATTERNS = (*_LUX_ID_PATTERNS, "brightness")
+_LUX_UNITS = frozenset({"lx", "lux"})
+_DEFAULT_CONFIG = MappingProxyType(AmbientLightConfig().to_dict())
+
 
 class AmbientLightModule(LocationModule):
     """
@@ -53,6 +61,11 @@ class AmbientLightModule(LocationModule):
         self._bus: Optional["EventBus"] = None
         self._location_manager: Optional["LocationManager"] = None
         self._sensor_cache: Dict[str, Optional[str]] = {}  # location_id → sensor_id
+        self._lux_entity_cache: Dict[str, bool] = {}  # entity_id → is lux sensor
+        # location_id → (location_id, sensor_id) for it and each ancestor with a sensor,
+        # nearest first
+        self._sensor_chain_cache: Dict[str, tuple[tuple[str, str], ...]] = {}
+        self._sensor_cache_version = -1  # LocationManager.version the caches match
         self._last_readings: Dict[str, AmbientLightReading] = {}
 
     def _require_location_manager(self) -> "LocationManager":
@@ -78,7 +91,7 @@ class AmbientLightModule(LocationModule):
 
     def default_config(self) -> Dict:
         """Default configuration for a location."""
-        return AmbientLightConfig().to_dict()
+        return dict(_DEFAULT_CONFIG)
 
     def location_config_schema(self) -> Dict:
         """JSON schema for location configuration."""
@@ -201,16 +214,19 @@ class AmbientLightModule(LocationModule):
         dark_thresh = dark_threshold or config.dark_threshold
         bright_thresh = bright_threshold or config.bright_threshold
 
-        # 1. Try local sensor first
-        sensor = self._find_lux_sensor_for_location(location_id)
-        if sensor:
+        # 1. Try local sensor first, then 2. walk up parent hierarchy if inherit=True
+        inheriting = inherit and config.inherit_from_parent
+        for source_location, sensor in self._lux_sensor_chain(location_id):
+            is_inherited = source_location != location_id
+            if is_inherited and not inheriting:
+                break
             lux = self._get_sensor_value(sensor)
             if lux is not None:
                 reading = AmbientLightReading(
                     lux=lux,
                     source_sensor=sensor,
-                    source_location=location_id,
-                    is_inherited=False,
+                    source_location=source_location,
+                    is_inherited=is_inherited,
                     is_dark=lux < dark_thresh,
                     is_bright=lux > bright_thresh,
                     dark_threshold=dark_thresh,
@@ -220,28 +236,6 @@ class AmbientLightModule(LocationModule):
                 self._last_readings[location_id] = reading
                 return reading
 
-        # 2. Walk up parent hierarchy if inherit=True
-        if inherit and config.inherit_from_parent:
-            ancestors = self._require_location_manager().ancestors_of(location_id)
-            for ancestor in ancestors:
-                sensor = self._find_lux_sensor_for_location(ancestor.id)
-                if sensor:
-                    lux = self._get_sensor_value(sensor)
-                    if lux is not None:
-                        reading = AmbientLightReading(
-                            lux=lux,
-                            source_sensor=sensor,
-                            source_location=ancestor.id,
-                            is_inherited=True,
-                            is_dark=lux < dark_thresh,
-                            is_bright=lux > bright_thresh,
-                            dark_threshold=dark_thresh,
-                            bright_threshold=bright_thresh,
-                            timestamp=datetime.now(),
-                        )
-                        self._last_readings[location_id] = reading
-                        return reading
-
         # 3. Fall back to sun position or error state
         if config.fallback_to_sun:
             reading = self._get_sun_fallback(dark_thresh, bright_thresh)
@@ -311,18 +305,11 @@ class AmbientLightModule(LocationModule):
         Returns:
             Entity ID of lux sensor, or None
         """
-        # Try local first
-        sensor = self._find_lux_sensor_for_location(location_id)
-        if sensor:
-            return sensor
-
-        # Walk up hierarchy if inherit=True
-        if inherit:
-            ancestors = self._require_location_manager().ancestors_of(location_id)
-            for ancestor in ancestors:
-                sensor = self._find_lux_sensor_for_location(ancestor.id)
-                if sensor:
-                    return sensor
+        # Local sensor first, then the nearest ancestor's if inherit=True
+        for source_location, sensor in self._lux_sensor_chain(location_id):
+            if inherit or source_location == location_id:
+                return sensor
+            break
 
         return None
 
@@ -360,8 +347,37 @@ class AmbientLightModule(LocationModule):
     # Private Helpers - Sensor Detection
     # =============================================================================
 
+    def _sync_sensor_caches(self) -> None:
+        """Drop cached sensor resolution once the topology or module config changed."""
+        version = self._require_location_manager().version
+        if version != self._sensor_cache_version:
+            self._sensor_cache.clear()
+            self._sensor_chain_cache.clear()
+            self._lux_entity_cache.clear()
+            self._sensor_cache_version = version
+
+    def _lux_sensor_chain(self, location_id: str) -> tuple[tuple[str, str], ...]:
+        """Return (location_id, sensor) for the location and each ancestor with a sensor."""
+        self._sync_sensor_caches()
+        chain = self._sensor_chain_cache.get(location_id)
+        if chain is None:
+            candidates = [location_id]
+            candidates.extend(
+                ancestor.id
+                for ancestor in self._require_location_manager().ancestors_of(location_id)
+            )
+            chain = tuple(
+                (candidate, sensor)
+                for candidate in candidates
+                if (sensor := self._find_lux_sensor_for_location(candidate))
+            )
+            self._sensor_chain_cache[location_id] = chain
+        return chain
+
     def _find_lux_sensor_for_location(self, location_id: str) -> Optional[str]:
         """Find lux sensor entity in location."""
+        self._sync_sensor_caches()
+
         # Check cache first
         if location_id in self._sensor_cache:
             return self._sensor_cache[location_id]
@@ -391,9 +407,17 @@ class AmbientLightModule(LocationModule):
         return None
 
     def invalidate_ambient_sensor_cache(self, location_id: str | None = None) -> None:
-        """Clear cached lux sensor resolution for one location or all locations."""
+        """
+        Clear cached lux sensor resolution for one location or all locations.
+
+        Clearing all locations also forgets which entities were classified as lux
+        sensors, so changed device classes or units are picked up again.
+        """
+        # Chains can run through any location, so they are always rebuilt
+        self._sensor_chain_cache.clear()
         if location_id is None:
             self._sensor_cache.clear()
+            self._lux_entity_cache.clear()
         else:
             self._sensor_cache.pop(location_id, None)
 
@@ -418,34 +442,36 @@ class AmbientLightModule(LocationModule):
         """
         Check if entity is a lux sensor.
 
+        Results that needed the platform adapter (device class, unit) are cached
+        per entity until invalidate_ambient_sensor_cache() clears all locations.
+
         Args:
             entity_id: Entity ID to check
 
         Returns:
             True if entity appears to be a lux sensor
         """
+        entity_id_lower = entity_id.lower()
         if not self._platform:
             # Fallback to pattern matching if no platform adapter
-            return any(
-                pattern in entity_id.lower()
-                for pattern in ["lux", "illuminance", "light_level", "brightness"]
-            )
+            return any(pattern in entity_id_lower for pattern in _LUX_ID_FALLBACK_PATTERNS)
 
         # Check entity ID pattern
-        if any(pattern in entity_id.lower() for pattern in ["lux", "illuminance", "light_level"]):
+        if any(pattern in entity_id_lower for pattern in _LUX_ID_PATTERNS):
             return True
 
-        # Check device class
-        device_class = self._platform.get_device_class(entity_id)
-        if device_class == "illuminance":
-            return True
+        cached = self._lux_entity_cache.get(entity_id)
+        if cached is not None:
+            return cached
 
-        # Check unit of measurement
-        unit = self._platform.get_unit_of_measurement(entity_id)
-        if unit and unit.lower() in ["lx", "lux"]:
-            return True
+        # Check device class, then unit of measurement
+        is_lux: bool = self._platform.get_device_class(entity_id) == "illuminance"
+        if not is_lux:
+            unit = self._platform.get_unit_of_measurement(entity_id)
+            is_lux = bool(unit and unit.lower() in _LUX_UNITS)
 
-        return False
+        self._lux_entity_cache[entity_id] = is_lux
+        return is_lux
 
     def _get_sensor_value(self, entity_id: str) -> Optional[float]:
         """Get numeric value from sensor."""
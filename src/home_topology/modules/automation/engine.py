@@ -8,13 +8,15 @@ import logging
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional
+from weakref import WeakValueDictionary
 
 from home_topology.core.bus import Event
 
 from .evaluators import ConditionEvaluator
 from .models import (
     AutomationRule,
+    ConditionConfig,
     DelayAction,
     EventTriggerConfig,
     ExecutionMode,
@@ -22,6 +24,7 @@ from .models import (
     ServiceCallAction,
     StateTriggerConfig,
     TimeTriggerConfig,
+    TriggerConfig,
 )
 
 if TYPE_CHECKING:
@@ -31,8 +34,137 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+TriggerPredicate = Callable[[Event], bool]
+# (rule, trigger predicate, conditions in evaluation order, execution state key)
+_CompiledRule = tuple[AutomationRule, TriggerPredicate, tuple[ConditionConfig, ...], str]
 
-@dataclass
+_STATE_EVENT_TYPES = ("state.changed", "sensor.state_changed")
+_NO_BOUND = object()
+_MISSING = object()
+
+
+def _compile_trigger(trigger: TriggerConfig) -> TriggerPredicate:
+    """
+    Specialize a rule trigger into a predicate over events.
+
+    Trigger configs are immutable, so their fields (payload matchers, threshold
+    bounds, normalized times) are unpacked once here instead of on every event.
+    Predicates do not re-check the event type: the engine only applies them to
+    events whose type is one of _trigger_event_types(trigger).
+    """
+    if isinstance(trigger, EventTriggerConfig):
+        return _compile_event_trigger(trigger)
+    if isinstance(trigger, StateTriggerConfig):
+        return _compile_state_trigger(trigger)
+    if isinstance(trigger, TimeTriggerConfig):
+        return _compile_time_trigger(trigger)
+    return lambda event: False
+
+
+def _trigger_event_types(trigger: TriggerConfig) -> tuple[str, ...]:
+    """Return the event types a trigger can match (empty if it never matches)."""
+    if isinstance(trigger, EventTriggerConfig):
+        return (trigger.event_type,)
+    if isinstance(trigger, StateTriggerConfig):
+        return _STATE_EVENT_TYPES
+    if isinstance(trigger, TimeTriggerConfig):
+        # Host integrations should emit time ticks to evaluate time triggers.
+        return ("time.tick",)
+    return ()
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _compile_event_trigger(trigger: EventTriggerConfig) -> TriggerPredicate:
+    # Exact matches on hashable values become one (key, value) subset test against
+    # payload.items(). None is excluded because a missing key must match it too.
+    required: set[tuple[str, Any]] = set()
+    # (key, expected, min, max) for everything else; expected is _NO_BOUND for
+    # threshold matchers (e.g. {"min": 0.7}) and the bounds are _NO_BOUND when absent.
+    checks: List[tuple[str, Any, Any, Any]] = []
+    for key, expected in trigger.payload_match.items():
+        if isinstance(expected, dict):
+            checks.append(
+                (key, _NO_BOUND, expected.get("min", _NO_BOUND), expected.get("max", _NO_BOUND))
+            )
+        elif expected is not None and _is_hashable(expected):
+            required.add((key, expected))
+        else:
+            checks.append((key, expected, _NO_BOUND, _NO_BOUND))
+    required_items = frozenset(required)
+
+    if len(required_items) == 1 and not checks:
+        # The common shape, e.g. {"occupied": True}: one lookup, no set test
+        ((only_key, only_value),) = required_items
+
+        def matches_one(event: Event) -> bool:
+            return bool(event.payload.get(only_key, _MISSING) == only_value)
+
+        return matches_one
+
+    def matches(event: Event) -> bool:
+        payload = event.payload
+        if required_items and not payload.items() >= required_items:
+            return False
+        for key, expected, low, high in checks:
+            actual = payload.get(key)
+            if expected is not _NO_BOUND:
+                if actual != expected:
+                    return False
+                continue
+            if low is not _NO_BOUND and actual < low:
+                return False
+            if high is not _NO_BOUND and actual > high:
+                return False
+        return True
+
+    return matches
+
+
+def _compile_state_trigger(trigger: StateTriggerConfig) -> TriggerPredicate:
+    entity_id = trigger.entity_id
+    from_state = trigger.from_state
+    to_state = trigger.to_state
+    for_seconds = trigger.for_seconds
+
+    def matches(event: Event) -> bool:
+        if event.entity_id != entity_id:
+            return False
+
+        payload = event.payload
+        if from_state is not None and payload.get("old_state") != from_state:
+            return False
+        if to_state is not None and payload.get("new_state") != to_state:
+            return False
+
+        if for_seconds > 0:
+            held_for = payload.get("for_seconds", 0)
+            try:
+                return float(held_for) >= for_seconds
+            except (TypeError, ValueError):
+                return False
+
+        return True
+
+    return matches
+
+
+def _compile_time_trigger(trigger: TimeTriggerConfig) -> TriggerPredicate:
+    at = trigger.at.replace(microsecond=0)
+
+    def matches(event: Event) -> bool:
+        return event.timestamp.time().replace(microsecond=0) == at
+
+    return matches
+
+
+@dataclass(slots=True)
 class RuleExecutionState:
     """Tracks the execution state of a rule."""
 
@@ -43,11 +175,11 @@ class RuleExecutionState:
     pending_delay: Optional[float] = None  # Remaining delay in seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineResult:
     """Result of processing an event or executing actions."""
 
-    rules_evaluated: int = 0
+    rules_evaluated: int = 0  # Rules whose trigger accepts the event's type
     rules_triggered: int = 0
     actions_executed: int = 0
     errors: List[str] = field(default_factory=list)
@@ -80,14 +212,22 @@ class AutomationEngine:
         self._occupancy = occupancy_module
         self._evaluator = ConditionEvaluator(platform, occupancy_module)
 
-        # Rules by location
+        # Rules by location, and the same rules indexed by location and the event
+        # types their trigger accepts, paired with compiled trigger predicates
         self._rules: Dict[str, List[AutomationRule]] = {}
+        self._compiled: Dict[str, Dict[str, List[_CompiledRule]]] = {}
+        # Canonical instance of each distinct condition used by the compiled rules;
+        # entries go away once no compiled rule holds them
+        self._interned_conditions: WeakValueDictionary[ConditionConfig, ConditionConfig] = (
+            WeakValueDictionary()
+        )
 
         # Execution state per rule (key: location_id:rule_id)
         self._execution_state: Dict[str, RuleExecutionState] = {}
 
-        # Execution history (ring buffer)
+        # Execution history (ring buffer), and the same records by location
         self._history: Deque[RuleExecution] = deque(maxlen=self.HISTORY_SIZE)
+        self._history_by_location: Dict[str, Deque[RuleExecution]] = {}
 
         # Trust device state (per-location setting, default True)
         self._trust_state: Dict[str, bool] = {}
@@ -111,9 +251,32 @@ class AutomationEngine:
             trust_device_state: Whether to check state before commands
         """
         self._rules[location_id] = rules
+        by_type: Dict[str, List[_CompiledRule]] = {}
+        for rule in rules:
+            entry = (
+                rule,
+                _compile_trigger(rule.trigger),
+                self._intern_conditions(ConditionEvaluator.order_conditions(rule.conditions)),
+                f"{location_id}:{rule.id}",
+            )
+            for event_type in _trigger_event_types(rule.trigger):
+                by_type.setdefault(event_type, []).append(entry)
+        self._compiled[location_id] = by_type
         self._trust_state[location_id] = trust_device_state
         logger.debug(f"Set {len(rules)} rules for location {location_id}")
 
+    def _intern_conditions(
+        self, conditions: tuple[ConditionConfig, ...]
+    ) -> tuple[ConditionConfig, ...]:
+        """Swap equal conditions for one shared instance across all compiled rules."""
+        interned = self._interned_conditions
+        canonical = []
+        for condition in conditions:
+            if _is_hashable(condition):
+                condition = interned.setdefault(condition, condition)
+            canonical.append(condition)
+        return tuple(canonical)
+
     def get_location_rules(self, location_id: str) -> List[AutomationRule]:
         """Get rules for a location."""
         return self._rules.get(location_id, [])
@@ -121,6 +284,7 @@ class AutomationEngine:
     def clear_location_rules(self, location_id: str) -> None:
         """Clear all rules for a location."""
         self._rules.pop(location_id, None)
+        self._compiled.pop(location_id, None)
         self._trust_state.pop(location_id, None)
 
     # =========================================================================
@@ -144,31 +308,68 @@ class AutomationEngine:
         """
         if now is None:
             now = datetime.now(UTC)
+        return self._process_event(event, now, self._compiled)
+
+    def process_events(
+        self,
+        events: Iterable[Event],
+        now: Optional[datetime] = None,
+    ) -> List[EngineResult]:
+        """
+        Process a batch of events in order.
+
+        Equivalent to calling process_event() for each event, but resolves the
+        current time and rule index once for the whole batch, so every event in
+        the batch is processed (and recorded in history) with the same time.
+
+        Args:
+            events: The events to process
+            now: Current time (for testing)
+
+        Returns:
+            One result per event, in the same order
+        """
+        if now is None:
+            now = datetime.now(UTC)
+        compiled = self._compiled
+        return [self._process_event(event, now, compiled) for event in events]
 
+    def _process_event(
+        self,
+        event: Event,
+        now: datetime,
+        compiled: Dict[str, Dict[str, List[_CompiledRule]]],
+    ) -> EngineResult:
         result = EngineResult()
+        # Platform time for conditions, read once for all rules handling this event
+        condition_time: Optional[datetime] = None
 
         # Get rules for this location
         location_id = event.location_id
         if not location_id:
             return result
 
-        rules = self._rules.get(location_id, [])
+        # Only rules whose trigger can accept this event type are evaluated
+        by_type = compiled.get(location_id)
+        rules = by_type.get(event.type) if by_type else None
         if not rules:
             return result
 
         # Evaluate each rule
-        for rule in rules:
+        for rule, trigger_matches, conditions, state_key in rules:
             result.rules_evaluated += 1
 
             if not rule.enabled:
                 continue
 
             # Check if trigger matches
-            if not self._trigger_matches(rule, event):
+            if not trigger_matches(event):
                 continue
 
             # Check conditions
-            if not self._evaluator.evaluate_all(rule.conditions):
+            if conditions and condition_time is None:
+                condition_time = self._platform.get_current_time()
+            if not self._evaluator.evaluate_all(conditions, ordered=True, now=condition_time):
                 self._record_execution(
                     rule_id=rule.id,
                     location_id=location_id,
@@ -182,87 +383,24 @@ class AutomationEngine:
                 )
                 continue
 
-            # Handle execution mode
-            state_key = f"{location_id}:{rule.id}"
+            # Handle execution mode; only matters while a previous run is active
             state = self._execution_state.get(state_key)
 
             if state and state.is_running:
                 if rule.mode == ExecutionMode.SINGLE:
-                    logger.debug(f"Rule {rule.id} already running, skipping (single mode)")
+                    logger.debug("Rule %s already running, skipping (single mode)", rule.id)
                     continue
                 elif rule.mode == ExecutionMode.RESTART:
-                    logger.debug(f"Rule {rule.id} restarting, cancelling previous")
+                    logger.debug("Rule %s restarting, cancelling previous", rule.id)
                     self._cancel_execution(state_key)
 
             # Execute actions
             result.rules_triggered += 1
-            exec_result = self._execute_rule(rule, location_id, event.type, now)
+            exec_result = self._execute_rule(rule, location_id, event.type, now, state_key)
             result.actions_executed += exec_result
 
         return result
 
-    # =========================================================================
-    # Trigger Matching
-    # =========================================================================
-
-    def _trigger_matches(self, rule: AutomationRule, event: Event) -> bool:
-        """Check if an event matches a rule's trigger."""
-        trigger = rule.trigger
-
-        if isinstance(trigger, EventTriggerConfig):
-            # Check event type
-            if event.type != trigger.event_type:
-                return False
-
-            # Check payload match
-            for key, expected in trigger.payload_match.items():
-                actual = event.payload.get(key)
-
-                # Handle threshold matching (e.g., {"min": 0.7})
-                if isinstance(expected, dict):
-                    if "min" in expected and actual < expected["min"]:
-                        return False
-                    if "max" in expected and actual > expected["max"]:
-                        return False
-                elif actual != expected:
-                    return False
-
-            return True
-
-        if isinstance(trigger, StateTriggerConfig):
-            if event.type not in ("state.changed", "sensor.state_changed"):
-                return False
-
-            if event.entity_id != trigger.entity_id:
-                return False
-
-            old_state = event.payload.get("old_state")
-            new_state = event.payload.get("new_state")
-
-            if trigger.from_state is not None and old_state != trigger.from_state:
-                return False
-            if trigger.to_state is not None and new_state != trigger.to_state:
-                return False
-
-            if trigger.for_seconds > 0:
-                held_for = event.payload.get("for_seconds", 0)
-                try:
-                    return float(held_for) >= trigger.for_seconds
-                except (TypeError, ValueError):
-                    return False
-
-            return True
-
-        if isinstance(trigger, TimeTriggerConfig):
-            # Host integrations should emit time ticks to evaluate time triggers.
-            if event.type != "time.tick":
-                return False
-            return event.timestamp.time().replace(microsecond=0) == trigger.at.replace(
-                microsecond=0
-            )
-
-        return False
-
     # =========================================================================
     # Action Execution
     # =========================================================================
@@ -273,6 +411,7 @@ class AutomationEngine:
         location_id: str,
         trigger_event_type: str,
         now: datetime,
+        state_key: str,
     ) -> int:
         """
         Execute a rule's actions.
@@ -286,7 +425,6 @@ class AutomationEngine:
         error = None
 
         # Mark as running
-        state_key = f"{location_id}:{rule.id}"
         self._execution_state[state_key] = RuleExecutionState(
             rule_id=rule.id,
             location_id=location_id,
@@ -307,7 +445,7 @@ class AutomationEngine:
                     # asynchronously by the host platform. For now, we just
                     # record them. The HA integration will handle scheduling.
                     actions_executed.append({"delay": action.seconds})
-                    logger.debug(f"Delay action: {action.seconds}s (host must schedule)")
+                    logger.debug("Delay action: %ss (host must schedule)", action.seconds)
 
         except Exception as e:
             success = False
@@ -354,14 +492,11 @@ class AutomationEngine:
         Returns:
             True if successful
         """
-        # Parse service (e.g., "light.turn_on" -> domain="light", service="turn_on")
-        parts = action.service.split(".", 1)
-        if len(parts) != 2:
+        # Service was split when the action was built (e.g., "light.turn_on")
+        if action.domain is None or action.service_name is None:
             logger.error(f"Invalid service format: {action.service}")
             return False
 
-        domain, service = parts
-
         # Check state before sending (if trust_device_state is True)
         trust_state = self._trust_state.get(location_id, True)
         if trust_state and action.entity_id:
@@ -372,30 +507,21 @@ class AutomationEngine:
                 return True
 
         # Execute service call
-        logger.info(f"Executing: {action.service} -> {action.entity_id}")
+        logger.info("Executing: %s -> %s", action.service, action.entity_id)
         return self._platform.call_service(
-            domain=domain,
-            service=service,
+            domain=action.domain,
+            service=action.service_name,
             entity_id=action.entity_id,
             data=dict(action.data) if action.data else None,
         )
 
     def _should_skip_action(self, action: ServiceCallAction) -> bool:
         """Check if action should be skipped (entity already in desired state)."""
-        if not action.entity_id:
+        # Only turn_on/turn_off calls have a known target state
+        if not action.entity_id or action.desired_state is None:
             return False
 
-        current_state = self._platform.get_state(action.entity_id)
-        if current_state is None:
-            return False
-
-        # Common patterns
-        if action.service.endswith(".turn_on") and current_state == "on":
-            return True
-        if action.service.endswith(".turn_off") and current_state == "off":
-            return True
-
-        return False
+        return self._platform.get_state(action.entity_id) == action.desired_state
 
     def _cancel_execution(self, state_key: str) -> None:
         """Cancel a running rule execution."""
@@ -403,7 +529,7 @@ class AutomationEngine:
         if state:
             state.is_running = False
             state.pending_delay = None
-            logger.debug(f"Cancelled execution: {state_key}")
+            logger.debug("Cancelled execution: %s", state_key)
 
     # =========================================================================
     # History
@@ -433,7 +559,20 @@ class AutomationEngine:
             timestamp=timestamp,
             duration_ms=duration_ms,
         )
-        self._history.append(execution)
+        self._append_history(execution)
+
+    def _append_history(self, execution: RuleExecution) -> None:
+        """Append to the history ring buffer, keeping the location index in step."""
+        history = self._history
+        if len(history) == history.maxlen:
+            # The record about to fall off is the oldest one for its location too
+            evicted = history[0]
+            by_location = self._history_by_location[evicted.location_id]
+            by_location.popleft()
+            if not by_location:
+                del self._history_by_location[evicted.location_id]
+        history.append(execution)
+        self._history_by_location.setdefault(execution.location_id, deque()).append(execution)
 
     def get_history(
         self,
@@ -452,10 +591,13 @@ class AutomationEngine:
         Returns:
             List of RuleExecution records (newest first)
         """
+        if location_id:
+            history = self._history_by_location.get(location_id, ())
+        else:
+            history = self._history
+
         result = []
-        for execution in reversed(self._history):
-            if location_id and execution.location_id != location_id:
-                continue
+        for execution in reversed(history):
             if rule_id and execution.rule_id != rule_id:
                 continue
             result.append(execution)
@@ -507,8 +649,9 @@ class AutomationEngine:
 
         # Restore history
         self._history.clear()
+        self._history_by_location.clear()
         for entry in state.get("history", []):
-            self._history.append(
+            self._append_history(
                 RuleExecution(
                     rule_id=entry["rule_id"],
                     location_id=entry["location_id"],
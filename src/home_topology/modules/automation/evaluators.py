@@ -5,8 +5,8 @@ Each evaluator checks whether a specific condition type is met.
 """
 
 import logging
-from datetime import time
-from typing import TYPE_CHECKING, Optional, Sequence
+from datetime import datetime, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, TypeVar, cast
 
 from .models import (
     ConditionConfig,
@@ -25,6 +25,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Relative cost of evaluating each condition type. evaluate_all checks cheap
+# in-process conditions before ones that query the platform, so a failing clock
+# or calendar check short-circuits before any entity reads.
+_CONDITION_COST: Dict[type, int] = {
+    DayOfWeekCondition: 1,
+    TimeOfDayCondition: 1,
+    LocationOccupiedCondition: 2,
+    StateCondition: 3,
+    NumericStateCondition: 4,
+    LuxLevelCondition: 4,
+}
+
+
+def _condition_cost(condition: ConditionConfig) -> int:
+    return _CONDITION_COST.get(type(condition), 5)
+
 
 class ConditionEvaluator:
     """
@@ -41,6 +59,17 @@ class ConditionEvaluator:
     ) -> None:
         self._platform = platform
         self._occupancy = occupancy_module
+        # Platform reads memoized for the duration of one evaluate_all() call
+        self._read_cache: Optional[Dict[tuple[str, str], Any]] = None
+        # Condition type -> check method
+        self._checks: Dict[type, Callable[[Any], bool]] = {
+            TimeOfDayCondition: self._check_time_of_day,
+            StateCondition: self._check_state,
+            NumericStateCondition: self._check_numeric_state,
+            LuxLevelCondition: self._check_lux_level,
+            LocationOccupiedCondition: self._check_location_occupied,
+            DayOfWeekCondition: self._check_day_of_week,
+        }
 
     def evaluate(self, condition: ConditionConfig) -> bool:
         """
@@ -52,37 +81,93 @@ class ConditionEvaluator:
         Returns:
             True if condition is met, False otherwise
         """
-        if isinstance(condition, TimeOfDayCondition):
-            return self._check_time_of_day(condition)
-        elif isinstance(condition, StateCondition):
-            return self._check_state(condition)
-        elif isinstance(condition, NumericStateCondition):
-            return self._check_numeric_state(condition)
-        elif isinstance(condition, LuxLevelCondition):
-            return self._check_lux_level(condition)
-        elif isinstance(condition, LocationOccupiedCondition):
-            return self._check_location_occupied(condition)
-        elif isinstance(condition, DayOfWeekCondition):
-            return self._check_day_of_week(condition)
-        else:
-            logger.warning(f"Unknown condition type: {type(condition)}")
-            return False
+        check = self._checks.get(type(condition))
+        if check is None:
+            # Subclasses of a known condition type use their base's check
+            for condition_type, base_check in self._checks.items():
+                if isinstance(condition, condition_type):
+                    check = base_check
+                    break
+            else:
+                logger.warning(f"Unknown condition type: {type(condition)}")
+                return False
+        return check(condition)
+
+    @staticmethod
+    def order_conditions(conditions: Sequence[ConditionConfig]) -> tuple[ConditionConfig, ...]:
+        """
+        Order conditions cheapest first (clock and calendar before entity reads).
+
+        The sort is stable, so conditions of equal cost keep their rule order.
+
+        Args:
+            conditions: Conditions to order
+
+        Returns:
+            The conditions in evaluation order
+        """
+        return tuple(sorted(conditions, key=_condition_cost))
 
-    def evaluate_all(self, conditions: Sequence[ConditionConfig]) -> bool:
+    def evaluate_all(
+        self,
+        conditions: Sequence[ConditionConfig],
+        ordered: bool = False,
+        now: Optional[datetime] = None,
+    ) -> bool:
         """
         Evaluate all conditions (AND logic).
 
+        Conditions are checked cheapest first (see order_conditions); the result
+        does not depend on order because checks have no side effects beyond
+        logging.
+
         Args:
             conditions: List of conditions to evaluate
+            ordered: True if conditions were already ordered by order_conditions(),
+                so they can be checked as given
+            now: Current platform time, if the caller already has it; read from
+                the platform on first use otherwise
 
         Returns:
             True if ALL conditions are met
         """
-        for condition in conditions:
-            if not self.evaluate(condition):
-                logger.debug(f"Condition not met: {condition}")
-                return False
-        return True
+        if not ordered and len(conditions) > 1:
+            conditions = self.order_conditions(conditions)
+
+        # Conditions in one pass see a single snapshot of time and entity states
+        previous_cache = self._read_cache
+        self._read_cache = {} if now is None else {("time", ""): now}
+        try:
+            for condition in conditions:
+                if not self.evaluate(condition):
+                    logger.debug("Condition not met: %s", condition)
+                    return False
+            return True
+        finally:
+            self._read_cache = previous_cache
+
+    # =========================================================================
+    # Platform Reads
+    # =========================================================================
+
+    def _read(self, kind: str, key: str, read: Callable[[], T]) -> T:
+        """Call a platform read, memoized while evaluate_all() is running."""
+        cache = self._read_cache
+        if cache is None:
+            return read()
+        cache_key = (kind, key)
+        if cache_key not in cache:
+            cache[cache_key] = read()
+        return cast(T, cache[cache_key])
+
+    def _current_time(self) -> datetime:
+        return self._read("time", "", self._platform.get_current_time)
+
+    def _get_state(self, entity_id: str) -> Optional[str]:
+        return self._read("state", entity_id, lambda: self._platform.get_state(entity_id))
+
+    def _get_numeric_state(self, entity_id: str) -> Optional[float]:
+        return self._read("numeric", entity_id, lambda: self._platform.get_numeric_state(entity_id))
 
     # =========================================================================
     # Condition Implementations
@@ -90,21 +175,25 @@ class ConditionEvaluator:
 
     def _check_time_of_day(self, condition: TimeOfDayCondition) -> bool:
         """Check if current time is within the specified window."""
-        now = self._platform.get_current_time()
+        now = self._current_time()
         current_time = now.time()
 
-        after_time: Optional[time] = None
-        before_time: Optional[time] = None
+        # Fixed times were parsed when the condition was built
+        after_time: Optional[time] = condition.after_time
+        before_time: Optional[time] = condition.before_time
 
-        if condition.after:
+        if condition.after and after_time is None:
             after_time = self._platform.parse_time_expression(condition.after)
-        if condition.before:
+        if condition.before and before_time is None:
             before_time = self._platform.parse_time_expression(condition.before)
 
         # Handle various cases
         if after_time and before_time:
             # Window could span midnight (e.g., 22:00 to 06:00)
-            if after_time <= before_time:
+            spans_midnight = condition.spans_midnight
+            if spans_midnight is None:
+                spans_midnight = after_time > before_time
+            if not spans_midnight:
                 # Normal window (e.g., 08:00 to 18:00)
                 return after_time <= current_time <= before_time
             else:
@@ -119,7 +208,7 @@ class ConditionEvaluator:
 
     def _check_state(self, condition: StateCondition) -> bool:
         """Check if entity is in the expected state."""
-        actual = self._platform.get_state(condition.entity_id)
+        actual = self._get_state(condition.entity_id)
         if actual is None:
             logger.warning(f"Entity not found: {condition.entity_id}")
             return False
@@ -127,7 +216,7 @@ class ConditionEvaluator:
 
     def _check_numeric_state(self, condition: NumericStateCondition) -> bool:
         """Check if entity's numeric value is within range."""
-        value = self._platform.get_numeric_state(condition.entity_id)
+        value = self._get_numeric_state(condition.entity_id)
         if value is None:
             logger.warning(f"Numeric state unavailable: {condition.entity_id}")
             return False
@@ -140,7 +229,7 @@ class ConditionEvaluator:
 
     def _check_lux_level(self, condition: LuxLevelCondition) -> bool:
         """Check light level condition (wrapper around numeric state)."""
-        value = self._platform.get_numeric_state(condition.entity_id)
+        value = self._get_numeric_state(condition.entity_id)
         if value is None:
             logger.warning(f"Lux sensor unavailable: {condition.entity_id}")
             # When lux sensor unavailable, assume it's dark (safer for lighting)
@@ -169,10 +258,8 @@ class ConditionEvaluator:
 
     def _check_day_of_week(self, condition: DayOfWeekCondition) -> bool:
         """Check if current day is in the allowed set."""
-        now = self._platform.get_current_time()
-        day_names = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
-        current_day = day_names[now.weekday()]
-        return current_day in condition.days
+        now = self._current_time()
+        return bool(condition.day_mask >> now.weekday() & 1)
 
 
 def is_dark(
@@ -201,6 +288,10 @@ def is_dark(
         The integration layer should provide appropriate entities:
         - sun.sun (Home Assistant built-in)
         - binary_sensor.is_dark (integration-provided helper)
+
+        Each call reads the platform directly. Rule conditions that test the
+        same entities should go through ConditionEvaluator.evaluate_all, which
+        reads each entity once per pass.
     """
     # Try lux sensor first (most accurate)
     if lux_entity:
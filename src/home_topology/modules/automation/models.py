@@ -4,10 +4,11 @@ Data models for the Automation engine.
 Defines rules, triggers, conditions, and actions for automation.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from enum import Enum
-from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence
 
 # =============================================================================
 # Enums
@@ -54,7 +55,7 @@ class ExecutionMode(Enum):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventTriggerConfig:
     """Trigger on semantic events like occupancy.changed."""
 
@@ -67,7 +68,7 @@ class EventTriggerConfig:
         return TriggerType.EVENT
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateTriggerConfig:
     """Trigger on entity state changes."""
 
@@ -81,7 +82,7 @@ class StateTriggerConfig:
         return TriggerType.STATE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeTriggerConfig:
     """Trigger at specific time."""
 
@@ -100,24 +101,52 @@ TriggerConfig = EventTriggerConfig | StateTriggerConfig | TimeTriggerConfig
 # =============================================================================
 
 
-@dataclass(frozen=True)
+def _parse_fixed_time(expr: Optional[str]) -> Optional[time]:
+    """Parse an HH:MM[:SS] expression, or return None for solar/other expressions."""
+    if not expr:
+        return None
+    try:
+        return time.fromisoformat(expr.strip())
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class TimeOfDayCondition:
     """Check if current time is within a window.
 
     Supports:
     - Fixed times: "22:00:00", "06:00:00"
     - Solar times: "sunset", "sunrise", "sunset-01:00", "sunrise+00:30"
+
+    Fixed times are parsed once at construction (after_time/before_time); other
+    expressions stay None there and are resolved by the platform on each check.
+    When both bounds are fixed, spans_midnight records the window shape too.
     """
 
     after: Optional[str] = None  # e.g., "sunset", "22:00:00"
     before: Optional[str] = None  # e.g., "sunrise", "06:00:00"
+    after_time: Optional[time] = field(init=False, repr=False, compare=False)
+    before_time: Optional[time] = field(init=False, repr=False, compare=False)
+    spans_midnight: Optional[bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-parse fixed time expressions."""
+        after_time = _parse_fixed_time(self.after)
+        before_time = _parse_fixed_time(self.before)
+        spans_midnight = None
+        if after_time is not None and before_time is not None:
+            spans_midnight = after_time > before_time
+        object.__setattr__(self, "after_time", after_time)
+        object.__setattr__(self, "before_time", before_time)
+        object.__setattr__(self, "spans_midnight", spans_midnight)
 
     @property
     def condition_type(self) -> ConditionType:
         return ConditionType.TIME_OF_DAY
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class StateCondition:
     """Check if entity is in a specific state."""
 
@@ -129,7 +158,7 @@ class StateCondition:
         return ConditionType.STATE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class NumericStateCondition:
     """Check if entity's numeric value is within range."""
 
@@ -142,7 +171,7 @@ class NumericStateCondition:
         return ConditionType.NUMERIC_STATE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class LuxLevelCondition:
     """Check light level from a lux sensor.
 
@@ -161,7 +190,7 @@ class LuxLevelCondition:
         return ConditionType.LUX_LEVEL
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class LocationOccupiedCondition:
     """Check if a location is occupied or vacant."""
 
@@ -173,11 +202,28 @@ class LocationOccupiedCondition:
         return ConditionType.LOCATION_OCCUPIED
 
 
-@dataclass(frozen=True)
+_DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")  # datetime.weekday() order
+_DAY_INDEX = {name: index for index, name in enumerate(_DAY_NAMES)}
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class DayOfWeekCondition:
-    """Check if current day is in the allowed set."""
+    """Check if current day is in the allowed set.
+
+    The days are also folded into a weekday bitmask (bit n = datetime.weekday() n)
+    so evaluation is a single shift-and-mask instead of a string lookup.
+    """
 
     days: FrozenSet[str]  # e.g., frozenset({"mon", "tue", "wed", "thu", "fri"})
+    day_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the weekday bitmask."""
+        mask = 0
+        for index, name in enumerate(_DAY_NAMES):
+            if name in self.days:
+                mask |= 1 << index
+        object.__setattr__(self, "day_mask", mask)
 
     @property
     def condition_type(self) -> ConditionType:
@@ -199,20 +245,41 @@ ConditionConfig = (
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceCallAction:
-    """Execute a platform service call (e.g., light.turn_on)."""
+    """Execute a platform service call (e.g., light.turn_on).
+
+    The service is split once at construction into domain and service_name (both
+    None if it is not "domain.service"), and desired_state records the state a
+    turn_on/turn_off call leaves its entity in.
+    """
 
     service: str  # e.g., "light.turn_on", "switch.turn_off"
     entity_id: Optional[str] = None  # Target entity (can also be in data)
     data: Dict[str, Any] = field(default_factory=dict)  # Service data
+    domain: Optional[str] = field(init=False, repr=False, compare=False)
+    service_name: Optional[str] = field(init=False, repr=False, compare=False)
+    desired_state: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-split the service name."""
+        parts = self.service.split(".", 1)
+        domain, service_name = parts if len(parts) == 2 else (None, None)
+        desired_state = None
+        if service_name == "turn_on":
+            desired_state = "on"
+        elif service_name == "turn_off":
+            desired_state = "off"
+        object.__setattr__(self, "domain", domain)
+        object.__setattr__(self, "service_name", service_name)
+        object.__setattr__(self, "desired_state", desired_state)
 
     @property
     def action_type(self) -> ActionType:
         return ActionType.SERVICE_CALL
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DelayAction:
     """Wait before executing next action."""
 
@@ -226,12 +293,144 @@ class DelayAction:
 ActionConfig = ServiceCallAction | DelayAction
 
 
+# =============================================================================
+# Config Serialization
+# =============================================================================
+#
+# Each config class has one serializer keyed by its type and one parser keyed by
+# its "type" tag, so AutomationRule.to_dict/from_dict dispatch with a single
+# dict lookup per trigger, condition, and action. Parsers intern the identifier
+# strings (event types, entity IDs, states, services, payload keys) that recur
+# across rules, so loaded configs share one object per distinct string.
+
+
+def _ordered_days(days: FrozenSet[str]) -> List[str]:
+    """List days in weekday order (unrecognized names last) for stable output."""
+    return sorted(days, key=lambda day: (_DAY_INDEX.get(day, len(_DAY_NAMES)), day))
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string, passing anything else (including None) through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_items(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    return {_intern(key): _intern(value) for key, value in mapping.items()}
+
+
+def _service_call_to_dict(a: ServiceCallAction) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"type": "service_call", "service": a.service}
+    if a.entity_id:
+        result["entity_id"] = a.entity_id
+    if a.data:
+        result["data"] = dict(a.data)
+    return result
+
+
+_TRIGGER_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    EventTriggerConfig: lambda t: {
+        "type": "event",
+        "event_type": t.event_type,
+        "payload_match": dict(t.payload_match),
+    },
+    StateTriggerConfig: lambda t: {
+        "type": "state",
+        "entity_id": t.entity_id,
+        "to_state": t.to_state,
+        "from_state": t.from_state,
+        "for_seconds": t.for_seconds,
+    },
+    TimeTriggerConfig: lambda t: {"type": "time", "at": t.at.isoformat()},
+}
+
+_TRIGGER_PARSERS: Dict[str, Callable[[Dict[str, Any]], TriggerConfig]] = {
+    "event": lambda data: EventTriggerConfig(
+        event_type=_intern(data["event_type"]),
+        payload_match=_intern_items(data.get("payload_match", {})),
+    ),
+    "state": lambda data: StateTriggerConfig(
+        entity_id=_intern(data["entity_id"]),
+        to_state=_intern(data.get("to_state")),
+        from_state=_intern(data.get("from_state")),
+        for_seconds=data.get("for_seconds", 0),
+    ),
+    "time": lambda data: TimeTriggerConfig(at=time.fromisoformat(data["at"])),
+}
+
+_CONDITION_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    TimeOfDayCondition: lambda c: {"type": "time_of_day", "after": c.after, "before": c.before},
+    StateCondition: lambda c: {"type": "state", "entity_id": c.entity_id, "state": c.state},
+    NumericStateCondition: lambda c: {
+        "type": "numeric_state",
+        "entity_id": c.entity_id,
+        "above": c.above,
+        "below": c.below,
+    },
+    LuxLevelCondition: lambda c: {
+        "type": "lux_level",
+        "entity_id": c.entity_id,
+        "location_id": c.location_id,
+        "inherit_from_parent": c.inherit_from_parent,
+        "below": c.below,
+        "above": c.above,
+    },
+    LocationOccupiedCondition: lambda c: {
+        "type": "location_occupied",
+        "location_id": c.location_id,
+        "occupied": c.occupied,
+    },
+    DayOfWeekCondition: lambda c: {"type": "day_of_week", "days": _ordered_days(c.days)},
+}
+
+_CONDITION_PARSERS: Dict[str, Callable[[Dict[str, Any]], ConditionConfig]] = {
+    "time_of_day": lambda data: TimeOfDayCondition(
+        after=data.get("after"),
+        before=data.get("before"),
+    ),
+    "state": lambda data: StateCondition(
+        entity_id=_intern(data["entity_id"]),
+        state=_intern(data["state"]),
+    ),
+    "numeric_state": lambda data: NumericStateCondition(
+        entity_id=_intern(data["entity_id"]),
+        above=data.get("above"),
+        below=data.get("below"),
+    ),
+    "lux_level": lambda data: LuxLevelCondition(
+        entity_id=_intern(data.get("entity_id", "")),
+        location_id=_intern(data.get("location_id")),
+        inherit_from_parent=data.get("inherit_from_parent", True),
+        below=data.get("below"),
+        above=data.get("above"),
+    ),
+    "location_occupied": lambda data: LocationOccupiedCondition(
+        location_id=_intern(data["location_id"]),
+        occupied=data.get("occupied", True),
+    ),
+    "day_of_week": lambda data: DayOfWeekCondition(days=frozenset(data["days"])),
+}
+
+_ACTION_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    ServiceCallAction: _service_call_to_dict,
+    DelayAction: lambda a: {"type": "delay", "seconds": a.seconds},
+}
+
+_ACTION_PARSERS: Dict[str, Callable[[Dict[str, Any]], ActionConfig]] = {
+    "service_call": lambda data: ServiceCallAction(
+        service=_intern(data["service"]),
+        entity_id=_intern(data.get("entity_id")),
+        data=data.get("data", {}),
+    ),
+    "delay": lambda data: DelayAction(seconds=data["seconds"]),
+}
+
+
 # =============================================================================
 # Automation Rule
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AutomationRule:
     """A complete automation rule.
 
@@ -264,71 +463,18 @@ class AutomationRule:
 
     def _serialize_trigger(self) -> Dict[str, Any]:
         """Serialize trigger config."""
-        if isinstance(self.trigger, EventTriggerConfig):
-            return {
-                "type": "event",
-                "event_type": self.trigger.event_type,
-                "payload_match": dict(self.trigger.payload_match),
-            }
-        elif isinstance(self.trigger, StateTriggerConfig):
-            return {
-                "type": "state",
-                "entity_id": self.trigger.entity_id,
-                "to_state": self.trigger.to_state,
-                "from_state": self.trigger.from_state,
-                "for_seconds": self.trigger.for_seconds,
-            }
-        elif isinstance(self.trigger, TimeTriggerConfig):
-            return {
-                "type": "time",
-                "at": self.trigger.at.isoformat(),
-            }
-        return {}
+        serialize = _TRIGGER_SERIALIZERS.get(type(self.trigger))
+        return serialize(self.trigger) if serialize else {}
 
     def _serialize_condition(self, c: ConditionConfig) -> Dict[str, Any]:
         """Serialize condition config."""
-        if isinstance(c, TimeOfDayCondition):
-            return {"type": "time_of_day", "after": c.after, "before": c.before}
-        elif isinstance(c, StateCondition):
-            return {"type": "state", "entity_id": c.entity_id, "state": c.state}
-        elif isinstance(c, NumericStateCondition):
-            return {
-                "type": "numeric_state",
-                "entity_id": c.entity_id,
-                "above": c.above,
-                "below": c.below,
-            }
-        elif isinstance(c, LuxLevelCondition):
-            return {
-                "type": "lux_level",
-                "entity_id": c.entity_id,
-                "location_id": c.location_id,
-                "inherit_from_parent": c.inherit_from_parent,
-                "below": c.below,
-                "above": c.above,
-            }
-        elif isinstance(c, LocationOccupiedCondition):
-            return {
-                "type": "location_occupied",
-                "location_id": c.location_id,
-                "occupied": c.occupied,
-            }
-        elif isinstance(c, DayOfWeekCondition):
-            return {"type": "day_of_week", "days": list(c.days)}
-        return {}
+        serialize = _CONDITION_SERIALIZERS.get(type(c))
+        return serialize(c) if serialize else {}
 
     def _serialize_action(self, a: ActionConfig) -> Dict[str, Any]:
         """Serialize action config."""
-        if isinstance(a, ServiceCallAction):
-            result: Dict[str, Any] = {"type": "service_call", "service": a.service}
-            if a.entity_id:
-                result["entity_id"] = a.entity_id
-            if a.data:
-                result["data"] = dict(a.data)
-            return result
-        elif isinstance(a, DelayAction):
-            return {"type": "delay", "seconds": a.seconds}
-        return {}
+        serialize = _ACTION_SERIALIZERS.get(type(a))
+        return serialize(a) if serialize else {}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AutomationRule":
@@ -346,84 +492,28 @@ class AutomationRule:
     def _parse_trigger(data: Dict[str, Any]) -> TriggerConfig:
         """Parse trigger config from dict."""
         trigger_type = data.get("type", "event")
-
-        if trigger_type == "event":
-            return EventTriggerConfig(
-                event_type=data["event_type"],
-                payload_match=data.get("payload_match", {}),
-            )
-        elif trigger_type == "state":
-            return StateTriggerConfig(
-                entity_id=data["entity_id"],
-                to_state=data.get("to_state"),
-                from_state=data.get("from_state"),
-                for_seconds=data.get("for_seconds", 0),
-            )
-        elif trigger_type == "time":
-            return TimeTriggerConfig(
-                at=time.fromisoformat(data["at"]),
-            )
-        else:
+        parse = _TRIGGER_PARSERS.get(trigger_type)
+        if parse is None:
             raise ValueError(f"Unknown trigger type: {trigger_type}")
+        return parse(data)
 
     @staticmethod
     def _parse_condition(data: Dict[str, Any]) -> ConditionConfig:
         """Parse condition config from dict."""
         condition_type = data["type"]
-
-        if condition_type == "time_of_day":
-            return TimeOfDayCondition(
-                after=data.get("after"),
-                before=data.get("before"),
-            )
-        elif condition_type == "state":
-            return StateCondition(
-                entity_id=data["entity_id"],
-                state=data["state"],
-            )
-        elif condition_type == "numeric_state":
-            return NumericStateCondition(
-                entity_id=data["entity_id"],
-                above=data.get("above"),
-                below=data.get("below"),
-            )
-        elif condition_type == "lux_level":
-            return LuxLevelCondition(
-                entity_id=data.get("entity_id", ""),
-                location_id=data.get("location_id"),
-                inherit_from_parent=data.get("inherit_from_parent", True),
-                below=data.get("below"),
-                above=data.get("above"),
-            )
-        elif condition_type == "location_occupied":
-            return LocationOccupiedCondition(
-                location_id=data["location_id"],
-                occupied=data.get("occupied", True),
-            )
-        elif condition_type == "day_of_week":
-            return DayOfWeekCondition(
-                days=frozenset(data["days"]),
-            )
-        else:
+        parse = _CONDITION_PARSERS.get(condition_type)
+        if parse is None:
             raise ValueError(f"Unknown condition type: {condition_type}")
+        return parse(data)
 
     @staticmethod
     def _parse_action(data: Dict[str, Any]) -> ActionConfig:
         """Parse action config from dict."""
         action_type = data.get("type", "service_call")
-
-        if action_type == "service_call":
-            return ServiceCallAction(
-                service=data["service"],
-                entity_id=data.get("entity_id"),
-                data=data.get("data", {}),
-            )
-        elif action_type == "delay":
-            return DelayAction(
-                seconds=data["seconds"],
-            )
-        else:
+        parse = _ACTION_PARSERS.get(action_type)
+        if parse is None:
             raise ValueError(f"Unknown action type: {action_type}")
+        return parse(data)
 
 
 # =============================================================================
@@ -431,7 +521,7 @@ class AutomationRule:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleExecution:
     """Record of a rule execution (for history/debugging)."""
 
@@ -451,7 +541,7 @@ class RuleExecution:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationAutomationConfig:
     """Per-location configuration for the automation module."""
 
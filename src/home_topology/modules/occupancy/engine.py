@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+import sys
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from itertools import count
+from typing import Any, Iterable
 
 from .models import (
     REASON_EVENT_PREFIX,
@@ -30,6 +34,108 @@ _LOGGER = logging.getLogger(__name__)
 _CHILD_PREFIX = "__child__"
 _FOLLOW_PREFIX = "__follow_parent__"
 _LOCK_HOLD_PREFIX = "__lock_hold__"
+_LOCK_HOLD_SOURCE_PREFIX = f"{_LOCK_HOLD_PREFIX}:"
+
+_LOCK_EVENT_TYPES = frozenset({EventType.LOCK, EventType.UNLOCK, EventType.UNLOCK_ALL})
+_EVENT_REASONS = {
+    event_type: f"{REASON_EVENT_PREFIX}{event_type.value}" for event_type in EventType
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+ContribMap = dict[str, datetime | None]
+# (expires_at in integer nanoseconds, location_id, schedule generation, expires_at)
+ExpiryEntry = tuple[int, str, int, datetime]
+
+
+def _to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch (naive = UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    delta = value - _EPOCH
+    return (delta.days * 86_400_000_000 + delta.seconds * 1_000_000 + delta.microseconds) * 1_000
+
+
+SuspendedMap = dict[str, timedelta | None]
+
+
+@lru_cache(maxsize=128)
+def _timeout_delta(seconds: int) -> timedelta:
+    """Timeouts come from a handful of configured values; share their timedeltas."""
+    return timedelta(seconds=seconds)
+
+
+def _apply_lock(direct_lock_map: dict[str, LockDirective], event: OccupancyEvent) -> None:
+    direct_lock_map[event.source_id] = LockDirective(
+        source_id=event.source_id,
+        mode=event.lock_mode,
+        scope=event.lock_scope,
+    )
+
+
+def _apply_unlock(direct_lock_map: dict[str, LockDirective], event: OccupancyEvent) -> None:
+    direct_lock_map.pop(event.source_id, None)
+
+
+def _apply_unlock_all(direct_lock_map: dict[str, LockDirective], event: OccupancyEvent) -> None:
+    direct_lock_map.clear()
+
+
+_LOCK_HANDLERS = {
+    EventType.LOCK: _apply_lock,
+    EventType.UNLOCK: _apply_unlock,
+    EventType.UNLOCK_ALL: _apply_unlock_all,
+}
+
+
+def _copy_exported_state(entry: dict[str, Any]) -> dict[str, Any]:
+    """Copy an exported entry, including its lists and per-item dicts."""
+    return {
+        key: (
+            [dict(item) if isinstance(item, dict) else item for item in value]
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in entry.items()
+    }
+
+
+def _export_location_state(state: LocationRuntimeState) -> dict[str, Any]:
+    return {
+        "is_occupied": state.is_occupied,
+        "locked_by": list(state.locked_by),
+        "lock_modes": sorted(mode.value for mode in state.lock_modes),
+        "direct_locks": [
+            {
+                "source_id": lock.source_id,
+                "mode": lock.mode.value,
+                "scope": lock.scope.value,
+            }
+            for lock in sorted(
+                state.direct_locks,
+                key=lambda lock_item: (
+                    lock_item.source_id,
+                    lock_item.mode.value,
+                    lock_item.scope.value,
+                ),
+            )
+        ],
+        "contributions": [
+            {
+                "source_id": c.source_id,
+                "expires_at": c.expires_at.isoformat() if c.expires_at else None,
+                **({"exit_grace": True} if c.exit_grace else {}),
+            }
+            for c in sorted(state.contributions, key=lambda x: x.source_id)
+        ],
+        "suspended_contributions": [
+            {
+                "source_id": c.source_id,
+                "remaining": c.remaining.total_seconds() if c.remaining else None,
+            }
+            for c in sorted(state.suspended_contributions, key=lambda x: x.source_id)
+        ],
+    }
 
 
 class OccupancyEngine:
@@ -42,11 +148,26 @@ class OccupancyEngine:
     ) -> None:
         self.configs: dict[str, LocationConfig] = {c.id: c for c in configs}
 
+        # Lazy-deletion min-heap of timed contributions keyed by integer nanoseconds.
+        # Entries carry the generation they were scheduled under. A location gets a new
+        # generation whenever its set of timed expiries changes, which retires all of its
+        # older entries at once; they are discarded when they reach the top.
+        self._expiry_heap: list[ExpiryEntry] = []
+        self._expiry_generation: dict[str, int] = {}
+        self._scheduled_expiries: dict[str, frozenset[datetime]] = {}
+        self._generations = count(1)
+        # Last export_state() entries, keyed by location with the state they were built from.
+        self._exported: dict[str, tuple[LocationRuntimeState, dict[str, Any]]] = {}
+
         if initial_state:
             self.state = initial_state.copy()
             for c in configs:
                 if c.id not in self.state:
                     self.state[c.id] = LocationRuntimeState()
+            # Restored state for locations that are no longer configured is kept but
+            # never evaluated, so only configured locations get expiry entries.
+            for location_id in self.configs:
+                self._schedule_expiries(location_id, self.state[location_id])
         else:
             self.state = {c.id: LocationRuntimeState() for c in configs}
 
@@ -55,34 +176,183 @@ class OccupancyEngine:
             if c.parent_id:
                 self.children_map.setdefault(c.parent_id, []).append(c.id)
 
+        # Resolve the topology walks done on every evaluation up front: the location
+        # itself followed by its ancestors, and the FOLLOW_PARENT children that mirror
+        # each location. Synthetic source ids are likewise derived from topology alone,
+        # so they are built once instead of formatted on every evaluation. Only
+        # add_location()/remove_location() change topology after construction.
+        self._lineage: dict[str, tuple[str, ...]] = {}
+        self._child_sources: dict[str, str] = {}
+        self._follow_sources: dict[str, str] = {}
+        self._lock_hold_sources: dict[str, str] = {}
+        for c in configs:
+            self._index_location(c)
+        self._follow_children: dict[str, tuple[str, ...]] = {}
+        for parent_id, child_ids in self.children_map.items():
+            followers = tuple(
+                child_id
+                for child_id in child_ids
+                if self.configs[child_id].occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT
+            )
+            if followers:
+                self._follow_children[parent_id] = followers
+        self._descendants: dict[str, tuple[str, ...]] = {}
+
+        self._occupancy_handlers = {
+            EventType.VACATE: self._apply_vacate,
+            EventType.TRIGGER: self._apply_trigger,
+            EventType.CLEAR: self._apply_clear,
+        }
+
+    def _index_location(self, config: LocationConfig) -> None:
+        """Precompute lineage and synthetic source ids for one configured location."""
+        chain = [config.id]
+        parent_id = config.parent_id
+        while parent_id is not None and parent_id in self.configs:
+            chain.append(parent_id)
+            parent_id = self.configs[parent_id].parent_id
+        self._lineage[config.id] = tuple(chain)
+        self._child_sources[config.id] = sys.intern(self._child_source_id(config.id))
+        self._follow_sources[config.id] = sys.intern(self._follow_source_id(config.parent_id))
+        self._lock_hold_sources[config.id] = sys.intern(f"{_LOCK_HOLD_SOURCE_PREFIX}{config.id}")
+
+    def add_location(self, config: LocationConfig) -> None:
+        """Add a new leaf location with empty runtime state.
+
+        Equivalent to rebuilding the engine with the extra config and restoring the
+        current state, without touching any other location.
+
+        Raises:
+            ValueError: If the location is already configured or has children
+        """
+        if config.id in self.configs:
+            raise ValueError(f"Location '{config.id}' already exists")
+        if self.children_map.get(config.id):
+            raise ValueError(f"Location '{config.id}' has children")
+
+        self.configs[config.id] = config
+        self.state[config.id] = LocationRuntimeState()
+        if config.parent_id:
+            self.children_map.setdefault(config.parent_id, []).append(config.id)
+            if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
+                self._follow_children[config.parent_id] = (
+                    *self._follow_children.get(config.parent_id, ()),
+                    config.id,
+                )
+        self._index_location(config)
+        self._descendants.clear()
+
+    def update_location(self, config: LocationConfig) -> None:
+        """Replace a location's config when its place in the topology is unchanged.
+
+        Runtime state is kept as-is, matching a rebuild that restores current state.
+
+        Raises:
+            ValueError: If the location is unknown or its parent or strategy changed
+        """
+        previous = self.configs.get(config.id)
+        if previous is None:
+            raise ValueError(f"Location '{config.id}' not found")
+        if (
+            previous.parent_id != config.parent_id
+            or previous.occupancy_strategy != config.occupancy_strategy
+        ):
+            raise ValueError(f"Location '{config.id}' changed position in the topology")
+        self.configs[config.id] = config
+
+    def remove_location(self, location_id: str) -> None:
+        """Remove a leaf location and its runtime state.
+
+        Equivalent to rebuilding the engine without the location and restoring the
+        current state. Pending expiries for the location are dropped lazily.
+
+        Raises:
+            ValueError: If the location is unknown or still has children
+        """
+        config = self.configs.get(location_id)
+        if config is None:
+            raise ValueError(f"Location '{location_id}' not found")
+        if self.children_map.get(location_id):
+            raise ValueError(f"Location '{location_id}' has children")
+
+        del self.configs[location_id]
+        del self.state[location_id]
+        self.children_map.pop(location_id, None)
+        if config.parent_id:
+            siblings = self.children_map[config.parent_id]
+            siblings.remove(location_id)
+            if not siblings:
+                del self.children_map[config.parent_id]
+            followers = tuple(
+                child_id
+                for child_id in self._follow_children.get(config.parent_id, ())
+                if child_id != location_id
+            )
+            if followers:
+                self._follow_children[config.parent_id] = followers
+            else:
+                self._follow_children.pop(config.parent_id, None)
+        del self._lineage[location_id]
+        del self._child_sources[location_id]
+        del self._follow_sources[location_id]
+        del self._lock_hold_sources[location_id]
+        self._expiry_generation.pop(location_id, None)
+        self._scheduled_expiries.pop(location_id, None)
+        self._exported.pop(location_id, None)
+        self._descendants.clear()
+
     def handle_event(self, event: OccupancyEvent, now: datetime) -> EngineResult:
         """Process one event and return transitions + scheduling hint."""
+        transitions: list[StateTransition] = []
+        self._apply_event(event, now, transitions)
+        return EngineResult(
+            next_expiration=self._calculate_next_expiration(now),
+            transitions=transitions,
+        )
+
+    def handle_events(self, events: Iterable[OccupancyEvent], now: datetime) -> EngineResult:
+        """Process events in order at one timestamp and return all transitions.
+
+        Equivalent to calling handle_event() for each event with the same `now`, but the
+        scheduling hint is computed once for the whole batch.
+        """
+        transitions: list[StateTransition] = []
+        for event in events:
+            self._apply_event(event, now, transitions)
+        return EngineResult(
+            next_expiration=self._calculate_next_expiration(now),
+            transitions=transitions,
+        )
+
+    def _apply_event(
+        self,
+        event: OccupancyEvent,
+        now: datetime,
+        transitions: list[StateTransition],
+    ) -> None:
         if event.location_id not in self.configs:
             _LOGGER.warning("Event for unknown location: %s", event.location_id)
-            return EngineResult(next_expiration=self._calculate_next_expiration(now))
+            return
 
-        transitions: list[StateTransition] = []
         self._process_location_update(event.location_id, event, now, transitions)
 
         # Lock scope can affect descendants even without direct events there.
-        if event.event_type in (EventType.LOCK, EventType.UNLOCK, EventType.UNLOCK_ALL):
+        if event.event_type in _LOCK_EVENT_TYPES:
             for child_id in self._get_descendants(event.location_id):
                 self._process_location_update(child_id, None, now, transitions)
 
-        return EngineResult(
-            next_expiration=self._calculate_next_expiration(now),
-            transitions=transitions,
-        )
-
     def check_timeouts(self, now: datetime) -> EngineResult:
         """Expire timed contributions and propagate resulting state transitions."""
         transitions: list[StateTransition] = []
 
-        for location_id in self.configs:
+        # Only locations holding a due contribution can change on a timeout sweep;
+        # ancestors and FOLLOW_PARENT dependents are reached through propagation.
+        now_ns = _to_ns(now)
+        for location_id in self._pop_due_locations(now_ns):
             self._process_location_update(location_id, None, now, transitions)
 
         return EngineResult(
-            next_expiration=self._calculate_next_expiration(now),
+            next_expiration=self._next_expiration_after(now_ns),
             transitions=transitions,
         )
 
@@ -120,17 +390,15 @@ class OccupancyEngine:
             )
 
         # FOLLOW_PARENT dependents mirror parent state changes.
-        for child_id in self.children_map.get(location_id, []):
-            child_config = self.configs[child_id]
-            if child_config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
-                self._process_location_update(
-                    child_id,
-                    event=None,
-                    now=now,
-                    transitions=transitions,
-                    propagated_from_child=None,
-                    propagated_parent=True,
-                )
+        for child_id in self._follow_children.get(location_id, ()):
+            self._process_location_update(
+                child_id,
+                event=None,
+                now=now,
+                transitions=transitions,
+                propagated_from_child=None,
+                propagated_parent=True,
+            )
 
     def _evaluate_state(
         self,
@@ -145,16 +413,11 @@ class OccupancyEngine:
         current_state = self.state[location_id]
 
         direct_lock_map = self._direct_lock_map(current_state.direct_locks)
-        if event and event.event_type == EventType.LOCK:
-            direct_lock_map[event.source_id] = LockDirective(
-                source_id=event.source_id,
-                mode=event.lock_mode,
-                scope=event.lock_scope,
-            )
-        elif event and event.event_type == EventType.UNLOCK:
-            direct_lock_map.pop(event.source_id, None)
-        elif event and event.event_type == EventType.UNLOCK_ALL:
-            direct_lock_map.clear()
+        lock_handler = None
+        if event is not None:
+            lock_handler = _LOCK_HANDLERS.get(event.event_type)
+            if lock_handler is not None:
+                lock_handler(direct_lock_map, event)
 
         effective_locks = self._effective_locks(location_id, direct_lock_map)
         next_locked_by = {directive.source_id for directive in effective_locks}
@@ -184,59 +447,24 @@ class OccupancyEngine:
         # Remove synthetic lock holds when their mode no longer applies.
         if LockMode.BLOCK_VACANT not in next_lock_modes:
             for source_id in [
-                sid for sid in contrib_map if sid.startswith(f"{_LOCK_HOLD_PREFIX}:")
+                sid for sid in contrib_map if sid.startswith(_LOCK_HOLD_SOURCE_PREFIX)
             ]:
                 contrib_map.pop(source_id, None)
 
-        # Freeze mode ignores occupancy-changing events until unlocked.
-        if (
-            next_freeze
-            and event is not None
-            and event.event_type not in (EventType.LOCK, EventType.UNLOCK, EventType.UNLOCK_ALL)
-        ):
-            return False
-
-        if event and event.event_type == EventType.VACATE:
-            contrib_map.clear()
-            exit_grace_sources.clear()
-            suspended_map.clear()
-
-        elif event and event.event_type == EventType.TRIGGER:
-            if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
-                # FOLLOW_PARENT is strict: direct occupancy events are ignored.
-                pass
-            else:
-                # New occupancy evidence cancels any scheduled vacancy (exit-grace holds).
-                for sid in list(exit_grace_sources):
-                    contrib_map.pop(sid, None)
-                exit_grace_sources.clear()
-
-                timeout_value = self._get_trigger_timeout(event, config)
-                expires_at = (
-                    None if timeout_value is None else now + timedelta(seconds=timeout_value)
-                )
-                contrib_map[event.source_id] = expires_at
-                exit_grace_sources.discard(event.source_id)
-
-        elif event and event.event_type == EventType.CLEAR:
-            if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
-                # FOLLOW_PARENT is strict: direct occupancy events are ignored.
-                pass
-            elif event.source_id in contrib_map:
-                trailing_timeout = self._get_clear_timeout(event, config)
-                if trailing_timeout > 0:
-                    contrib_map[event.source_id] = now + timedelta(seconds=trailing_timeout)
-                    exit_grace_sources.add(event.source_id)
-                else:
-                    del contrib_map[event.source_id]
-                    exit_grace_sources.discard(event.source_id)
+        if event is not None and lock_handler is None:
+            # Freeze mode ignores occupancy-changing events until unlocked.
+            if next_freeze:
+                return False
+            self._occupancy_handlers[event.event_type](
+                event, config, now, contrib_map, exit_grace_sources, suspended_map
+            )
 
         # Maintain parent synthetic contribution for a child that changed.
         if propagated_from_child and config.occupancy_strategy != OccupancyStrategy.FOLLOW_PARENT:
             child_cfg = self.configs.get(propagated_from_child)
             child_state = self.state.get(propagated_from_child)
             if child_cfg and child_state:
-                child_source = self._child_source_id(propagated_from_child)
+                child_source = self._child_sources[propagated_from_child]
                 if child_cfg.contributes_to_parent and child_state.is_occupied:
                     contrib_map[child_source] = self.get_effective_timeout(
                         propagated_from_child, now
@@ -248,7 +476,7 @@ class OccupancyEngine:
 
         # Enforce strict FOLLOW_PARENT behavior.
         if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
-            follow_source = self._follow_source_id(config.parent_id)
+            follow_source = self._follow_sources[location_id]
             contrib_map = {
                 source_id: expires_at
                 for source_id, expires_at in contrib_map.items()
@@ -270,7 +498,7 @@ class OccupancyEngine:
             next_is_occupied = False
         else:
             if LockMode.BLOCK_VACANT in next_lock_modes and not contrib_map:
-                contrib_map[f"{_LOCK_HOLD_PREFIX}:{location_id}"] = None
+                contrib_map[self._lock_hold_sources[location_id]] = None
             if LockMode.BLOCK_VACANT in next_lock_modes:
                 next_is_occupied = True
             elif next_freeze:
@@ -300,7 +528,7 @@ class OccupancyEngine:
         if next_state == current_state:
             return False
 
-        self.state[location_id] = next_state
+        self._set_state(location_id, next_state)
         transitions.append(
             StateTransition(
                 location_id=location_id,
@@ -314,20 +542,129 @@ class OccupancyEngine:
         )
         return True
 
+    def _apply_vacate(
+        self,
+        event: OccupancyEvent,
+        config: LocationConfig,
+        now: datetime,
+        contrib_map: ContribMap,
+        exit_grace_sources: set[str],
+        suspended_map: SuspendedMap,
+    ) -> None:
+        contrib_map.clear()
+        exit_grace_sources.clear()
+        suspended_map.clear()
+
+    def _apply_trigger(
+        self,
+        event: OccupancyEvent,
+        config: LocationConfig,
+        now: datetime,
+        contrib_map: ContribMap,
+        exit_grace_sources: set[str],
+        suspended_map: SuspendedMap,
+    ) -> None:
+        if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
+            # FOLLOW_PARENT is strict: direct occupancy events are ignored.
+            return
+
+        # New occupancy evidence cancels any scheduled vacancy (exit-grace holds).
+        for sid in exit_grace_sources:
+            contrib_map.pop(sid, None)
+        exit_grace_sources.clear()
+
+        timeout_value = self._get_trigger_timeout(event, config)
+        contrib_map[event.source_id] = (
+            None if timeout_value is None else now + _timeout_delta(timeout_value)
+        )
+
+    def _apply_clear(
+        self,
+        event: OccupancyEvent,
+        config: LocationConfig,
+        now: datetime,
+        contrib_map: ContribMap,
+        exit_grace_sources: set[str],
+        suspended_map: SuspendedMap,
+    ) -> None:
+        if config.occupancy_strategy == OccupancyStrategy.FOLLOW_PARENT:
+            # FOLLOW_PARENT is strict: direct occupancy events are ignored.
+            return
+        if event.source_id not in contrib_map:
+            return
+
+        trailing_timeout = self._get_clear_timeout(event, config)
+        if trailing_timeout > 0:
+            contrib_map[event.source_id] = now + _timeout_delta(trailing_timeout)
+            exit_grace_sources.add(event.source_id)
+        else:
+            del contrib_map[event.source_id]
+            exit_grace_sources.discard(event.source_id)
+
     def _calculate_next_expiration(self, now: datetime) -> datetime | None:
         """Find the earliest future timeout across all unlocked locations."""
+        return self._next_expiration_after(_to_ns(now))
+
+    def _next_expiration_after(self, now_ns: int) -> datetime | None:
+        heap = self._expiry_heap
+        due: list[ExpiryEntry] = []
         next_exp: datetime | None = None
 
-        for state in self.state.values():
-            if LockMode.FREEZE in state.lock_modes:
+        while heap:
+            entry = heap[0]
+            if not self._is_live_expiry(entry):
+                heapq.heappop(heap)
                 continue
+            if entry[0] > now_ns:
+                next_exp = entry[3]
+                break
+            # Expired but not yet processed by check_timeouts; keep it scheduled.
+            due.append(heapq.heappop(heap))
+
+        for entry in due:
+            heapq.heappush(heap, entry)
+        return next_exp
 
-            for contribution in state.contributions:
-                if contribution.expires_at and contribution.expires_at > now:
-                    if next_exp is None or contribution.expires_at < next_exp:
-                        next_exp = contribution.expires_at
+    def _pop_due_locations(self, now_ns: int) -> list[str]:
+        """Pop heap entries due at `now_ns` and return their live locations."""
+        heap = self._expiry_heap
+        due: dict[str, None] = {}
+        while heap and heap[0][0] <= now_ns:
+            entry = heapq.heappop(heap)
+            if self._is_live_expiry(entry):
+                due[entry[1]] = None
+                # The location is about to be re-evaluated; make its next state
+                # reschedule whatever timed contributions it still holds.
+                self._scheduled_expiries.pop(entry[1], None)
+        return list(due)
+
+    def _set_state(self, location_id: str, state: LocationRuntimeState) -> None:
+        """Store runtime state and schedule its timed contributions."""
+        self.state[location_id] = state
+        self._schedule_expiries(location_id, state)
+
+    def _schedule_expiries(self, location_id: str, state: LocationRuntimeState) -> None:
+        # Frozen locations do not age; their contributions are rescheduled on resume.
+        expiries: frozenset[datetime] = frozenset()
+        if LockMode.FREEZE not in state.lock_modes:
+            expiries = frozenset(
+                c.expires_at for c in state.contributions if c.expires_at is not None
+            )
+        if self._scheduled_expiries.get(location_id) == expiries:
+            return
 
-        return next_exp
+        self._scheduled_expiries[location_id] = expiries
+        generation = next(self._generations)
+        self._expiry_generation[location_id] = generation
+        for expires_at in expiries:
+            heapq.heappush(
+                self._expiry_heap,
+                (_to_ns(expires_at), location_id, generation, expires_at),
+            )
+
+    def _is_live_expiry(self, entry: ExpiryEntry) -> bool:
+        """Check whether a heap entry belongs to its location's current schedule."""
+        return self._expiry_generation.get(entry[1]) == entry[2]
 
     def _get_trigger_timeout(
         self,
@@ -353,6 +690,7 @@ class OccupancyEngine:
     def export_state(self) -> dict[str, dict[str, Any]]:
         """Create a JSON-serializable state dump."""
         dump: dict[str, dict[str, Any]] = {}
+        exported: dict[str, tuple[LocationRuntimeState, dict[str, Any]]] = {}
 
         for loc_id, state in self.state.items():
             if (
@@ -363,44 +701,15 @@ class OccupancyEngine:
             ):
                 continue
 
-            dump[loc_id] = {
-                "is_occupied": state.is_occupied,
-                "locked_by": list(state.locked_by),
-                "lock_modes": [
-                    mode.value for mode in sorted(state.lock_modes, key=lambda m: m.value)
-                ],
-                "direct_locks": [
-                    {
-                        "source_id": lock.source_id,
-                        "mode": lock.mode.value,
-                        "scope": lock.scope.value,
-                    }
-                    for lock in sorted(
-                        state.direct_locks,
-                        key=lambda lock_item: (
-                            lock_item.source_id,
-                            lock_item.mode.value,
-                            lock_item.scope.value,
-                        ),
-                    )
-                ],
-                "contributions": [
-                    {
-                        "source_id": c.source_id,
-                        "expires_at": c.expires_at.isoformat() if c.expires_at else None,
-                        **({"exit_grace": True} if c.exit_grace else {}),
-                    }
-                    for c in sorted(state.contributions, key=lambda x: x.source_id)
-                ],
-                "suspended_contributions": [
-                    {
-                        "source_id": c.source_id,
-                        "remaining": c.remaining.total_seconds() if c.remaining else None,
-                    }
-                    for c in sorted(state.suspended_contributions, key=lambda x: x.source_id)
-                ],
-            }
+            # Runtime states are frozen and replaced on change, so identity is enough.
+            # The cached entry stays internal; callers get their own copy.
+            cached = self._exported.get(loc_id)
+            if cached is None or cached[0] is not state:
+                cached = (state, _export_location_state(state))
+            exported[loc_id] = cached
+            dump[loc_id] = _copy_exported_state(cached[1])
 
+        self._exported = exported
         return dump
 
     def restore_state(
@@ -490,13 +799,16 @@ class OccupancyEngine:
             if data.get("is_occupied") and not contributions and direct_locks:
                 is_occupied = True
 
-            self.state[loc_id] = LocationRuntimeState(
-                is_occupied=is_occupied,
-                contributions=frozenset(contributions),
-                suspended_contributions=frozenset(suspended),
-                locked_by=frozenset(lock.source_id for lock in direct_locks),
-                lock_modes=frozenset(lock.mode for lock in direct_locks),
-                direct_locks=frozenset(direct_locks),
+            self._set_state(
+                loc_id,
+                LocationRuntimeState(
+                    is_occupied=is_occupied,
+                    contributions=frozenset(contributions),
+                    suspended_contributions=frozenset(suspended),
+                    locked_by=frozenset(lock.source_id for lock in direct_locks),
+                    lock_modes=frozenset(lock.mode for lock in direct_locks),
+                    direct_locks=frozenset(direct_locks),
+                ),
             )
 
         # Reconcile effective lock inheritance and resulting occupancy constraints.
@@ -548,12 +860,12 @@ class OccupancyEngine:
     ) -> EngineResult:
         """Vacate location and all descendants."""
         transitions: list[StateTransition] = []
+        if location_id not in self.configs:
+            return EngineResult(next_expiration=self._calculate_next_expiration(now))
 
-        locations_to_vacate = [location_id, *self._get_descendants(location_id)]
-        for loc_id in locations_to_vacate:
-            if loc_id not in self.configs:
-                continue
-
+        # Descendants come from the memoized subtree index, which add_location() and
+        # remove_location() reset, so repeated area vacates do not re-walk the tree.
+        for loc_id in (location_id, *self._get_descendants(location_id)):
             state = self.state[loc_id]
             if state.is_locked and not include_locked:
                 continue
@@ -591,11 +903,17 @@ class OccupancyEngine:
             transitions=transitions,
         )
 
-    def _get_descendants(self, location_id: str) -> list[str]:
-        descendants: list[str] = []
-        for child_id in self.children_map.get(location_id, []):
-            descendants.append(child_id)
-            descendants.extend(self._get_descendants(child_id))
+    def _get_descendants(self, location_id: str) -> tuple[str, ...]:
+        """Return descendants in depth-first pre-order, memoized per location."""
+        descendants = self._descendants.get(location_id)
+        if descendants is None:
+            ordered: list[str] = []
+            stack = list(reversed(self.children_map.get(location_id, [])))
+            while stack:
+                child_id = stack.pop()
+                ordered.append(child_id)
+                stack.extend(reversed(self.children_map.get(child_id, [])))
+            descendants = self._descendants[location_id] = tuple(ordered)
         return descendants
 
     def _effective_locks(
@@ -604,19 +922,15 @@ class OccupancyEngine:
         location_override: dict[str, LockDirective] | None = None,
     ) -> list[LockDirective]:
         """Resolve direct + inherited subtree lock directives affecting a location."""
-        effective: list[LockDirective] = []
-        current_id: str | None = location_id
-        while current_id is not None:
-            state = self.state[current_id]
-            directives = (
-                location_override.values()
-                if current_id == location_id and location_override is not None
-                else state.direct_locks
-            )
-            for directive in directives:
-                if current_id == location_id or directive.scope == LockScope.SUBTREE:
+        effective: list[LockDirective] = list(
+            location_override.values()
+            if location_override is not None
+            else self.state[location_id].direct_locks
+        )
+        for ancestor_id in self._lineage[location_id][1:]:
+            for directive in self.state[ancestor_id].direct_locks:
+                if directive.scope == LockScope.SUBTREE:
                     effective.append(directive)
-            current_id = self.configs[current_id].parent_id
         return effective
 
     @staticmethod
@@ -684,7 +998,7 @@ class OccupancyEngine:
         propagated_parent: bool,
     ) -> str:
         if event:
-            return f"{REASON_EVENT_PREFIX}{event.event_type.value}"
+            return _EVENT_REASONS[event.event_type]
         if propagated_from_child:
             return f"{REASON_PROPAGATION_CHILD_PREFIX}{propagated_from_child}"
         if propagated_parent:
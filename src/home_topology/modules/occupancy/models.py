@@ -112,9 +112,14 @@ class LocationRuntimeState:
         return len(self.lock_modes) > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OccupancyEvent:
-    """An occupancy event for internal engine processing."""
+    """An occupancy event for internal engine processing.
+
+    Events outlive the engine call that consumes them: each StateTransition keeps the
+    event that caused it, and the module reads those transitions back when explaining
+    state. Instances are therefore immutable and must not be pooled or reused.
+    """
 
     location_id: str
     event_type: EventType
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional
 
 from home_topology.core.bus import Event, EventBus, EventFilter
 from home_topology.core.manager import LocationManager
@@ -18,6 +22,7 @@ from .models import (
     LockScope,
     OccupancyEvent,
     OccupancyStrategy,
+    StateTransition,
 )
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,105 @@ _UNSET = object()
 _GROUP_AUTHORITY_PREFIX = "__occupancy_group__:"
 _GROUP_MEMBER_SOURCE_PREFIX = "__group_member__:"
 
+_CONFIG_VERSION = 1
+_DEFAULT_TIMEOUT = 300
+_DEFAULT_TRAILING_TIMEOUT = 120
+_DEFAULT_CONFIG = MappingProxyType(
+    {
+        "version": _CONFIG_VERSION,
+        "enabled": True,
+        "default_timeout": _DEFAULT_TIMEOUT,
+        "default_trailing_timeout": _DEFAULT_TRAILING_TIMEOUT,
+        "occupancy_group_id": None,
+        "occupancy_strategy": "independent",
+        "contributes_to_parent": True,
+    }
+)
+
+
+# Engine-generated source id prefixes ("<prefix>:<location_id>") -> explanation kind.
+_SYNTHETIC_SOURCE_KINDS = {
+    "__child__": "child",
+    "__follow_parent__": "parent",
+    "__lock_hold__": "lock_hold",
+}
+
+# Subscription filters are never mutated by the bus, so one set serves every attach.
+_SIGNAL_FILTER = EventFilter(event_type="occupancy.signal")
+_TOPOLOGY_FILTER = EventFilter(
+    event_types=(
+        "location.created",
+        "location.deleted",
+        "location.parent_changed",
+        "location.reordered",
+    )
+)
+
+_by_source_id = attrgetter("source_id")
+
+_EVENT_TYPE_ALIASES = {
+    "vacant": EventType.VACATE,
+    "unoccupied": EventType.VACATE,
+}
+
+
+@lru_cache(maxsize=256)
+def _event_type_from_str(value: str) -> Optional[EventType]:
+    """Resolve an inbound event type string; signals repeat a handful of spellings."""
+    lowered = value.strip().lower()
+    if not lowered:
+        return None
+
+    try:
+        return EventType(lowered)
+    except ValueError:
+        pass
+
+    alias = _EVENT_TYPE_ALIASES.get(lowered)
+    if alias is not None:
+        return alias
+
+    # Enum member names are the upper-cased values, so by-name lookup is covered.
+    return None
+
+
+def _lock_sort_key(lock: Any) -> tuple[str, str, str]:
+    return (lock.source_id, lock.mode.value, lock.scope.value)
+
+
+def _copy_state_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy serialized state fields, including their lists and per-item dicts."""
+    return {
+        key: (
+            [dict(item) if isinstance(item, dict) else item for item in value]
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in fields.items()
+    }
+
+
+@lru_cache(maxsize=64)
+def _lock_mode_values(modes: frozenset[LockMode]) -> tuple[str, ...]:
+    """Sorted mode values for a lock-mode set; only a few distinct sets ever occur."""
+    return tuple(sorted(mode.value for mode in modes))
+
+
+@lru_cache(maxsize=64)
+def _lock_mode_from_str(value: str) -> LockMode:
+    try:
+        return LockMode(value.strip().lower())
+    except ValueError:
+        return LockMode.FREEZE
+
+
+@lru_cache(maxsize=64)
+def _lock_scope_from_str(value: str) -> LockScope:
+    try:
+        return LockScope(value.strip().lower())
+    except ValueError:
+        return LockScope.SELF
+
 
 class OccupancyModule(LocationModule):
     """Occupancy tracking module (v3.0)."""
@@ -37,7 +141,15 @@ class OccupancyModule(LocationModule):
         self._group_authority_by_member: dict[str, str] = {}
         self._group_members_by_authority: dict[str, list[str]] = {}
         self._group_id_by_authority: dict[str, str] = {}
-        self._last_transition_by_location: dict[str, dict[str, Any]] = {}
+        # Latest published transition per location and when it was published. It is
+        # only serialized when an explanation is requested.
+        self._last_transition_by_location: dict[str, tuple[StateTransition, datetime]] = {}
+        # LocationConfig objects from the previous build, keyed by their field values.
+        self._config_cache: dict[tuple[Any, ...], LocationConfig] = {}
+        # (LocationManager.version, configs) from the last build.
+        self._configs_cache: tuple[int, List[LocationConfig]] | None = None
+        # location_id -> (runtime state, occupancy group id, serialized state fields).
+        self._public_state_cache: dict[str, tuple[Any, str | None, Dict[str, Any]]] = {}
 
     @property
     def id(self) -> str:
@@ -45,24 +157,35 @@ class OccupancyModule(LocationModule):
 
     @property
     def CURRENT_CONFIG_VERSION(self) -> int:
-        return 1
+        return _CONFIG_VERSION
 
     def attach(self, bus: EventBus, loc_manager: LocationManager) -> None:
         """Attach to the kernel and initialize the engine."""
         self._bus = bus
         self._loc_manager = loc_manager
 
-        configs = self._build_location_configs()
+        self._configs_cache = None
+        configs = self._location_configs()
         self._engine = OccupancyEngine(configs)
 
-        bus.subscribe(self._on_occupancy_signal, EventFilter(event_type="occupancy.signal"))
-        for event_type in (
-            "location.created",
-            "location.deleted",
-            "location.parent_changed",
-            "location.reordered",
-        ):
-            bus.subscribe(self._on_topology_mutation, EventFilter(event_type=event_type))
+        bus.subscribe(self._on_occupancy_signal, _SIGNAL_FILTER)
+        bus.subscribe(self._on_topology_mutation, _TOPOLOGY_FILTER)
+
+    def _require_engine(self) -> OccupancyEngine:
+        """Return the engine or raise if the module is not attached."""
+        if self._engine is None:
+            raise RuntimeError("OccupancyModule is not attached")
+        return self._engine
+
+    def _location_configs(self) -> List[LocationConfig]:
+        """Return LocationConfigs, rebuilding only when the topology version moved."""
+        assert self._loc_manager is not None
+        version = self._loc_manager.version
+        if self._configs_cache is not None and self._configs_cache[0] == version:
+            return self._configs_cache[1]
+        configs = self._build_location_configs()
+        self._configs_cache = (version, configs)
+        return configs
 
     def _build_location_configs(self) -> List[LocationConfig]:
         """Build LocationConfig list from LocationManager."""
@@ -82,8 +205,8 @@ class OccupancyModule(LocationModule):
             if config_dict and not config_dict.get("enabled", True):
                 continue
 
-            default_timeout = 300
-            default_trailing_timeout = 120
+            default_timeout = _DEFAULT_TIMEOUT
+            default_trailing_timeout = _DEFAULT_TRAILING_TIMEOUT
             if config_dict:
                 default_timeout = config_dict.get("default_timeout", default_timeout)
                 default_trailing_timeout = config_dict.get(
@@ -118,8 +241,8 @@ class OccupancyModule(LocationModule):
             )
             raw_entries.append(
                 {
-                    "id": location.id,
-                    "parent_id": location.parent_id,
+                    "id": sys.intern(location.id),
+                    "parent_id": sys.intern(location.parent_id) if location.parent_id else None,
                     "occupancy_group_id": occupancy_group_id,
                     "occupancy_strategy": strategy,
                     "contributes_to_parent": contributes,
@@ -147,31 +270,42 @@ class OccupancyModule(LocationModule):
                 ),
             )
 
+        previous_cache = self._config_cache
+        self._config_cache = {}
+
+        def cached_config(*fields: Any) -> LocationConfig:
+            # `fields` follow LocationConfig's declaration order.
+            config = previous_cache.get(fields)
+            if config is None:
+                config = LocationConfig(*fields)
+            self._config_cache[fields] = config
+            return config
+
         for entry in raw_entries:
             member_authority_id = self._group_authority_by_member.get(entry["id"])
             if member_authority_id is not None:
                 configs.append(
-                    LocationConfig(
-                        id=entry["id"],
-                        parent_id=member_authority_id,
-                        occupancy_group_id=self._group_id_by_authority.get(member_authority_id),
-                        occupancy_strategy=OccupancyStrategy.FOLLOW_PARENT,
-                        contributes_to_parent=False,
-                        default_timeout=int(entry["default_timeout"]),
-                        default_trailing_timeout=int(entry["default_trailing_timeout"]),
+                    cached_config(
+                        entry["id"],
+                        member_authority_id,
+                        self._group_id_by_authority.get(member_authority_id),
+                        OccupancyStrategy.FOLLOW_PARENT,
+                        False,
+                        int(entry["default_timeout"]),
+                        int(entry["default_trailing_timeout"]),
                     )
                 )
                 continue
 
             configs.append(
-                LocationConfig(
-                    id=entry["id"],
-                    parent_id=entry["parent_id"],
-                    occupancy_group_id=None,
-                    occupancy_strategy=entry["occupancy_strategy"],
-                    contributes_to_parent=entry["contributes_to_parent"],
-                    default_timeout=int(entry["default_timeout"]),
-                    default_trailing_timeout=int(entry["default_trailing_timeout"]),
+                cached_config(
+                    entry["id"],
+                    entry["parent_id"],
+                    None,
+                    entry["occupancy_strategy"],
+                    entry["contributes_to_parent"],
+                    int(entry["default_timeout"]),
+                    int(entry["default_trailing_timeout"]),
                 )
             )
 
@@ -179,17 +313,17 @@ class OccupancyModule(LocationModule):
             parent_ids = grouped_parent_ids.get(authority_id, set())
             authority_parent_id = next(iter(parent_ids)) if len(parent_ids) == 1 else None
             default_timeout, default_trailing_timeout = grouped_defaults.get(
-                authority_id, (300, 120)
+                authority_id, (_DEFAULT_TIMEOUT, _DEFAULT_TRAILING_TIMEOUT)
             )
             configs.append(
-                LocationConfig(
-                    id=authority_id,
-                    parent_id=authority_parent_id,
-                    occupancy_group_id=self._group_id_by_authority.get(authority_id),
-                    occupancy_strategy=OccupancyStrategy.INDEPENDENT,
-                    contributes_to_parent=True,
-                    default_timeout=default_timeout,
-                    default_trailing_timeout=default_trailing_timeout,
+                cached_config(
+                    authority_id,
+                    authority_parent_id,
+                    self._group_id_by_authority.get(authority_id),
+                    OccupancyStrategy.INDEPENDENT,
+                    True,
+                    default_timeout,
+                    default_trailing_timeout,
                 )
             )
 
@@ -201,12 +335,32 @@ class OccupancyModule(LocationModule):
         if not occ_event:
             return
 
-        assert self._engine is not None
-        now = self._normalize_timestamp(event.timestamp)
-        result = self._engine.handle_event(occ_event, now)
+        engine = self._require_engine()
+        # Translation already normalized the signal timestamp.
+        result = engine.handle_event(occ_event, occ_event.timestamp)
+
+        self._emit_transitions(result.transitions)
+
+    def handle_signals(self, events: Iterable[Event]) -> None:
+        """Apply a burst of `occupancy.signal` events as one engine batch.
+
+        Hosts that coalesce signals arriving together (e.g. a door and a motion sensor
+        firing in the same instant) can hand them over at once. Signals are applied in
+        order at the latest timestamp in the batch, and the resulting
+        `occupancy.changed` events are published together.
+        """
+        occ_events: list[OccupancyEvent] = []
+        for event in events:
+            occ_event = self._translate_signal_event(event)
+            if occ_event is not None:
+                occ_events.append(occ_event)
+        if not occ_events:
+            return
 
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        engine = self._require_engine()
+        now = max(occ_event.timestamp for occ_event in occ_events)
+        result = engine.handle_events(occ_events, now)
+        self._emit_transitions(result.transitions)
 
     def _on_topology_mutation(self, event: Event) -> None:
         """Rebuild engine when topology structure changes."""
@@ -277,8 +431,8 @@ class OccupancyModule(LocationModule):
 
         resolved_location_id, resolved_source_id, timeout, timeout_set, lock_scope = (
             self._resolve_group_event(
-                location_id,
-                str(source_id),
+                sys.intern(location_id),
+                sys.intern(str(source_id)),
                 event_type=event_type,
                 timeout=timeout,
                 timeout_set=timeout_set,
@@ -303,28 +457,7 @@ class OccupancyModule(LocationModule):
             return value
         if not isinstance(value, str):
             return None
-
-        normalized = value.strip()
-        if not normalized:
-            return None
-
-        try:
-            return EventType(normalized.lower())
-        except ValueError:
-            pass
-
-        aliases = {
-            "vacant": EventType.VACATE,
-            "unoccupied": EventType.VACATE,
-        }
-        lowered = normalized.lower()
-        if lowered in aliases:
-            return aliases[lowered]
-
-        try:
-            return EventType[normalized.upper()]
-        except KeyError:
-            return None
+        return _event_type_from_str(value)
 
     def _parse_lock_mode(self, value: Any) -> LockMode:
         """Parse lock mode from value/name to LockMode."""
@@ -332,11 +465,7 @@ class OccupancyModule(LocationModule):
             return value
         if not isinstance(value, str):
             return LockMode.FREEZE
-        normalized = value.strip().lower()
-        try:
-            return LockMode(normalized)
-        except ValueError:
-            return LockMode.FREEZE
+        return _lock_mode_from_str(value)
 
     def _parse_lock_scope(self, value: Any) -> LockScope:
         """Parse lock scope from value/name to LockScope."""
@@ -344,17 +473,43 @@ class OccupancyModule(LocationModule):
             return value
         if not isinstance(value, str):
             return LockScope.SELF
-        normalized = value.strip().lower()
-        try:
-            return LockScope(normalized)
-        except ValueError:
-            return LockScope.SELF
+        return _lock_scope_from_str(value)
 
-    def _emit_occupancy_changed(self, transition: Any) -> None:
-        """Emit semantic occupancy.changed event."""
+    def _emit_transitions(self, transitions: List[StateTransition]) -> None:
+        """Emit occupancy.changed for transitions with an observable state change."""
         assert self._bus is not None
+        events: list[Event] = []
+        emitted_at: datetime | None = None
+        for transition in transitions:
+            if self._is_observable_transition(transition):
+                if emitted_at is None:
+                    emitted_at = datetime.now(UTC)
+                events.extend(self._build_changed_events(transition, emitted_at))
+        if events:
+            self._bus.publish_many(events)
+
+    @staticmethod
+    def _is_observable_transition(transition: StateTransition) -> bool:
+        """Return True when a transition flips occupancy or changes lock state.
+
+        Contribution-only updates (timer extensions, extra sources on an already
+        occupied location) are reflected in `get_location_state()` but are not
+        published, so subscribers only see occupancy flips and lock changes.
+        """
+        previous = transition.previous_state
+        if previous is None:
+            return True
+        current = transition.new_state
+        return (
+            previous.is_occupied != current.is_occupied
+            or previous.locked_by != current.locked_by
+            or previous.lock_modes != current.lock_modes
+            or previous.direct_locks != current.direct_locks
+        )
+
+    def _build_changed_events(self, transition: Any, event_timestamp: datetime) -> List[Event]:
+        """Build the public occupancy.changed events for one transition."""
         location_id = transition.location_id
-        event_timestamp = datetime.now(UTC)
         if self._is_group_authority_location(location_id):
             prev_occupied = (
                 transition.previous_state.is_occupied if transition.previous_state else False
@@ -383,42 +538,38 @@ class OccupancyModule(LocationModule):
                     added or "-",
                     removed or "-",
                 )
-            for member_id in self._group_members_by_authority.get(location_id, []):
-                latest_transition = self._serialize_transition_explanation(
-                    transition,
-                    public_location_id=member_id,
-                    changed_at=event_timestamp,
-                )
-                self._last_transition_by_location[member_id] = latest_transition
-                payload = self._serialize_public_state(
-                    member_id,
-                    state_override=transition.new_state,
-                    include_explanation=False,
-                )
-                payload["previous_occupied"] = (
-                    transition.previous_state.is_occupied if transition.previous_state else False
-                )
-                payload["reason"] = transition.reason
-                self._bus.publish(
+            member_ids = self._group_members_by_authority.get(location_id, [])
+            if not member_ids:
+                return []
+            # Members share one authority state, so serialize it once and hand each
+            # member its own copy.
+            group_payload = self._serialize_public_state(
+                member_ids[0],
+                state_override=transition.new_state,
+                include_explanation=False,
+            )
+            group_payload["previous_occupied"] = (
+                transition.previous_state.is_occupied if transition.previous_state else False
+            )
+            group_payload["reason"] = transition.reason
+            member_events: list[Event] = []
+            for member_id in member_ids:
+                self._last_transition_by_location[member_id] = (transition, event_timestamp)
+                member_events.append(
                     Event(
                         type="occupancy.changed",
                         source="occupancy",
                         location_id=member_id,
-                        payload=payload,
+                        payload=_copy_state_fields(group_payload),
                         timestamp=event_timestamp,
                     )
                 )
-            return
+            return member_events
 
         if location_id in self._group_authority_by_member:
-            return
+            return []
 
-        latest_transition = self._serialize_transition_explanation(
-            transition,
-            public_location_id=location_id,
-            changed_at=event_timestamp,
-        )
-        self._last_transition_by_location[location_id] = latest_transition
+        self._last_transition_by_location[location_id] = (transition, event_timestamp)
         payload = self._serialize_public_state(
             location_id,
             state_override=transition.new_state,
@@ -429,7 +580,7 @@ class OccupancyModule(LocationModule):
         )
         payload["reason"] = transition.reason
 
-        self._bus.publish(
+        return [
             Event(
                 type="occupancy.changed",
                 source="occupancy",
@@ -437,16 +588,13 @@ class OccupancyModule(LocationModule):
                 payload=payload,
                 timestamp=event_timestamp,
             )
-        )
+        ]
 
     def get_next_timeout(self, now: Optional[datetime] = None) -> Optional[datetime]:
         """Get when the next timeout check should occur."""
         if not self._engine:
             return None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        now = self._resolve_now(now)
         return self._engine._calculate_next_expiration(now)
 
     def check_timeouts(self, now: Optional[datetime] = None) -> None:
@@ -454,14 +602,10 @@ class OccupancyModule(LocationModule):
         if not self._engine:
             return
 
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        now = self._resolve_now(now)
 
         result = self._engine.check_timeouts(now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        self._emit_transitions(result.transitions)
 
     def get_location_state(self, location_id: str) -> Optional[Dict[str, Any]]:
         """Get current occupancy state for a location."""
@@ -491,15 +635,7 @@ class OccupancyModule(LocationModule):
 
     def default_config(self) -> Dict[str, Any]:
         """Default configuration for a location."""
-        return {
-            "version": self.CURRENT_CONFIG_VERSION,
-            "enabled": True,
-            "default_timeout": 300,
-            "default_trailing_timeout": 120,
-            "occupancy_group_id": None,
-            "occupancy_strategy": "independent",
-            "contributes_to_parent": True,
-        }
+        return dict(_DEFAULT_CONFIG)
 
     def location_config_schema(self) -> Dict[str, Any]:
         """JSON schema for UI configuration."""
@@ -516,14 +652,14 @@ class OccupancyModule(LocationModule):
                     "title": "Default timeout (seconds)",
                     "description": "Timer duration for trigger events",
                     "minimum": 30,
-                    "default": 300,
+                    "default": _DEFAULT_TIMEOUT,
                 },
                 "default_trailing_timeout": {
                     "type": "integer",
                     "title": "Default trailing timeout (seconds)",
                     "description": "Trailing duration for clear events",
                     "minimum": 0,
-                    "default": 120,
+                    "default": _DEFAULT_TRAILING_TIMEOUT,
                 },
                 "occupancy_strategy": {
                     "type": "string",
@@ -554,11 +690,8 @@ class OccupancyModule(LocationModule):
         now: Optional[datetime] = None,
     ) -> None:
         """Send a TRIGGER event (source contributes occupancy)."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         timeout_set = timeout is not _UNSET
         timeout_value: int | None
@@ -577,9 +710,8 @@ class OccupancyModule(LocationModule):
             timeout_set=timeout_set,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     def clear(
         self,
@@ -589,11 +721,8 @@ class OccupancyModule(LocationModule):
         now: Optional[datetime] = None,
     ) -> None:
         """Send a CLEAR event (source stops contributing)."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         timeout_set = trailing_timeout is not _UNSET
         timeout_value: int | None
@@ -612,19 +741,15 @@ class OccupancyModule(LocationModule):
             timeout_set=timeout_set,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     # --- Commands API ---
 
     def vacate(self, location_id: str, now: Optional[datetime] = None) -> None:
         """Force location vacant immediately."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         event = OccupancyEvent(
             location_id=location_id,
@@ -633,9 +758,8 @@ class OccupancyModule(LocationModule):
             timestamp=now,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     def lock(
         self,
@@ -646,11 +770,8 @@ class OccupancyModule(LocationModule):
         now: Optional[datetime] = None,
     ) -> None:
         """Apply/update a lock directive for a source."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         parsed_mode = self._parse_lock_mode(mode)
         parsed_scope = self._parse_lock_scope(scope)
@@ -664,17 +785,13 @@ class OccupancyModule(LocationModule):
             lock_scope=parsed_scope,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     def unlock(self, location_id: str, source_id: str, now: Optional[datetime] = None) -> None:
         """Remove lock from this source."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         event = OccupancyEvent(
             location_id=location_id,
@@ -683,17 +800,13 @@ class OccupancyModule(LocationModule):
             timestamp=now,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     def unlock_all(self, location_id: str, now: Optional[datetime] = None) -> None:
         """Force clear all locks."""
-        assert self._engine is not None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        engine = self._require_engine()
+        now = self._resolve_now(now)
 
         event = OccupancyEvent(
             location_id=location_id,
@@ -702,9 +815,8 @@ class OccupancyModule(LocationModule):
             timestamp=now,
         )
         event = self._rewrite_public_event(event)
-        result = self._engine.handle_event(event, now)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        result = engine.handle_event(event, now)
+        self._emit_transitions(result.transitions)
 
     def get_effective_timeout(
         self,
@@ -714,10 +826,7 @@ class OccupancyModule(LocationModule):
         """Get when location will truly become vacant (considers descendants)."""
         if not self._engine:
             return None
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        now = self._resolve_now(now)
         runtime_location_id = self._group_authority_by_member.get(location_id, location_id)
         return self._engine.get_effective_timeout(runtime_location_id, now)
 
@@ -732,15 +841,11 @@ class OccupancyModule(LocationModule):
         if not self._engine:
             return []
 
-        if now is None:
-            now = datetime.now(UTC)
-        else:
-            now = self._normalize_timestamp(now)
+        now = self._resolve_now(now)
 
         runtime_location_id = self._group_authority_by_member.get(location_id, location_id)
         result = self._engine.vacate_area(runtime_location_id, source_id, now, include_locked)
-        for transition in result.transitions:
-            self._emit_occupancy_changed(transition)
+        self._emit_transitions(result.transitions)
 
         public_transitions: list[Dict[str, Any]] = []
         seen_locations: set[str] = set()
@@ -776,17 +881,77 @@ class OccupancyModule(LocationModule):
 
     def on_location_config_changed(self, location_id: str, config: Dict) -> None:
         """Rebuild engine when location config changes."""
+        # The config dict may have been edited in place without a version bump.
+        self._configs_cache = None
         self._rebuild_engine_preserving_state(datetime.now(UTC))
 
     def _rebuild_engine_preserving_state(self, now: datetime) -> None:
-        """Rebuild occupancy engine from current topology and restore runtime state."""
+        """Sync the engine with current topology, rebuilding it only when a delta cannot apply."""
         if not self._engine:
             return
+        configs = self._location_configs()
+        configs_by_id = {config.id: config for config in configs}
+        if configs_by_id == self._engine.configs:
+            # Topology changed in ways occupancy does not model (e.g. sibling order).
+            return
+        # Prune payloads of removed locations along with the old topology.
+        self._public_state_cache.clear()
+        if self._apply_config_delta(self._engine, configs_by_id):
+            return
         now = self._normalize_timestamp(now)
         snapshot = self._engine.export_state()
-        self._engine = OccupancyEngine(self._build_location_configs())
+        self._engine = OccupancyEngine(configs)
         self._engine.restore_state(snapshot, now)
 
+    @staticmethod
+    def _apply_config_delta(
+        engine: OccupancyEngine,
+        configs_by_id: Dict[str, LocationConfig],
+    ) -> bool:
+        """Apply a single-location config delta in place.
+
+        Handles adding or removing one leaf location and updating one location whose
+        parent and strategy are unchanged. Returns False when a full rebuild is needed.
+        """
+        current = engine.configs
+        added = configs_by_id.keys() - current.keys()
+        removed = current.keys() - configs_by_id.keys()
+        changed = [
+            location_id
+            for location_id in current.keys() - removed
+            if configs_by_id[location_id] != current[location_id]
+        ]
+        if len(added) + len(removed) + len(changed) != 1:
+            return False
+
+        if changed:
+            (location_id,) = changed
+            config = configs_by_id[location_id]
+            previous = current[location_id]
+            if (
+                config.parent_id != previous.parent_id
+                or config.occupancy_strategy != previous.occupancy_strategy
+            ):
+                return False
+            engine.update_location(config)
+            return True
+
+        location_id = next(iter(added or removed))
+        if engine.children_map.get(location_id):
+            return False
+        if added:
+            engine.add_location(configs_by_id[location_id])
+        else:
+            engine.remove_location(location_id)
+        return True
+
+    @classmethod
+    def _resolve_now(cls, now: Optional[datetime]) -> datetime:
+        """Return the caller's timestamp normalized to UTC, or the current time."""
+        if now is None:
+            return datetime.now(UTC)
+        return cls._normalize_timestamp(now)
+
     @staticmethod
     def _normalize_timestamp(ts: datetime) -> datetime:
         """Normalize inbound timestamps to UTC-aware datetimes."""
@@ -820,7 +985,7 @@ class OccupancyModule(LocationModule):
 
     @staticmethod
     def _group_authority_location_id(group_id: str) -> str:
-        return f"{_GROUP_AUTHORITY_PREFIX}{group_id}"
+        return sys.intern(f"{_GROUP_AUTHORITY_PREFIX}{group_id}")
 
     def _is_group_authority_location(self, location_id: str) -> bool:
         return location_id.startswith(_GROUP_AUTHORITY_PREFIX)
@@ -839,11 +1004,12 @@ class OccupancyModule(LocationModule):
             return None
         return origin_location_id, origin_source_id
 
-    def _config_for_location(self, location_id: str) -> Dict[str, Any]:
-        if self._loc_manager is None:
-            return {}
-        config = self._loc_manager.get_module_config(location_id, self.id)
-        return config if isinstance(config, dict) else {}
+    def _member_location_config(self, location_id: str) -> LocationConfig:
+        if self._engine is not None:
+            config = self._engine.configs.get(location_id)
+            if config is not None:
+                return config
+        return LocationConfig(id=location_id)
 
     def _resolve_group_event(
         self,
@@ -861,15 +1027,14 @@ class OccupancyModule(LocationModule):
 
         resolved_timeout = timeout
         resolved_timeout_set = timeout_set
-        if not timeout_set and event_type == EventType.TRIGGER:
-            resolved_timeout = int(
-                self._config_for_location(location_id).get("default_timeout", 300)
-            )
-            resolved_timeout_set = True
-        elif not timeout_set and event_type == EventType.CLEAR:
-            resolved_timeout = int(
-                self._config_for_location(location_id).get("default_trailing_timeout", 120)
-            )
+        if not timeout_set and event_type in (EventType.TRIGGER, EventType.CLEAR):
+            # Member defaults were resolved when configs were built; the engine keeps
+            # them on the member's LocationConfig even though events run on the authority.
+            member_config = self._member_location_config(location_id)
+            if event_type == EventType.TRIGGER:
+                resolved_timeout = member_config.default_timeout
+            else:
+                resolved_timeout = member_config.default_trailing_timeout
             resolved_timeout_set = True
 
         resolved_scope = lock_scope
@@ -885,6 +1050,9 @@ class OccupancyModule(LocationModule):
         )
 
     def _rewrite_public_event(self, event: OccupancyEvent) -> OccupancyEvent:
+        if event.location_id not in self._group_authority_by_member:
+            # Ungrouped locations run on their own runtime state unchanged.
+            return event
         (
             resolved_location_id,
             resolved_source_id,
@@ -923,41 +1091,55 @@ class OccupancyModule(LocationModule):
         if authority_id is not None:
             occupancy_group_id = self._group_id_by_authority.get(authority_id)
 
-        payload: Dict[str, Any] = {
+        # Runtime states are frozen and replaced on change, so fields serialized for the
+        # same state object (and group) are still current. Callers get their own copy.
+        cached = self._public_state_cache.get(location_id)
+        if cached is not None and cached[0] is state_override and cached[1] == occupancy_group_id:
+            fields = cached[2]
+        else:
+            fields = self._serialize_state_fields(state_override, occupancy_group_id)
+            self._public_state_cache[location_id] = (state_override, occupancy_group_id, fields)
+        payload = _copy_state_fields(fields)
+
+        if include_explanation:
+            payload["explanation"] = self._build_public_explanation(
+                location_id,
+                state_override=state_override,
+                occupancy_group_id=occupancy_group_id,
+                latest_transition=latest_transition,
+            )
+        return payload
+
+    def _serialize_state_fields(
+        self,
+        state_override: Any,
+        occupancy_group_id: str | None,
+    ) -> Dict[str, Any]:
+        return {
             "occupied": state_override.is_occupied,
-            "locked_by": list(state_override.locked_by),
+            "locked_by": [*state_override.locked_by],
             "is_locked": state_override.is_locked,
-            "lock_modes": [
-                mode.value for mode in sorted(state_override.lock_modes, key=lambda m: m.value)
-            ],
+            "lock_modes": [*_lock_mode_values(state_override.lock_modes)],
             "direct_locks": [
                 self._serialize_lock(lock, occupancy_group_id)
                 for lock in sorted(
                     state_override.direct_locks,
-                    key=lambda lock: (lock.source_id, lock.mode.value, lock.scope.value),
+                    key=_lock_sort_key,
                 )
             ],
             "contributions": [
                 self._serialize_contribution(contribution, occupancy_group_id)
-                for contribution in sorted(state_override.contributions, key=lambda c: c.source_id)
+                for contribution in sorted(state_override.contributions, key=_by_source_id)
             ],
             "suspended_contributions": [
                 self._serialize_suspended_contribution(contribution, occupancy_group_id)
                 for contribution in sorted(
                     state_override.suspended_contributions,
-                    key=lambda c: c.source_id,
+                    key=_by_source_id,
                 )
             ],
             "occupancy_group_id": occupancy_group_id,
         }
-        if include_explanation:
-            payload["explanation"] = self._build_public_explanation(
-                location_id,
-                state_override=state_override,
-                occupancy_group_id=occupancy_group_id,
-                latest_transition=latest_transition,
-            )
-        return payload
 
     def _build_public_explanation(
         self,
@@ -971,13 +1153,13 @@ class OccupancyModule(LocationModule):
         authority_id = self._group_authority_by_member.get(location_id)
         holders = [
             self._serialize_explanation_holder(contribution, occupancy_group_id)
-            for contribution in sorted(state_override.contributions, key=lambda c: c.source_id)
+            for contribution in sorted(state_override.contributions, key=_by_source_id)
         ]
         suspended_holds = [
             self._serialize_suspended_contribution(contribution, occupancy_group_id)
             for contribution in sorted(
                 state_override.suspended_contributions,
-                key=lambda c: c.source_id,
+                key=_by_source_id,
             )
         ]
 
@@ -985,11 +1167,8 @@ class OccupancyModule(LocationModule):
             holders.append(
                 {
                     "kind": "lock",
-                    "locked_by": list(state_override.locked_by),
-                    "lock_modes": [
-                        mode.value
-                        for mode in sorted(state_override.lock_modes, key=lambda m: m.value)
-                    ],
+                    "locked_by": [*state_override.locked_by],
+                    "lock_modes": [*_lock_mode_values(state_override.lock_modes)],
                 }
             )
 
@@ -1006,21 +1185,27 @@ class OccupancyModule(LocationModule):
         if projected_from is not None:
             explanation["projected_from"] = projected_from
 
-        transition = latest_transition or self._last_transition_by_location.get(location_id)
+        transition = latest_transition or None
+        if transition is None:
+            recorded = self._last_transition_by_location.get(location_id)
+            if recorded is not None:
+                transition = self._serialize_transition_explanation(
+                    recorded[0],
+                    public_location_id=location_id,
+                    changed_at=recorded[1],
+                )
         if transition is not None:
             explanation["latest_transition"] = transition
 
         if state_override.is_locked:
             explanation["locks"] = {
-                "locked_by": list(state_override.locked_by),
-                "lock_modes": [
-                    mode.value for mode in sorted(state_override.lock_modes, key=lambda m: m.value)
-                ],
+                "locked_by": [*state_override.locked_by],
+                "lock_modes": [*_lock_mode_values(state_override.lock_modes)],
                 "direct_locks": [
                     self._serialize_lock(lock, occupancy_group_id)
                     for lock in sorted(
                         state_override.direct_locks,
-                        key=lambda lock: (lock.source_id, lock.mode.value, lock.scope.value),
+                        key=_lock_sort_key,
                     )
                 ],
             }
@@ -1037,18 +1222,32 @@ class OccupancyModule(LocationModule):
         if authority_id is not None:
             return "occupancy_group"
 
-        source_ids = {contribution.source_id for contribution in state.contributions}
-        if any(source_id.startswith("__child__:") for source_id in source_ids):
+        if not state.contributions:
+            return "lock_freeze" if state.is_locked else "retained_state"
+
+        kinds = set()
+        for contribution in state.contributions:
+            synthetic = self._synthetic_source(contribution.source_id)
+            if synthetic is not None:
+                kinds.add(synthetic[0])
+        if "child" in kinds:
             return "child_rollup"
-        if any(source_id.startswith("__follow_parent__:") for source_id in source_ids):
+        if "parent" in kinds:
             return "follow_parent"
-        if any(source_id.startswith("__lock_hold__:") for source_id in source_ids):
+        if "lock_hold" in kinds:
             return "lock_hold"
-        if not source_ids and state.is_locked:
-            return "lock_freeze"
-        if source_ids:
-            return "direct"
-        return "retained_state"
+        return "direct"
+
+    @staticmethod
+    def _synthetic_source(source_id: str) -> tuple[str, str] | None:
+        """Split an engine-generated source id into (kind, origin_location_id)."""
+        prefix, separator, origin_location_id = source_id.partition(":")
+        if not separator:
+            return None
+        kind = _SYNTHETIC_SOURCE_KINDS.get(prefix)
+        if kind is None:
+            return None
+        return kind, origin_location_id
 
     def _projected_from(
         self,
@@ -1076,15 +1275,9 @@ class OccupancyModule(LocationModule):
         source_id = contribution.source_id
         item["kind"] = "source"
 
-        if source_id.startswith("__child__:"):
-            item["kind"] = "child"
-            item["origin_location_id"] = source_id[len("__child__:") :]
-        elif source_id.startswith("__follow_parent__:"):
-            item["kind"] = "parent"
-            item["origin_location_id"] = source_id[len("__follow_parent__:") :]
-        elif source_id.startswith("__lock_hold__:"):
-            item["kind"] = "lock_hold"
-            item["origin_location_id"] = source_id[len("__lock_hold__:") :]
+        synthetic = self._synthetic_source(source_id)
+        if synthetic is not None:
+            item["kind"], item["origin_location_id"] = synthetic
 
         parsed = self._parse_group_member_source_id(source_id)
         if parsed is not None:
@@ -1140,14 +1333,16 @@ class OccupancyModule(LocationModule):
     @staticmethod
     def _transition_cause(reason: str) -> str:
         """Normalize a transition reason string to a stable cause code."""
-        if reason.startswith("event:"):
-            return reason.split(":", 1)[1] or "event"
-        if reason.startswith("propagation:child:"):
-            return "child"
-        if reason == "propagation:parent":
-            return "parent"
-        if reason == "timeout":
-            return "timeout"
+        kind, separator, detail = reason.partition(":")
+        match kind:
+            case "event" if separator:
+                return detail or "event"
+            case "propagation" if detail.startswith("child:"):
+                return "child"
+            case "propagation" if detail == "parent":
+                return "parent"
+            case "timeout" if not separator:
+                return "timeout"
         return reason or "unknown"
 
     def _serialize_contribution(
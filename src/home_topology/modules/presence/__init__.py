@@ -12,6 +12,7 @@ Features:
 
 Events Emitted:
 - presence.changed: When a person enters/leaves a location
+- presence.snapshot: After state restore, with every person's location
 
 Use Cases:
 - Person-specific automations ("Mike's scene when he enters office")
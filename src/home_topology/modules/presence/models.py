@@ -1,11 +1,12 @@
 """Data models for PresenceModule."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """
     Represents a tracked person with a current location.
@@ -19,28 +20,111 @@ class Person:
         picture: Optional path to avatar image
         primary_tracker: Primary device tracker (most reliable)
         tracker_priority: Priority map for trackers (lower number = higher priority)
+
+    People are updated in place as they move, so the class is slotted but not frozen.
+    device_trackers is stored as a tuple in tracker order; add_tracker() and
+    remove_tracker() are the only way to change it, which keeps the membership set
+    in step. For a person registered with PresenceModule, use
+    add_device_tracker()/remove_device_tracker() so the module's index follows too.
     """
 
     id: str
     name: str
     current_location_id: Optional[str] = None
-    device_trackers: List[str] = field(default_factory=list)
+    device_trackers: Sequence[str] = ()
     user_id: Optional[str] = None
     picture: Optional[str] = None
     primary_tracker: Optional[str] = None
     tracker_priority: Dict[str, int] = field(default_factory=dict)
+    _tracker_ids: Set[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Set primary tracker if not specified."""
+        """Index trackers and set primary tracker if not specified."""
+        self.device_trackers = tuple(self.device_trackers)
+        self._tracker_ids = set(self.device_trackers)
         if not self.primary_tracker and self.device_trackers:
             self.primary_tracker = self.device_trackers[0]
 
+    def has_tracker(self, tracker_id: str) -> bool:
+        """Return True if the tracker belongs to this person."""
+        return tracker_id in self._tracker_ids
+
+    def add_tracker(self, tracker_id: str) -> bool:
+        """
+        Append a tracker if not already present.
+
+        Returns:
+            True if the tracker was added
+        """
+        if tracker_id in self._tracker_ids:
+            return False
+        self._tracker_ids.add(tracker_id)
+        self.device_trackers = (*self.device_trackers, tracker_id)
+        return True
+
+    def remove_tracker(self, tracker_id: str) -> bool:
+        """
+        Remove a tracker if present.
+
+        Returns:
+            True if the tracker was removed
+        """
+        if tracker_id not in self._tracker_ids:
+            return False
+        self._tracker_ids.discard(tracker_id)
+        self.device_trackers = tuple(t for t in self.device_trackers if t != tracker_id)
+        return True
+
+    def preferred_tracker(self) -> Optional[str]:
+        """
+        Return the tracker best suited to be primary.
+
+        Trackers with a priority rank ahead of those without (lower number wins);
+        ties keep tracker order.
+        """
+        priority = self.tracker_priority
+        return min(
+            self.device_trackers,
+            key=lambda tracker_id: (tracker_id not in priority, priority.get(tracker_id, 0)),
+            default=None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dict."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "current_location_id": self.current_location_id,
+            "device_trackers": list(self.device_trackers),
+            "user_id": self.user_id,
+            "picture": self.picture,
+            "primary_tracker": self.primary_tracker,
+            "tracker_priority": dict(self.tracker_priority),
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Person":
+        """Deserialize from dict."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            current_location_id=data.get("current_location_id"),
+            device_trackers=tuple(data.get("device_trackers", ())),
+            user_id=data.get("user_id"),
+            picture=data.get("picture"),
+            primary_tracker=data.get("primary_tracker"),
+            tracker_priority=dict(data.get("tracker_priority", {})),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class PresenceChange:
     """
     Represents a person's location change.
 
+    Changes are immutable records; person and tracker IDs are interned so a long
+    history of changes shares one copy of each ID string.
+
     Attributes:
         person_id: ID of the person who moved
         person_name: Name of the person
@@ -56,3 +140,29 @@ class PresenceChange:
     to_location: Optional[str]
     source_tracker: Optional[str]
     timestamp: datetime
+
+    def __post_init__(self) -> None:
+        """Intern the IDs repeated across every change for the same person."""
+        object.__setattr__(self, "person_id", sys.intern(self.person_id))
+        if self.source_tracker is not None:
+            object.__setattr__(self, "source_tracker", sys.intern(self.source_tracker))
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "PresenceChange":
+        """
+        Build a PresenceChange from a presence.changed event payload.
+
+        Args:
+            payload: Payload of a presence.changed event
+
+        Returns:
+            The change described by the payload
+        """
+        return cls(
+            person_id=payload["person_id"],
+            person_name=payload["person_name"],
+            from_location=payload.get("from_location"),
+            to_location=payload.get("to_location"),
+            source_tracker=payload.get("source_tracker"),
+            timestamp=datetime.fromisoformat(payload["timestamp"]),
+        )
@@ -1,18 +1,55 @@
 """PresenceModule - Track WHO is in each location."""
 
 import logging
+import sys
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from home_topology.core.bus import Event, EventBus, EventFilter
 from home_topology.core.manager import LocationManager
 from home_topology.modules.base import LocationModule
 
-from .models import Person, PresenceChange
+from .models import Person
 
 logger = logging.getLogger(__name__)
 
 
+def _presence_changed_event(
+    source: str,
+    person: Person,
+    from_location: Optional[str],
+    source_tracker: Optional[str],
+    timestamp: str,
+    people_in_location: List[str],
+) -> Event:
+    """
+    Build the presence.changed event for a person's completed move.
+
+    The payload is built directly (see PresenceChange.from_payload for the typed
+    view) and takes a preformatted timestamp so a batch formats it only once.
+    """
+    person_id = person.id
+    to_location_id = person.current_location_id
+    entered = bool(to_location_id)
+    return Event(
+        type="presence.changed",
+        source=source,
+        location_id=to_location_id,
+        payload={
+            "person_id": person_id,
+            "person_name": person.name,
+            "from_location": from_location,
+            "to_location": to_location_id,
+            "source_tracker": source_tracker,
+            "timestamp": timestamp,
+            # Helper fields for common queries
+            "person_entered": person_id if entered else None,
+            "person_left": None if entered else person_id,
+            "people_in_location": people_in_location,
+        },
+    )
+
+
 class PresenceModule(LocationModule):
     """
     Presence tracking module.
@@ -27,6 +64,7 @@ class PresenceModule(LocationModule):
 
     Events Emitted:
     - presence.changed: When a person's location changes
+    - presence.snapshot: After restore_state, listing every person's location
 
     Events Consumed:
     - sensor.state_changed: Device tracker updates
@@ -35,10 +73,30 @@ class PresenceModule(LocationModule):
     platform-specific Person entities to this generic tracking system.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, outbox_size: Optional[int] = None) -> None:
+        """
+        Initialize the presence module.
+
+        Args:
+            outbox_size: When set, presence.changed events are queued (up to this
+                many) instead of being published from inside the tracker handler;
+                the host publishes them with flush_presence_events(). Events that
+                arrive while the outbox is full are dropped with a warning.
+        """
+        if outbox_size is not None and outbox_size < 1:
+            raise ValueError("outbox_size must be positive")
+        self._outbox_size = outbox_size
+        self._outbox: List[Event] = []
         self._bus: Optional[EventBus] = None
         self._loc_manager: Optional[LocationManager] = None
         self._people: Dict[str, Person] = {}  # person_id → Person
+        # device tracker entity_id → owning Person (reverse index for tracker events)
+        self._tracker_to_person: Dict[str, Person] = {}
+        # location_id → {person_id: Person} for people currently there, in arrival order
+        self._location_to_people: Dict[str, Dict[str, Person]] = {}
+        # tracker entity_id → (owner, last raw state, topology version, resolved location).
+        # Entries are dropped whenever the tracker's owner changes.
+        self._tracker_cache: Dict[str, tuple[Person, Any, int, Optional[str]]] = {}
 
     @property
     def id(self) -> str:
@@ -125,12 +183,13 @@ class PresenceModule(LocationModule):
         person = Person(
             id=id,
             name=name,
-            device_trackers=device_trackers or [],
+            device_trackers=tuple(device_trackers or ()),
             user_id=user_id,
             picture=picture,
         )
 
         self._people[id] = person
+        self._index_trackers(person)
         logger.info(f"Created person: {id} ({name})")
 
         return person
@@ -148,7 +207,9 @@ class PresenceModule(LocationModule):
         if person_id not in self._people:
             raise ValueError(f"Person '{person_id}' not found")
 
-        del self._people[person_id]
+        person = self._people.pop(person_id)
+        self._unindex_trackers(person)
+        self._set_person_location(person, None)
         logger.info(f"Deleted person: {person_id}")
 
     def get_person(self, person_id: str) -> Optional[Person]:
@@ -192,8 +253,8 @@ class PresenceModule(LocationModule):
         if not person:
             raise ValueError(f"Person '{person_id}' not found")
 
-        if device_tracker not in person.device_trackers:
-            person.device_trackers.append(device_tracker)
+        if person.add_tracker(device_tracker):
+            self._tracker_to_person.setdefault(device_tracker, person)
             logger.debug(f"Added tracker {device_tracker} to person {person_id}")
 
         if priority is not None:
@@ -218,16 +279,16 @@ class PresenceModule(LocationModule):
         if not person:
             raise ValueError(f"Person '{person_id}' not found")
 
-        if device_tracker in person.device_trackers:
-            person.device_trackers.remove(device_tracker)
+        if person.remove_tracker(device_tracker):
+            self._unindex_tracker(device_tracker, person)
             logger.debug(f"Removed tracker {device_tracker} from person {person_id}")
 
         if device_tracker in person.tracker_priority:
             del person.tracker_priority[device_tracker]
 
-        # Update primary if removed
+        # Update primary if removed, promoting the highest-priority remaining tracker
         if person.primary_tracker == device_tracker:
-            person.primary_tracker = person.device_trackers[0] if person.device_trackers else None
+            person.primary_tracker = person.preferred_tracker()
 
     # Location Queries
 
@@ -241,9 +302,8 @@ class PresenceModule(LocationModule):
         Returns:
             List of Person objects in that location
         """
-        return [
-            person for person in self._people.values() if person.current_location_id == location_id
-        ]
+        occupants = self._location_to_people.get(location_id)
+        return list(occupants.values()) if occupants else []
 
     def get_person_location(self, person_id: str) -> Optional[str]:
         """
@@ -283,80 +343,224 @@ class PresenceModule(LocationModule):
             if not self._loc_manager.get_location(to_location_id):
                 raise ValueError(f"Location '{to_location_id}' not found")
 
+        self._move(person, to_location_id, source_tracker)
+
+    def _move(
+        self, person: Person, to_location_id: Optional[str], source_tracker: Optional[str]
+    ) -> None:
+        """Move an already validated person/location pair and publish the change."""
         # Check if actually changed
-        if person.current_location_id == to_location_id:
+        old_location = person.current_location_id
+        if old_location == to_location_id:
             return  # No change
 
-        old_location = person.current_location_id
-        person.current_location_id = to_location_id
+        self._set_person_location(person, to_location_id)
 
         logger.info(
-            f"Person {person_id} moved: {old_location or 'away'} → {to_location_id or 'away'}"
+            "Person %s moved: %s → %s",
+            person.id,
+            old_location or "away",
+            to_location_id or "away",
         )
 
         # Emit presence event
-        if self._bus:
-            change = PresenceChange(
-                person_id=person.id,
-                person_name=person.name,
-                from_location=old_location,
-                to_location=to_location_id,
-                source_tracker=source_tracker,
-                timestamp=datetime.now(UTC),
+        bus = self._bus
+        if bus and bus.has_subscribers("presence.changed"):
+            event = _presence_changed_event(
+                self.id,
+                person,
+                old_location,
+                source_tracker,
+                datetime.now(UTC).isoformat(),
+                self._occupant_ids(to_location_id),
             )
+            if self._outbox_size is None:
+                bus.publish(event)
+            else:
+                self._enqueue([event])
 
-            self._bus.publish(
-                Event(
-                    type="presence.changed",
-                    source=self.id,
-                    location_id=to_location_id,
-                    payload={
-                        "person_id": change.person_id,
-                        "person_name": change.person_name,
-                        "from_location": change.from_location,
-                        "to_location": change.to_location,
-                        "source_tracker": change.source_tracker,
-                        "timestamp": change.timestamp.isoformat(),
-                        # Helper fields for common queries
-                        "person_entered": person.id if to_location_id else None,
-                        "person_left": person.id if not to_location_id else None,
-                        "people_in_location": (
-                            [p.id for p in self.get_people_in_location(to_location_id)]
-                            if to_location_id
-                            else []
-                        ),
-                    },
+    def handle_tracker_updates(self, events: Iterable[Event]) -> None:
+        """Apply a burst of device tracker updates, publishing one change per person.
+
+        Hosts that receive several tracker updates together (a phone flapping between
+        zones, a household arriving at once) can hand them over at once. Updates are
+        conflated per person: only the last one for each person counts, so someone who
+        ends the burst where they started publishes nothing. The resulting
+        `presence.changed` events are published together and describe the final state.
+
+        Args:
+            events: `sensor.state_changed` events, oldest first
+        """
+        latest: Dict[str, tuple[Person, Optional[str], str]] = {}
+        for event in events:
+            update = self._resolve_tracker_update(event)
+            if update is not None:
+                latest[update[0].id] = update
+
+        moves: List[tuple[Person, Optional[str], str]] = []
+        for person, new_location, tracker_id in latest.values():
+            old_location = person.current_location_id
+            if old_location == new_location:
+                continue
+            self._set_person_location(person, new_location)
+            logger.info(
+                "Person %s moved: %s → %s",
+                person.id,
+                old_location or "away",
+                new_location or "away",
+            )
+            moves.append((person, old_location, tracker_id))
+
+        bus = self._bus
+        if not moves or not bus or not bus.has_subscribers("presence.changed"):
+            return
+
+        timestamp = datetime.now(UTC).isoformat()
+        occupants: Dict[Optional[str], List[str]] = {}
+        presence_events: List[Event] = []
+        for person, old_location, tracker_id in moves:
+            location_id = person.current_location_id
+            if location_id not in occupants:
+                occupants[location_id] = self._occupant_ids(location_id)
+            presence_events.append(
+                _presence_changed_event(
+                    self.id,
+                    person,
+                    old_location,
+                    tracker_id,
+                    timestamp,
+                    list(occupants[location_id]),
                 )
             )
+        if self._outbox_size is None:
+            bus.publish_many(presence_events)
+        else:
+            self._enqueue(presence_events)
+
+    def flush_presence_events(self) -> int:
+        """
+        Publish presence.changed events queued in the outbox.
+
+        Only meaningful when the module was created with outbox_size. Events queued
+        while flushing (by subscribers that move people) wait for the next flush.
+
+        Returns:
+            Number of events published
+        """
+        events = self._outbox
+        if not events or not self._bus:
+            return 0
+        self._outbox = []
+        self._bus.publish_many(events)
+        return len(events)
+
+    def _enqueue(self, events: List[Event]) -> None:
+        """Queue events for flush_presence_events(), dropping any that do not fit."""
+        assert self._outbox_size is not None
+        room = self._outbox_size - len(self._outbox)
+        if len(events) > room:
+            logger.warning(
+                "Presence outbox full, dropping %d presence.changed event(s)",
+                len(events) - max(room, 0),
+            )
+            events = events[: max(room, 0)]
+        self._outbox.extend(events)
+
+    def _occupant_ids(self, location_id: Optional[str]) -> List[str]:
+        """Return IDs of people currently in a location ([] when away/unknown)."""
+        if not location_id:
+            return []
+        return list(self._location_to_people.get(location_id, ()))
+
+    def _set_person_location(self, person: Person, location_id: Optional[str]) -> None:
+        """Update a person's location and keep the location → people index in sync."""
+        old_location = person.current_location_id
+        if old_location is not None:
+            occupants = self._location_to_people.get(old_location)
+            if occupants is not None and occupants.get(person.id) is person:
+                del occupants[person.id]
+                if not occupants:
+                    del self._location_to_people[old_location]
+
+        person.current_location_id = location_id
+        if location_id is not None:
+            self._location_to_people.setdefault(location_id, {})[person.id] = person
 
     # Event Handling
 
     def _on_state_changed(self, event: Event) -> None:
         """Handle device tracker state changes."""
+        update = self._resolve_tracker_update(event)
+        if update is None:
+            return
+        person, new_location, entity_id = update
+
+        # Move person if location changed (the location was validated on resolution)
+        if person.current_location_id != new_location:
+            self._move(person, new_location, entity_id)
+
+    def _resolve_tracker_update(self, event: Event) -> Optional[tuple[Person, Optional[str], str]]:
+        """Resolve a tracker state change to (person, new location, tracker ID)."""
         entity_id = event.entity_id
         if not entity_id:
-            return
+            return None
+
+        # Trackers mostly repeat their last state, so one lookup yields the owner and
+        # the previous resolution (and its existence check) while the topology is
+        # unchanged.
+        raw_state = event.payload.get("new_state")
+        if isinstance(raw_state, str):
+            # Repeats ("home", "not_home", ...) then compare by identity, and the
+            # cache holds one shared copy rather than the first event's string.
+            raw_state = sys.intern(raw_state)
+        loc_manager = self._loc_manager
+        version = loc_manager.version if loc_manager else -1
+        cached = self._tracker_cache.get(entity_id)
+        if cached is not None and cached[1] == raw_state and cached[2] == version:
+            return cached[0], cached[3], entity_id
 
         # Find which person owns this tracker
         person = self._find_person_for_tracker(entity_id)
         if not person:
-            return  # Not a tracked device
+            return None  # Not a tracked device
 
         # Determine location from tracker state
-        new_location = self._determine_location_from_state(
-            entity_id, event.payload.get("new_state")
-        )
-
-        # Move person if location changed
-        if person.current_location_id != new_location:
-            self.move_person(person.id, new_location, source_tracker=entity_id)
+        new_location = self._determine_location_from_state(entity_id, raw_state)
+        if new_location and (not loc_manager or not loc_manager.get_location(new_location)):
+            logger.warning("Ignoring %s update: location %s not found", entity_id, new_location)
+            return None
+        self._tracker_cache[entity_id] = (person, raw_state, version, new_location)
+        return person, new_location, entity_id
 
     def _find_person_for_tracker(self, tracker_id: str) -> Optional[Person]:
         """Find which person owns a device tracker."""
-        for person in self._people.values():
-            if tracker_id in person.device_trackers:
-                return person
-        return None
+        return self._tracker_to_person.get(tracker_id)
+
+    def _index_trackers(self, person: Person) -> None:
+        """Add a person's trackers to the reverse index (first owner wins)."""
+        for tracker_id in person.device_trackers:
+            self._tracker_to_person.setdefault(tracker_id, person)
+
+    def _unindex_trackers(self, person: Person) -> None:
+        """Drop a person's trackers from the reverse index."""
+        for tracker_id in person.device_trackers:
+            self._unindex_tracker(tracker_id, person)
+
+    def _unindex_tracker(self, tracker_id: str, person: Person) -> None:
+        """
+        Drop one tracker → person entry, handing it to the next owner if shared.
+
+        Only called from person/tracker management, so the fallback scan stays
+        off the event path.
+        """
+        if self._tracker_to_person.get(tracker_id) is not person:
+            return
+        del self._tracker_to_person[tracker_id]
+        self._tracker_cache.pop(tracker_id, None)
+        for other in self._people.values():
+            if other is not person and other.has_tracker(tracker_id):
+                self._tracker_to_person[tracker_id] = other
+                return
 
     def _determine_location_from_state(self, entity_id: str, state: Optional[str]) -> Optional[str]:
         """
@@ -398,19 +602,7 @@ class PresenceModule(LocationModule):
         """
         return {
             "version": 1,
-            "people": {
-                person_id: {
-                    "id": person.id,
-                    "name": person.name,
-                    "current_location_id": person.current_location_id,
-                    "device_trackers": person.device_trackers,
-                    "user_id": person.user_id,
-                    "picture": person.picture,
-                    "primary_tracker": person.primary_tracker,
-                    "tracker_priority": person.tracker_priority,
-                }
-                for person_id, person in self._people.items()
-            },
+            "people": {person_id: person.to_dict() for person_id, person in self._people.items()},
         }
 
     def restore_state(self, state: Dict) -> None:
@@ -428,16 +620,32 @@ class PresenceModule(LocationModule):
         people_data = state.get("people", {})
 
         for person_id, person_data in people_data.items():
-            person = Person(
-                id=person_data["id"],
-                name=person_data["name"],
-                current_location_id=person_data.get("current_location_id"),
-                device_trackers=person_data.get("device_trackers", []),
-                user_id=person_data.get("user_id"),
-                picture=person_data.get("picture"),
-                primary_tracker=person_data.get("primary_tracker"),
-                tracker_priority=person_data.get("tracker_priority", {}),
-            )
+            person = Person.from_dict(person_data)
+            previous = self._people.get(person_id)
+            if previous is not None:
+                self._unindex_trackers(previous)
+                self._set_person_location(previous, None)
             self._people[person_id] = person
+            self._index_trackers(person)
+            if person.current_location_id is not None:
+                self._location_to_people.setdefault(person.current_location_id, {})[
+                    person.id
+                ] = person
 
         logger.info(f"Restored {len(self._people)} people from state")
+
+        # One bulk event so subscribers can resync, instead of a change per person
+        bus = self._bus
+        if bus and bus.has_subscribers("presence.snapshot"):
+            bus.publish(
+                Event(
+                    type="presence.snapshot",
+                    source=self.id,
+                    payload={
+                        "people": [
+                            {"id": person.id, "location": person.current_location_id}
+                            for person in self._people.values()
+                        ],
+                    },
+                )
+            )
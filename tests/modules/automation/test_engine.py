@@ -1,6 +1,6 @@
 """Tests for the automation engine."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, time
 
 import pytest
 
@@ -8,13 +8,16 @@ from home_topology.core.bus import Event
 from home_topology.modules.automation import (
     AutomationEngine,
     AutomationRule,
+    ConditionEvaluator,
     DelayAction,
     EventTriggerConfig,
     ExecutionMode,
     MockPlatformAdapter,
     ServiceCallAction,
     StateCondition,
+    StateTriggerConfig,
     TimeOfDayCondition,
+    TimeTriggerConfig,
 )
 
 
@@ -143,6 +146,154 @@ class TestEventProcessing:
         assert result.rules_evaluated == 1
         assert result.rules_triggered == 0
 
+    def test_process_events_batch(self, engine, platform):
+        """Test a batch returns one result per event, in order."""
+        rule = AutomationRule(
+            id="lights_on",
+            enabled=True,
+            trigger=EventTriggerConfig(
+                event_type="occupancy.changed",
+                payload_match={"occupied": True},
+            ),
+            conditions=[],
+            actions=[ServiceCallAction(service="light.turn_on", entity_id="light.kitchen")],
+        )
+        engine.set_location_rules("kitchen", [rule])
+
+        results = engine.process_events(
+            [
+                make_occupancy_event("kitchen", True),
+                make_occupancy_event("kitchen", False),
+                make_occupancy_event("bedroom", True),
+            ]
+        )
+
+        assert [r.rules_triggered for r in results] == [1, 0, 0]
+        assert len(platform.get_service_calls()) == 1
+
+
+class TestTriggerMatching:
+    """Tests for the trigger types matched against incoming events."""
+
+    @staticmethod
+    def make_rule(trigger) -> AutomationRule:
+        return AutomationRule(
+            id="rule",
+            enabled=True,
+            trigger=trigger,
+            conditions=[],
+            actions=[ServiceCallAction(service="light.turn_on", entity_id="light.test")],
+        )
+
+    def test_only_rules_for_event_type_evaluated(self, engine):
+        """Test rules whose trigger cannot accept the event type are not evaluated."""
+        occupancy_rule = self.make_rule(
+            EventTriggerConfig(event_type="occupancy.changed", payload_match={"occupied": True})
+        )
+        state_rule = self.make_rule(StateTriggerConfig(entity_id="binary_sensor.door"))
+        engine.set_location_rules("test", [occupancy_rule, state_rule])
+
+        result = engine.process_event(make_occupancy_event("test", True))
+
+        assert result.rules_evaluated == 1
+        assert result.rules_triggered == 1
+
+    def test_payload_threshold_match(self, engine):
+        """Test min/max payload matchers bound numeric payload values."""
+        trigger = EventTriggerConfig(
+            event_type="occupancy.changed",
+            payload_match={"occupied": True, "confidence": {"min": 0.7, "max": 0.9}},
+        )
+        engine.set_location_rules("test", [self.make_rule(trigger)])
+
+        def confidence_event(confidence):
+            return Event(
+                type="occupancy.changed",
+                source="occupancy",
+                location_id="test",
+                payload={"occupied": True, "confidence": confidence},
+            )
+
+        assert engine.process_event(confidence_event(0.8)).rules_triggered == 1
+        assert engine.process_event(confidence_event(0.5)).rules_triggered == 0
+        assert engine.process_event(confidence_event(0.95)).rules_triggered == 0
+
+    def test_payload_exact_match_edge_values(self, engine):
+        """Test None matches a missing key and unhashable values still compare."""
+        trigger = EventTriggerConfig(
+            event_type="occupancy.changed",
+            payload_match={"occupied": True, "lock_state": None, "sources": ["motion"]},
+        )
+        engine.set_location_rules("test", [self.make_rule(trigger)])
+
+        def occupancy_event(**payload):
+            return Event(
+                type="occupancy.changed", source="occupancy", location_id="test", payload=payload
+            )
+
+        matching = occupancy_event(occupied=True, sources=["motion"])
+        assert engine.process_event(matching).rules_triggered == 1
+        locked = occupancy_event(occupied=True, sources=["motion"], lock_state="locked")
+        assert engine.process_event(locked).rules_triggered == 0
+        other_sources = occupancy_event(occupied=True, sources=["door"])
+        assert engine.process_event(other_sources).rules_triggered == 0
+
+    def test_single_key_payload_match(self, engine):
+        """Test a one-key payload match requires the key to be present and equal."""
+        trigger = EventTriggerConfig(
+            event_type="occupancy.changed", payload_match={"occupied": True}
+        )
+        engine.set_location_rules("test", [self.make_rule(trigger)])
+
+        def occupancy_event(**payload):
+            return Event(
+                type="occupancy.changed", source="occupancy", location_id="test", payload=payload
+            )
+
+        assert engine.process_event(occupancy_event(occupied=True)).rules_triggered == 1
+        assert engine.process_event(occupancy_event(occupied=False)).rules_triggered == 0
+        assert engine.process_event(occupancy_event(reason="test")).rules_triggered == 0
+
+    def test_state_trigger(self, engine):
+        """Test state triggers match entity, from/to states, and hold time."""
+        trigger = StateTriggerConfig(
+            entity_id="binary_sensor.door", from_state="off", to_state="on", for_seconds=30
+        )
+        engine.set_location_rules("test", [self.make_rule(trigger)])
+
+        def state_event(entity_id, old_state, new_state, held_for):
+            return Event(
+                type="sensor.state_changed",
+                source="ha",
+                location_id="test",
+                entity_id=entity_id,
+                payload={"old_state": old_state, "new_state": new_state, "for_seconds": held_for},
+            )
+
+        def triggered(*args) -> int:
+            return engine.process_event(state_event(*args)).rules_triggered
+
+        assert triggered("binary_sensor.door", "off", "on", 30) == 1
+        assert triggered("binary_sensor.door", "off", "on", 10) == 0
+        assert triggered("binary_sensor.door", "on", "off", 30) == 0
+        assert triggered("binary_sensor.other", "off", "on", 30) == 0
+
+    def test_time_trigger(self, engine):
+        """Test time triggers match time ticks at the configured second."""
+        trigger = TimeTriggerConfig(at=time(7, 0, 0))
+        engine.set_location_rules("test", [self.make_rule(trigger)])
+
+        def tick(hour, minute, second, microsecond=0):
+            return Event(
+                type="time.tick",
+                source="ha",
+                location_id="test",
+                timestamp=datetime(2025, 1, 15, hour, minute, second, microsecond, tzinfo=UTC),
+            )
+
+        assert engine.process_event(tick(7, 0, 0, 500_000)).rules_triggered == 1
+        assert engine.process_event(tick(7, 0, 1)).rules_triggered == 0
+
 
 class TestConditions:
     """Tests for condition evaluation."""
@@ -166,6 +317,74 @@ class TestConditions:
         result = engine.process_event(make_occupancy_event("test", True))
         assert result.rules_triggered == 1
 
+    def test_platform_time_read_once_per_event(self, engine, platform, monkeypatch):
+        """Test rules handling one event share a single platform time read."""
+        platform.set_current_time(datetime(2025, 1, 15, 20, 0, 0, tzinfo=UTC))  # 8 PM
+        reads = []
+        get_current_time = platform.get_current_time
+
+        def counting_time():
+            reads.append(1)
+            return get_current_time()
+
+        monkeypatch.setattr(platform, "get_current_time", counting_time)
+
+        rules = [
+            AutomationRule(
+                id=rule_id,
+                enabled=True,
+                trigger=EventTriggerConfig(event_type="occupancy.changed"),
+                conditions=[TimeOfDayCondition(after="18:00:00", before="23:00:00")],
+                actions=[ServiceCallAction(service="light.turn_on", entity_id="light.test")],
+            )
+            for rule_id in ("a", "b")
+        ]
+        engine.set_location_rules("test", rules)
+
+        result = engine.process_event(make_occupancy_event("test", True))
+        assert result.rules_triggered == 2
+        assert len(reads) == 1
+
+    def test_equal_conditions_shared_across_locations(self, engine, platform, monkeypatch):
+        """Test equal conditions in different locations are evaluated as one instance."""
+        platform.set_state("sun.sun", "below_horizon")
+        evaluated = []
+        evaluate = ConditionEvaluator.evaluate
+
+        def recording_evaluate(self, condition):
+            evaluated.append(condition)
+            return evaluate(self, condition)
+
+        monkeypatch.setattr(ConditionEvaluator, "evaluate", recording_evaluate)
+
+        def make_rule(rule_id):
+            return AutomationRule(
+                id=rule_id,
+                enabled=True,
+                trigger=EventTriggerConfig(event_type="occupancy.changed"),
+                conditions=[StateCondition(entity_id="sun.sun", state="below_horizon")],
+                actions=[ServiceCallAction(service="light.turn_on", entity_id=f"light.{rule_id}")],
+            )
+
+        kitchen_rule = make_rule("kitchen")
+        bedroom_rule = make_rule("bedroom")
+        assert kitchen_rule.conditions[0] is not bedroom_rule.conditions[0]
+        engine.set_location_rules("kitchen", [kitchen_rule])
+        engine.set_location_rules("bedroom", [bedroom_rule])
+
+        assert engine.process_event(make_occupancy_event("kitchen", True)).rules_triggered == 1
+        assert engine.process_event(make_occupancy_event("bedroom", True)).rules_triggered == 1
+        assert len(evaluated) == 2
+        assert evaluated[0] is evaluated[1]
+
+        # Dropping one location's rules leaves the other's condition intact
+        engine.set_location_rules("kitchen", [])
+        platform.set_state("sun.sun", "above_horizon")
+        assert engine.process_event(make_occupancy_event("bedroom", True)).rules_triggered == 0
+
+        entity_ids = [call[2] for call in platform.get_service_calls()]
+        assert entity_ids == ["light.kitchen", "light.bedroom"]
+
     def test_state_condition_blocks(self, engine, platform):
         """Test that rule doesn't trigger when state condition fails."""
         platform.set_state("sun.sun", "above_horizon")
@@ -380,6 +599,25 @@ class TestHistory:
         assert len(kitchen_history) == 1
         assert kitchen_history[0].location_id == "kitchen"
 
+    def test_location_history_follows_ring_buffer(self, engine, platform):
+        """Test records evicted from the ring buffer drop out of location history."""
+        rule = AutomationRule(
+            id="test",
+            enabled=True,
+            trigger=EventTriggerConfig(event_type="occupancy.changed"),
+            conditions=[],
+            actions=[ServiceCallAction(service="light.turn_on", entity_id="light.test")],
+        )
+        engine.set_location_rules("kitchen", [rule])
+        engine.set_location_rules("bedroom", [rule])
+
+        engine.process_event(make_occupancy_event("kitchen", True))
+        for _ in range(engine.HISTORY_SIZE):
+            engine.process_event(make_occupancy_event("bedroom", True))
+
+        assert engine.get_history(location_id="kitchen") == []
+        assert len(engine.get_history(location_id="bedroom", limit=1000)) == engine.HISTORY_SIZE
+
 
 class TestStateExport:
     """Tests for state export/import."""
@@ -196,6 +196,24 @@ class TestDayOfWeekCondition:
         assert evaluator.evaluate(condition) is False
 
 
+class TestEvaluateDispatch:
+    """Tests for dispatching conditions to their checks."""
+
+    def test_unknown_condition_fails(self, evaluator):
+        """Test an unrecognized condition object is not met."""
+        assert evaluator.evaluate(object()) is False
+
+    def test_condition_subclass_uses_base_check(self, platform, evaluator):
+        """Test a subclass of a known condition type is checked like its base."""
+
+        class NightCondition(TimeOfDayCondition):
+            pass
+
+        platform.set_current_time(datetime(2025, 1, 15, 23, 0, 0, tzinfo=UTC))  # 11 PM
+        condition = NightCondition(after="22:00:00", before="06:00:00")
+        assert evaluator.evaluate(condition) is True
+
+
 class TestEvaluateAll:
     """Tests for evaluating multiple conditions."""
 
@@ -221,6 +239,50 @@ class TestEvaluateAll:
         ]
         assert evaluator.evaluate_all(conditions) is False
 
+    def test_cheap_conditions_checked_first(self, platform, evaluator, caplog):
+        """Test a failing time check short-circuits before entity reads."""
+        platform.set_current_time(datetime(2025, 1, 15, 12, 0, 0, tzinfo=UTC))  # Noon
+
+        conditions = [
+            StateCondition(entity_id="binary_sensor.missing", state="on"),
+            TimeOfDayCondition(after="18:00:00", before="23:00:00"),  # Fails
+        ]
+        assert evaluator.evaluate_all(conditions) is False
+        assert "Entity not found" not in caplog.text
+
+    def test_order_conditions_is_stable(self):
+        """Test conditions are ordered by cost, keeping rule order within a cost."""
+        state = StateCondition(entity_id="sun.sun", state="below_horizon")
+        lux = LuxLevelCondition(entity_id="sensor.lux", below=50.0)
+        evening = TimeOfDayCondition(after="18:00:00", before="23:00:00")
+        night = TimeOfDayCondition(after="22:00:00", before="06:00:00")
+
+        ordered = ConditionEvaluator.order_conditions([lux, evening, state, night])
+        assert ordered == (evening, night, state, lux)
+
+    def test_platform_reads_shared_within_one_pass(self, platform, evaluator, monkeypatch):
+        """Test conditions on the same entity read it once per evaluate_all."""
+        platform.set_numeric_state("sensor.lux", 25.0)
+        reads = []
+        get_numeric_state = platform.get_numeric_state
+
+        def counting_read(entity_id):
+            reads.append(entity_id)
+            return get_numeric_state(entity_id)
+
+        monkeypatch.setattr(platform, "get_numeric_state", counting_read)
+
+        conditions = [
+            NumericStateCondition(entity_id="sensor.lux", above=10.0),
+            LuxLevelCondition(entity_id="sensor.lux", below=50.0),
+        ]
+        assert evaluator.evaluate_all(conditions) is True
+        assert reads == ["sensor.lux"]
+
+        # The next pass reads fresh values
+        assert evaluator.evaluate_all(conditions) is True
+        assert reads == ["sensor.lux", "sensor.lux"]
+
     def test_empty_conditions(self, platform, evaluator):
         """Test that empty conditions list passes."""
         assert evaluator.evaluate_all([]) is True
@@ -129,6 +129,28 @@ class TestAutomationRule:
         assert len(restored.conditions) == len(original.conditions)
         assert len(restored.actions) == len(original.actions)
 
+    def test_deserialize_interns_identifiers(self):
+        """Test rules loaded separately share identifier strings."""
+
+        def load(suffix):
+            # Build strings at runtime so they start out as distinct objects
+            return AutomationRule.from_dict(
+                {
+                    "id": f"rule_{suffix}",
+                    "trigger": {"type": "event", "event_type": "".join(["occupancy.", "changed"])},
+                    "conditions": [
+                        {"type": "state", "entity_id": "".join(["sun.", "sun"]), "state": "up"}
+                    ],
+                    "actions": [{"type": "service_call", "service": "".join(["light.", "on"])}],
+                }
+            )
+
+        first, second = load("a"), load("b")
+
+        assert first.trigger.event_type is second.trigger.event_type
+        assert first.conditions[0].entity_id is second.conditions[0].entity_id
+        assert first.actions[0].service is second.actions[0].service
+
 
 class TestTriggerConfigs:
     """Tests for trigger config types."""
@@ -177,6 +199,19 @@ class TestConditionConfigs:
 
         assert condition.condition_type == ConditionType.TIME_OF_DAY
 
+    def test_time_of_day_condition_preparses_fixed_times(self):
+        """Test fixed times are parsed up front and solar expressions are left alone."""
+        condition = TimeOfDayCondition(after="22:00", before="sunrise")
+
+        assert condition.after_time == time(22, 0)
+        assert condition.before_time is None
+        assert condition.spans_midnight is None
+
+    def test_time_of_day_condition_precomputes_window_shape(self):
+        """Test a window with two fixed bounds records whether it spans midnight."""
+        assert TimeOfDayCondition(after="22:00:00", before="06:00:00").spans_midnight is True
+        assert TimeOfDayCondition(after="08:00:00", before="18:00:00").spans_midnight is False
+
     def test_lux_level_condition(self):
         """Test lux level condition."""
         condition = LuxLevelCondition(entity_id="sensor.lux", below=50.0)
@@ -193,6 +228,55 @@ class TestConditionConfigs:
 
         assert condition.condition_type == ConditionType.DAY_OF_WEEK
 
+    def test_day_of_week_condition_mask(self):
+        """Test day of week condition precomputes its weekday bitmask."""
+        condition = DayOfWeekCondition(days=frozenset({"mon", "wed", "sun", "holiday"}))
+
+        assert condition.day_mask == 0b1000101
+        assert condition == DayOfWeekCondition(days=frozenset({"mon", "wed", "sun", "holiday"}))
+
+    def test_day_of_week_serializes_in_weekday_order(self):
+        """Test day of week conditions serialize their days in a stable order."""
+        rule = AutomationRule(
+            id="weekend",
+            enabled=True,
+            trigger=EventTriggerConfig(event_type="occupancy.changed"),
+            conditions=[DayOfWeekCondition(days=frozenset({"sun", "holiday", "sat", "mon"}))],
+            actions=[],
+        )
+
+        assert rule.to_dict()["conditions"][0]["days"] == ["mon", "sat", "sun", "holiday"]
+
+    def test_conditions_are_slotted(self):
+        """Test conditions use slots and stay weak-referenceable."""
+        import weakref
+
+        condition = TimeOfDayCondition(after="22:00:00", before="06:00:00")
+
+        assert not hasattr(condition, "__dict__")
+        assert weakref.ref(condition)() is condition
+
+
+class TestActionConfigs:
+    """Tests for action configuration."""
+
+    def test_service_call_action_presplits_service(self):
+        """Test the service is split once and turn_on/turn_off record their state."""
+        action = ServiceCallAction(service="light.turn_on", entity_id="light.kitchen")
+
+        assert (action.domain, action.service_name) == ("light", "turn_on")
+        assert action.desired_state == "on"
+        assert ServiceCallAction(service="switch.turn_off").desired_state == "off"
+        assert ServiceCallAction(service="light.toggle").desired_state is None
+
+    def test_service_call_action_invalid_service(self):
+        """Test a service without a domain leaves the split fields empty."""
+        action = ServiceCallAction(service="turn_on")
+
+        assert action.domain is None
+        assert action.service_name is None
+        assert action.desired_state is None
+
 
 class TestLocationAutomationConfig:
     """Tests for location configuration."""
@@ -215,6 +215,33 @@ class TestSensorDetection:
         assert not ambient_module._is_lux_sensor("light.kitchen_ceiling")
         assert not ambient_module._is_lux_sensor("binary_sensor.motion")
 
+    def test_platform_classification_cached(self, platform_adapter, ambient_module):
+        """Test device class/unit lookups happen once per entity until invalidated."""
+        platform_adapter.get_device_class.return_value = "illuminance"
+
+        assert ambient_module._is_lux_sensor("sensor.light_sensor_123")
+        assert ambient_module._is_lux_sensor("sensor.light_sensor_123")
+        assert platform_adapter.get_device_class.call_count == 1
+
+        platform_adapter.get_device_class.return_value = None
+        ambient_module.invalidate_ambient_sensor_cache()
+
+        assert not ambient_module._is_lux_sensor("sensor.light_sensor_123")
+
+    def test_platform_classification_refreshed_after_topology_change(
+        self, attached_ambient_module, loc_manager, platform_adapter
+    ):
+        """Test an entity classified before its device class was known is re-checked."""
+        loc_manager.add_entity_to_location("sensor.kitchen_brightness", "kitchen")
+        assert attached_ambient_module._find_lux_sensor_for_location("kitchen") is None
+
+        platform_adapter.get_device_class.return_value = "illuminance"
+        loc_manager.remove_entities_from_location(["sensor.kitchen_brightness"])
+        loc_manager.add_entity_to_location("sensor.kitchen_brightness", "kitchen")
+
+        sensor = attached_ambient_module._find_lux_sensor_for_location("kitchen")
+        assert sensor == "sensor.kitchen_brightness"
+
     def test_auto_discover_in_location(self, attached_ambient_module, loc_manager):
         """Test auto-discovering sensor in location's entities."""
         # Add lux sensor to kitchen
@@ -345,6 +372,22 @@ class TestHierarchicalLookup:
         assert reading.is_inherited is True
         assert reading.lux == 1000.0
 
+    def test_sensor_resolution_follows_topology(
+        self, attached_ambient_module, loc_manager, platform_adapter
+    ):
+        """Test cached sensor resolution is rebuilt after the topology changes."""
+        loc_manager.add_entity_to_location("sensor.house_lux", "house")
+        platform_adapter.get_numeric_state.return_value = 200.0
+
+        assert attached_ambient_module.get_ambient_light("kitchen").source_location == "house"
+
+        # A sensor added later to the kitchen takes over from the inherited one
+        loc_manager.add_entity_to_location("sensor.kitchen_lux", "kitchen")
+        reading = attached_ambient_module.get_ambient_light("kitchen")
+
+        assert reading.source_sensor == "sensor.kitchen_lux"
+        assert reading.is_inherited is False
+
     def test_no_inherit_when_disabled(self, attached_ambient_module, loc_manager, platform_adapter):
         """Test inheritance can be disabled."""
         # House has sensor
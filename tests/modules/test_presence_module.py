@@ -2,8 +2,8 @@
 
 import pytest
 
-from home_topology import Event, EventBus, LocationManager
-from home_topology.modules.presence import PresenceModule
+from home_topology import Event, EventBus, EventFilter, LocationManager
+from home_topology.modules.presence import PresenceChange, PresenceModule
 
 
 class TestPresenceModuleBasics:
@@ -52,7 +52,7 @@ class TestPersonManagement:
 
         assert person.id == "mike"
         assert person.name == "Mike"
-        assert person.device_trackers == ["device_tracker.phone"]
+        assert person.device_trackers == ("device_tracker.phone",)
         assert person.current_location_id is None
         assert person.primary_tracker == "device_tracker.phone"
 
@@ -169,6 +169,16 @@ class TestDeviceTrackerManagement:
         # Watch becomes new primary
         assert person.primary_tracker == "device_tracker.watch"
 
+    def test_remove_primary_tracker_promotes_by_priority(self, module):
+        """Test the replacement primary is the highest-priority remaining tracker."""
+        module.add_device_tracker("mike", "device_tracker.watch")
+        module.add_device_tracker("mike", "device_tracker.tablet", priority=5)
+        module.add_device_tracker("mike", "device_tracker.laptop", priority=2)
+
+        module.remove_device_tracker("mike", "device_tracker.phone")
+
+        assert module.get_person("mike").primary_tracker == "device_tracker.laptop"
+
     def test_remove_all_trackers_clears_primary(self, module):
         """Test removing all trackers clears primary."""
         module.remove_device_tracker("mike", "device_tracker.phone")
@@ -177,6 +187,22 @@ class TestDeviceTrackerManagement:
         assert person.primary_tracker is None
         assert len(person.device_trackers) == 0
 
+    def test_tracker_index_follows_person_changes(self, module):
+        """Test tracker → person lookup stays in sync with tracker management."""
+        module.add_device_tracker("mike", "device_tracker.watch")
+        module.create_person(id="sarah", name="Sarah", device_trackers=["device_tracker.tablet"])
+
+        mike = module.get_person("mike")
+        assert module._find_person_for_tracker("device_tracker.watch") is mike
+        assert module._find_person_for_tracker("device_tracker.tablet").id == "sarah"
+
+        module.remove_device_tracker("mike", "device_tracker.watch")
+        assert module._find_person_for_tracker("device_tracker.watch") is None
+
+        module.delete_person("sarah")
+        assert module._find_person_for_tracker("device_tracker.tablet") is None
+        assert module._tracker_to_person == {"device_tracker.phone": mike}
+
 
 class TestLocationQueries:
     """Test location-based queries."""
@@ -216,6 +242,23 @@ class TestLocationQueries:
         assert len(people) == 2
         assert {p.id for p in people} == {"mike", "sarah"}
 
+    def test_get_people_in_location_tracks_moves_and_deletes(self, setup):
+        """Test location queries follow people as they move or are deleted."""
+        module, _ = setup
+
+        module.move_person("mike", "kitchen")
+        module.move_person("sarah", "kitchen")
+        module.move_person("mike", "office")
+
+        assert [p.id for p in module.get_people_in_location("kitchen")] == ["sarah"]
+        assert [p.id for p in module.get_people_in_location("office")] == ["mike"]
+
+        module.delete_person("sarah")
+        module.move_person("mike", None)
+
+        assert module.get_people_in_location("kitchen") == []
+        assert module.get_people_in_location("office") == []
+
     def test_get_person_location(self, setup):
         """Test getting a person's location."""
         module, _ = setup
@@ -234,6 +277,79 @@ class TestLocationQueries:
         assert module.get_person_location("nobody") is None
 
 
+class TestPresenceModels:
+    """Test presence data models."""
+
+    def test_person_tracker_membership(self):
+        """Test Person tracker helpers are the only way to change its trackers."""
+        from home_topology.modules.presence.models import Person
+
+        person = Person(id="mike", name="Mike", device_trackers=["device_tracker.phone"])
+
+        assert person.has_tracker("device_tracker.phone")
+        assert person.add_tracker("device_tracker.watch") is True
+        assert person.add_tracker("device_tracker.watch") is False
+        assert person.device_trackers == ("device_tracker.phone", "device_tracker.watch")
+        with pytest.raises(AttributeError):
+            person.device_trackers.append("device_tracker.tablet")  # type: ignore[attr-defined]
+
+        assert person.remove_tracker("device_tracker.phone") is True
+        assert person.remove_tracker("device_tracker.phone") is False
+        assert not person.has_tracker("device_tracker.phone")
+        assert person.device_trackers == ("device_tracker.watch",)
+
+    def test_person_dict_round_trip(self):
+        """Test Person serializes to dict and back without sharing containers."""
+        from home_topology.modules.presence.models import Person
+
+        person = Person(
+            id="mike",
+            name="Mike",
+            current_location_id="kitchen",
+            device_trackers=["device_tracker.phone", "device_tracker.watch"],
+            tracker_priority={"device_tracker.phone": 1},
+        )
+
+        data = person.to_dict()
+        data["device_trackers"].append("device_tracker.tablet")
+        restored = Person.from_dict(person.to_dict())
+
+        assert restored == person
+        assert restored.has_tracker("device_tracker.watch")
+        assert person.device_trackers == ("device_tracker.phone", "device_tracker.watch")
+
+    def test_person_is_slotted(self):
+        """Test Person stores its fields in slots rather than a per-instance dict."""
+        from home_topology.modules.presence.models import Person
+
+        person = Person(id="mike", name="Mike")
+
+        assert not hasattr(person, "__dict__")
+        with pytest.raises(AttributeError):
+            person.nickname = "Mikey"  # type: ignore[attr-defined]
+
+    def test_presence_change_is_immutable(self):
+        """Test PresenceChange records cannot be modified after creation."""
+        import dataclasses
+        from datetime import UTC, datetime
+
+        from home_topology.modules.presence.models import PresenceChange
+
+        change = PresenceChange(
+            person_id="mike",
+            person_name="Mike",
+            from_location=None,
+            to_location="kitchen",
+            source_tracker="device_tracker.phone",
+            timestamp=datetime.now(UTC),
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            change.to_location = "office"  # type: ignore[misc]
+        assert change.source_tracker == "device_tracker.phone"
+        assert not hasattr(change, "__dict__")
+
+
 class TestPersonMovement:
     """Test moving people between locations."""
 
@@ -297,6 +413,34 @@ class TestPersonMovement:
         assert event.payload["to_location"] == "kitchen"
         assert event.payload["person_entered"] == "mike"
 
+    def test_presence_change_from_payload(self, setup):
+        """Test a presence.changed payload converts back to a PresenceChange."""
+        module, _, bus = setup
+
+        events = []
+        bus.subscribe(handler=events.append)
+        module.move_person("mike", "kitchen", source_tracker="device_tracker.phone")
+
+        change = PresenceChange.from_payload(events[0].payload)
+        assert change.person_id == "mike"
+        assert change.from_location is None
+        assert change.to_location == "kitchen"
+        assert change.source_tracker == "device_tracker.phone"
+        assert change.timestamp.isoformat() == events[0].payload["timestamp"]
+
+    def test_move_person_without_subscribers_skips_payload(self, setup, monkeypatch):
+        """Test no presence payload is built when nobody subscribes to it."""
+        module, _, _ = setup
+
+        def fail_occupants(location_id):
+            raise AssertionError("payload should not be built")
+
+        monkeypatch.setattr(module, "_occupant_ids", fail_occupants)
+
+        module.move_person("mike", "kitchen")
+
+        assert module.get_person_location("mike") == "kitchen"
+
     def test_move_person_no_change_no_event(self, setup):
         """Test moving person to same location doesn't emit event."""
         module, _, bus = setup
@@ -393,6 +537,28 @@ class TestStatePersistence:
         assert person.name == "Mike"
         assert person.current_location_id == "kitchen"
         assert len(person.device_trackers) == 2
+        assert new_module._find_person_for_tracker("device_tracker.watch") is person
+
+    def test_restore_publishes_one_snapshot(self, module):
+        """Test restoring state publishes a single presence snapshot."""
+        state = module.dump_state()
+        state["people"]["sarah"] = {"id": "sarah", "name": "Sarah"}
+
+        loc_mgr = LocationManager()
+        loc_mgr.create_location(id="kitchen", name="Kitchen")
+        bus = EventBus()
+        new_module = PresenceModule()
+        new_module.attach(bus, loc_mgr)
+
+        events = []
+        bus.subscribe(handler=events.append)
+        new_module.restore_state(state)
+
+        assert [e.type for e in events] == ["presence.snapshot"]
+        assert events[0].payload["people"] == [
+            {"id": "mike", "location": "kitchen"},
+            {"id": "sarah", "location": None},
+        ]
 
     def test_restore_invalid_version_ignored(self, module):
         """Test restoring invalid version is ignored."""
@@ -469,3 +635,204 @@ class TestDeviceTrackerEvents:
 
         # No presence event
         assert len(presence_events) == 0
+
+    def test_handle_tracker_updates_conflates_per_person(self, setup):
+        """Test a burst of tracker updates publishes one final change per person."""
+        module, loc_mgr, bus = setup
+        loc_mgr.add_entity_to_location("device_tracker.tablet", "kitchen")
+        module.create_person(id="sarah", name="Sarah", device_trackers=["device_tracker.tablet"])
+
+        presence_events = []
+        bus.subscribe(
+            handler=presence_events.append,
+            event_filter=EventFilter(event_type="presence.changed"),
+        )
+
+        def tracker_update(entity_id, new_state):
+            return Event(
+                type="sensor.state_changed",
+                source="ha",
+                entity_id=entity_id,
+                payload={"new_state": new_state},
+            )
+
+        module.handle_tracker_updates(
+            [
+                tracker_update("device_tracker.phone", "home"),
+                tracker_update("device_tracker.phone", None),
+                tracker_update("device_tracker.phone", "home"),
+                tracker_update("device_tracker.tablet", "home"),
+                tracker_update("device_tracker.unknown", "home"),
+            ]
+        )
+
+        assert [e.payload["person_id"] for e in presence_events] == ["mike", "sarah"]
+        assert all(e.payload["from_location"] is None for e in presence_events)
+        assert all(e.payload["to_location"] == "kitchen" for e in presence_events)
+        assert all(e.payload["people_in_location"] == ["mike", "sarah"] for e in presence_events)
+
+        # Each event carries its own occupant list
+        presence_events[0].payload["people_in_location"].clear()
+        assert presence_events[1].payload["people_in_location"] == ["mike", "sarah"]
+
+        # A round trip inside one burst leaves nothing to publish
+        presence_events.clear()
+        module.handle_tracker_updates(
+            [
+                tracker_update("device_tracker.phone", None),
+                tracker_update("device_tracker.phone", "home"),
+            ]
+        )
+        assert presence_events == []
+        assert module.get_person_location("mike") == "kitchen"
+
+    def test_repeated_tracker_state_reuses_resolution(self, setup, monkeypatch):
+        """Test repeated tracker states skip location resolution until topology changes."""
+        module, loc_mgr, bus = setup
+
+        resolved = []
+        resolve = module._determine_location_from_state
+
+        def counting_resolve(entity_id, state):
+            resolved.append(state)
+            return resolve(entity_id, state)
+
+        monkeypatch.setattr(module, "_determine_location_from_state", counting_resolve)
+
+        def publish_state():
+            bus.publish(
+                Event(
+                    type="sensor.state_changed",
+                    source="ha",
+                    entity_id="device_tracker.phone",
+                    payload={"new_state": "home"},
+                )
+            )
+
+        publish_state()
+        publish_state()
+        assert resolved == ["home"]
+        assert module.get_person_location("mike") == "kitchen"
+
+        # A manual move is still corrected by the next (repeated) tracker state
+        module.move_person("mike", None)
+        publish_state()
+        assert resolved == ["home"]
+        assert module.get_person_location("mike") == "kitchen"
+
+        # Topology changes invalidate the cached resolution
+        loc_mgr.create_location(id="office", name="Office")
+        loc_mgr.add_entity_to_location("device_tracker.phone", "office")
+        publish_state()
+        assert resolved == ["home", "home"]
+        assert module.get_person_location("mike") == "office"
+
+    def test_tracker_states_are_interned(self, setup):
+        """Test raw tracker states are interned before they are cached."""
+        import sys
+
+        module, _, bus = setup
+        state = "".join(["ho", "me"])  # A fresh string, as parsed from a payload
+
+        bus.publish(
+            Event(
+                type="sensor.state_changed",
+                source="ha",
+                entity_id="device_tracker.phone",
+                payload={"new_state": state},
+            )
+        )
+
+        assert module._tracker_cache["device_tracker.phone"][1] is sys.intern("home")
+
+    def test_removed_tracker_not_served_from_cache(self, setup):
+        """Test a cached tracker resolution is dropped with the tracker."""
+        module, _, bus = setup
+
+        def publish_state():
+            bus.publish(
+                Event(
+                    type="sensor.state_changed",
+                    source="ha",
+                    entity_id="device_tracker.phone",
+                    payload={"new_state": "home"},
+                )
+            )
+
+        publish_state()
+        assert module.get_person_location("mike") == "kitchen"
+
+        module.move_person("mike", None)
+        module.remove_device_tracker("mike", "device_tracker.phone")
+        publish_state()
+
+        assert module.get_person_location("mike") is None
+
+    def test_tracker_resolving_to_unknown_location_ignored(self, setup, monkeypatch):
+        """Test tracker states that resolve to a missing location are ignored."""
+        module, _, bus = setup
+        monkeypatch.setattr(module, "_determine_location_from_state", lambda *_: "garage")
+
+        bus.publish(
+            Event(
+                type="sensor.state_changed",
+                source="ha",
+                entity_id="device_tracker.phone",
+                payload={"new_state": "garage"},
+            )
+        )
+
+        assert module.get_person_location("mike") is None
+
+
+class TestPresenceOutbox:
+    """Test deferred publishing of presence changes."""
+
+    @pytest.fixture
+    def setup(self):
+        """Create a module that queues presence events in a small outbox."""
+        loc_mgr = LocationManager()
+        loc_mgr.create_location(id="kitchen", name="Kitchen")
+        loc_mgr.create_location(id="office", name="Office")
+
+        bus = EventBus()
+        module = PresenceModule(outbox_size=2)
+        module.attach(bus, loc_mgr)
+        module.create_person(id="mike", name="Mike")
+
+        events = []
+        bus.subscribe(
+            handler=events.append,
+            event_filter=EventFilter(event_type="presence.changed"),
+        )
+
+        return module, events
+
+    def test_events_wait_for_flush(self, setup):
+        """Test queued events are only delivered on flush."""
+        module, events = setup
+
+        module.move_person("mike", "kitchen")
+
+        assert module.get_person_location("mike") == "kitchen"
+        assert events == []
+        assert module.flush_presence_events() == 1
+        assert [e.payload["to_location"] for e in events] == ["kitchen"]
+        assert module.flush_presence_events() == 0
+
+    def test_full_outbox_drops_new_events(self, setup, caplog):
+        """Test events beyond the outbox size are dropped with a warning."""
+        module, events = setup
+
+        module.move_person("mike", "kitchen")
+        module.move_person("mike", "office")
+        module.move_person("mike", None)
+
+        assert "outbox full" in caplog.text
+        assert module.flush_presence_events() == 2
+        assert [e.payload["to_location"] for e in events] == ["kitchen", "office"]
+
+    def test_invalid_outbox_size(self):
+        """Test a non-positive outbox size is rejected."""
+        with pytest.raises(ValueError, match="outbox_size"):
+            PresenceModule(outbox_size=0)
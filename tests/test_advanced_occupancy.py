@@ -15,10 +15,12 @@ from home_topology.modules.occupancy.models import (
     REASON_TIMEOUT,
     EventType,
     LocationConfig,
+    LocationRuntimeState,
     LockMode,
     LockScope,
     OccupancyEvent,
     OccupancyStrategy,
+    SourceContribution,
 )
 
 
@@ -55,6 +57,105 @@ def test_engine_multiple_locations_different_timeouts(base_time: datetime) -> No
     assert engine.state["bedroom"].is_occupied
 
 
+def test_next_expiration_tracks_retrigger_lock_and_due_timers(base_time: datetime) -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="kitchen", default_timeout=60),
+            LocationConfig(id="bedroom", default_timeout=300),
+        ]
+    )
+
+    def trigger(loc_id: str, at: datetime) -> datetime | None:
+        return engine.handle_event(
+            OccupancyEvent(loc_id, EventType.TRIGGER, "motion", at), at
+        ).next_expiration
+
+    assert trigger("kitchen", base_time) == base_time + timedelta(seconds=60)
+    assert trigger("bedroom", base_time) == base_time + timedelta(seconds=60)
+
+    # Re-trigger supersedes the earlier kitchen timer.
+    t1 = base_time + timedelta(seconds=30)
+    assert trigger("kitchen", t1) == t1 + timedelta(seconds=60)
+
+    # Freezing the kitchen removes its timer from scheduling.
+    result = engine.handle_event(OccupancyEvent("kitchen", EventType.LOCK, "sleep", t1), t1)
+    assert result.next_expiration == base_time + timedelta(seconds=300)
+
+    # A due-but-unprocessed timer is skipped without being lost.
+    engine.handle_event(OccupancyEvent("kitchen", EventType.UNLOCK, "sleep", t1), t1)
+    late = t1 + timedelta(seconds=90)
+    assert engine._calculate_next_expiration(late) == base_time + timedelta(seconds=300)
+    assert engine._calculate_next_expiration(t1) == t1 + timedelta(seconds=60)
+
+
+def test_expiry_heap_only_reschedules_changed_timers(base_time: datetime) -> None:
+    engine = OccupancyEngine([LocationConfig(id="kitchen", default_timeout=60)])
+    engine.handle_event(
+        OccupancyEvent("kitchen", EventType.TRIGGER, "motion", base_time),
+        base_time,
+    )
+    assert len(engine._expiry_heap) == 1
+
+    # A lock that leaves the timed contributions alone does not reschedule them.
+    engine.handle_event(
+        OccupancyEvent(
+            "kitchen",
+            EventType.LOCK,
+            "guest",
+            base_time,
+            lock_mode=LockMode.BLOCK_VACANT,
+        ),
+        base_time,
+    )
+    assert engine.state["kitchen"].lock_modes == frozenset({LockMode.BLOCK_VACANT})
+    assert len(engine._expiry_heap) == 1
+    assert engine._calculate_next_expiration(base_time) == base_time + timedelta(seconds=60)
+
+
+def test_check_timeouts_sweeps_due_locations_and_propagates(base_time: datetime) -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="house"),
+            LocationConfig(id="kitchen", parent_id="house", default_timeout=60),
+            LocationConfig(id="office", parent_id="house", default_timeout=600),
+            LocationConfig(
+                id="pantry",
+                parent_id="kitchen",
+                occupancy_strategy=OccupancyStrategy.FOLLOW_PARENT,
+                contributes_to_parent=False,
+            ),
+        ]
+    )
+    engine.handle_event(
+        OccupancyEvent("kitchen", EventType.TRIGGER, "motion", base_time),
+        base_time,
+    )
+    assert engine.state["pantry"].is_occupied
+
+    assert engine.check_timeouts(base_time + timedelta(seconds=59)).transitions == []
+
+    result = engine.check_timeouts(base_time + timedelta(seconds=60))
+    assert {t.location_id for t in result.transitions} == {"kitchen", "house", "pantry"}
+    assert not engine.state["house"].is_occupied
+    assert not engine.state["pantry"].is_occupied
+    assert result.next_expiration is None
+
+
+def test_check_timeouts_ignores_restored_state_for_unconfigured_locations(
+    base_time: datetime,
+) -> None:
+    stale = LocationRuntimeState(
+        is_occupied=True,
+        contributions=frozenset({SourceContribution("motion", base_time + timedelta(seconds=60))}),
+    )
+    engine = OccupancyEngine([LocationConfig(id="kitchen")], initial_state={"gone": stale})
+
+    result = engine.check_timeouts(base_time + timedelta(seconds=120))
+    assert result.transitions == []
+    assert result.next_expiration is None
+    assert engine.state["gone"] is stale
+
+
 def test_follow_parent_ignores_direct_events(base_time: datetime) -> None:
     engine = OccupancyEngine(
         [
@@ -191,6 +292,68 @@ def test_get_effective_timeout_with_descendants(base_time: datetime) -> None:
     assert effective == base_time + timedelta(seconds=180)
 
 
+def test_engine_precomputes_topology_walks() -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="house"),
+            LocationConfig(id="main", parent_id="house"),
+            LocationConfig(id="kitchen", parent_id="main"),
+            LocationConfig(
+                id="nook",
+                parent_id="main",
+                occupancy_strategy=OccupancyStrategy.FOLLOW_PARENT,
+            ),
+            LocationConfig(id="upstairs", parent_id="house"),
+            LocationConfig(id="bedroom", parent_id="upstairs"),
+        ]
+    )
+
+    assert engine._get_descendants("house") == (
+        "main",
+        "kitchen",
+        "nook",
+        "upstairs",
+        "bedroom",
+    )
+    assert engine._get_descendants("bedroom") == ()
+    assert engine._lineage["kitchen"] == ("kitchen", "main", "house")
+    assert engine._follow_children == {"main": ("nook",)}
+    assert engine._child_sources["kitchen"] == "__child__:kitchen"
+    assert engine._follow_sources["nook"] == "__follow_parent__:main"
+    assert engine._follow_sources["house"] == "__follow_parent__"
+    assert engine._lock_hold_sources["bedroom"] == "__lock_hold__:bedroom"
+
+
+def test_engine_rejects_non_leaf_topology_edits() -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="house"),
+            LocationConfig(id="kitchen", parent_id="house"),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        engine.remove_location("house")
+    with pytest.raises(ValueError):
+        engine.add_location(LocationConfig(id="kitchen"))
+    with pytest.raises(ValueError):
+        engine.update_location(LocationConfig(id="kitchen"))
+
+    engine.add_location(
+        LocationConfig(
+            id="nook",
+            parent_id="kitchen",
+            occupancy_strategy=OccupancyStrategy.FOLLOW_PARENT,
+        )
+    )
+    assert engine._lineage["nook"] == ("nook", "kitchen", "house")
+    assert engine._follow_children == {"kitchen": ("nook",)}
+
+    engine.remove_location("nook")
+    assert engine._follow_children == {}
+    assert "kitchen" not in engine.children_map
+
+
 def test_restore_state_parses_naive_datetime() -> None:
     engine = OccupancyEngine([LocationConfig(id="kitchen", default_timeout=60)])
     snapshot = {
@@ -233,6 +396,48 @@ def test_restore_state_backward_compatible_locked_by() -> None:
     assert LockMode.FREEZE in restored.lock_modes
 
 
+def test_export_state_returns_independent_dumps(base_time: datetime) -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="kitchen", default_timeout=60),
+            LocationConfig(id="bedroom", default_timeout=60),
+        ]
+    )
+    for loc_id in ("kitchen", "bedroom"):
+        engine.handle_event(
+            OccupancyEvent(
+                location_id=loc_id,
+                event_type=EventType.TRIGGER,
+                source_id="motion",
+                timestamp=base_time,
+            ),
+            base_time,
+        )
+
+    first = engine.export_state()
+    first["bedroom"]["contributions"][0]["source_id"] = "edited"
+    first["bedroom"]["contributions"].append({"source_id": "extra", "expires_at": None})
+    first["bedroom"]["host_key"] = True
+    engine.handle_event(
+        OccupancyEvent(
+            location_id="kitchen",
+            event_type=EventType.TRIGGER,
+            source_id="motion",
+            timestamp=base_time + timedelta(seconds=30),
+        ),
+        base_time + timedelta(seconds=30),
+    )
+    second = engine.export_state()
+
+    assert second["bedroom"]["contributions"] == [
+        {"source_id": "motion", "expires_at": (base_time + timedelta(seconds=60)).isoformat()}
+    ]
+    assert "host_key" not in second["bedroom"]
+    assert second["kitchen"]["contributions"] == [
+        {"source_id": "motion", "expires_at": (base_time + timedelta(seconds=90)).isoformat()}
+    ]
+
+
 def test_module_vacate_area(base_time: datetime) -> None:
     mgr = LocationManager()
     mgr.create_location(id="house", name="House")
@@ -268,6 +473,31 @@ def test_module_vacate_area(base_time: datetime) -> None:
         assert state["occupied"] is False
 
 
+def test_engine_vacate_area_follows_topology_edits(base_time: datetime) -> None:
+    engine = OccupancyEngine(
+        [
+            LocationConfig(id="house"),
+            LocationConfig(id="kitchen", parent_id="house"),
+        ]
+    )
+    engine.vacate_area("house", "away_mode", base_time)
+    assert engine._get_descendants("house") == ("kitchen",)
+
+    engine.add_location(LocationConfig(id="pantry", parent_id="kitchen"))
+    engine.handle_event(
+        OccupancyEvent("pantry", EventType.TRIGGER, "motion", base_time),
+        base_time,
+    )
+    assert engine.state["house"].is_occupied
+
+    result = engine.vacate_area("house", "away_mode", base_time)
+    assert not engine.state["pantry"].is_occupied
+    assert not engine.state["house"].is_occupied
+    assert "pantry" in {transition.location_id for transition in result.transitions}
+
+    assert engine.vacate_area("garage", "away_mode", base_time).transitions == []
+
+
 def test_transition_reason_contract(base_time: datetime) -> None:
     engine = OccupancyEngine(
         [
@@ -161,6 +161,149 @@ def test_event_bus_location_filter_requires_event_location():
     assert len(received) == 0
 
 
+def test_event_bus_publish_many_preserves_order_and_isolates_errors():
+    """Test batch publishing delivers in order and survives a failing handler."""
+    from home_topology.core.bus import EventFilter
+
+    bus = EventBus()
+    received = []
+
+    def failing_handler(event: Event):
+        raise RuntimeError("boom")
+
+    def handler(event: Event):
+        received.append(event.location_id)
+
+    bus.subscribe(failing_handler)
+    bus.subscribe(handler, EventFilter(event_type="occupancy.changed"))
+
+    bus.publish_many(
+        [
+            Event(type="occupancy.changed", source="test", location_id="kitchen"),
+            Event(type="other.event", source="test", location_id="hall"),
+            Event(type="occupancy.changed", source="test", location_id="office"),
+        ]
+    )
+
+    assert received == ["kitchen", "office"]
+
+
+def test_event_bus_subscribe_during_publish_applies_to_next_event():
+    """Test handlers added mid-dispatch do not see the event being delivered."""
+    bus = EventBus()
+    late_received = []
+
+    def late_handler(event: Event):
+        late_received.append(event.type)
+
+    def subscribing_handler(event: Event):
+        if event.type == "first":
+            bus.subscribe(late_handler)
+
+    bus.subscribe(subscribing_handler)
+
+    bus.publish(Event(type="first", source="test"))
+    bus.publish(Event(type="second", source="test"))
+
+    assert late_received == ["second"]
+
+
+def test_event_bus_type_index_tracks_subscription_changes():
+    """Test type-indexed dispatch keeps order and follows subscribe/unsubscribe."""
+    from home_topology.core.bus import EventFilter
+
+    bus = EventBus()
+    received = []
+
+    def typed_handler(event: Event):
+        received.append(("typed", event.type))
+
+    def catch_all(event: Event):
+        received.append(("all", event.type))
+
+    bus.subscribe(typed_handler, EventFilter(event_type="occupancy.changed"))
+    bus.subscribe(catch_all)
+
+    bus.publish(Event(type="occupancy.changed", source="test"))
+    bus.publish(Event(type="other.event", source="test"))
+    assert received == [
+        ("typed", "occupancy.changed"),
+        ("all", "occupancy.changed"),
+        ("all", "other.event"),
+    ]
+
+    received.clear()
+    bus.unsubscribe(typed_handler)
+    bus.publish(Event(type="occupancy.changed", source="test"))
+    assert received == [("all", "occupancy.changed")]
+
+    received.clear()
+    bus.subscribe(typed_handler, EventFilter(event_type="occupancy.changed"))
+    bus.publish(Event(type="occupancy.changed", source="test"))
+    assert received == [("all", "occupancy.changed"), ("typed", "occupancy.changed")]
+
+
+def test_event_filter_multiple_event_types():
+    """Test a single subscription covering several event types."""
+    from home_topology.core.bus import EventFilter
+
+    bus = EventBus()
+    received = []
+
+    def handler(event: Event):
+        received.append(event.type)
+
+    bus.subscribe(
+        handler,
+        EventFilter(event_types=("location.created", "location.deleted")),
+    )
+
+    for event_type in ("location.created", "occupancy.changed", "location.deleted"):
+        bus.publish(Event(type=event_type, source="test"))
+
+    assert received == ["location.created", "location.deleted"]
+
+
+def test_event_filter_entity_id():
+    """Test subscribing to the events of a single entity."""
+    from home_topology.core.bus import EventFilter
+
+    bus = EventBus()
+    received = []
+
+    def handler(event: Event):
+        received.append(event.entity_id)
+
+    bus.subscribe(
+        handler,
+        EventFilter(event_type="sensor.state_changed", entity_id="device_tracker.phone"),
+    )
+
+    for entity_id in ("device_tracker.phone", "device_tracker.watch", None):
+        bus.publish(Event(type="sensor.state_changed", source="test", entity_id=entity_id))
+
+    assert received == ["device_tracker.phone"]
+
+
+def test_event_bus_has_subscribers():
+    """Test checking for subscribers of an event type."""
+    from home_topology.core.bus import EventFilter
+
+    bus = EventBus()
+
+    def handler(event: Event):
+        pass
+
+    assert not bus.has_subscribers("presence.changed")
+
+    bus.subscribe(handler, EventFilter(event_type="occupancy.changed"))
+    assert not bus.has_subscribers("presence.changed")
+    assert bus.has_subscribers("occupancy.changed")
+
+    bus.unsubscribe(handler)
+    assert not bus.has_subscribers("occupancy.changed")
+
+
 def test_module_config():
     """Test module configuration storage."""
     mgr = LocationManager()
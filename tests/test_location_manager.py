@@ -1231,6 +1231,45 @@ class TestLocationManagerDelete:
         logger.info("✓ Complex cascade deletion successful")
 
 
+class TestLocationManagerVersion:
+    """Test suite for the mutation version counter."""
+
+    def test_version_bumps_on_mutations(self):
+        """Test that topology, entity, and config mutations bump the version."""
+        mgr = LocationManager()
+        versions = [mgr.version]
+
+        mgr.create_location(id="house", name="House", is_explicit_root=True)
+        mgr.create_location(id="kitchen", name="Kitchen", parent_id="house")
+        versions.append(mgr.version)
+        mgr.set_module_config("kitchen", "occupancy", {"version": 1})
+        versions.append(mgr.version)
+        mgr.add_entity_to_location("binary_sensor.kitchen_motion", "kitchen")
+        versions.append(mgr.version)
+        mgr.update_location("kitchen", name="Cook Space")
+        versions.append(mgr.version)
+        mgr.reorder_location("kitchen", "house", 0)
+        versions.append(mgr.version)
+        mgr.delete_location("kitchen")
+        versions.append(mgr.version)
+
+        assert versions == sorted(set(versions))
+        logger.info(f"✓ Versions advanced monotonically: {versions}")
+
+    def test_version_unchanged_by_reads(self):
+        """Test that queries do not bump the version."""
+        mgr = LocationManager()
+        mgr.create_location(id="house", name="House")
+        version = mgr.version
+
+        mgr.get_location("house")
+        mgr.all_locations()
+        mgr.get_module_config("house", "occupancy")
+        mgr.descendants_of("house")
+
+        assert mgr.version == version
+
+
 if __name__ == "__main__":
     # Enable running tests directly
     pytest.main([__file__, "-v", "-s"])
@@ -173,6 +173,10 @@ def test_default_config_and_schema(occupancy_module: OccupancyModule) -> None:
     assert config["default_trailing_timeout"] == 120
     assert "occupancy_group_id" in config
 
+    # Callers may edit the returned dict before storing it.
+    config["default_timeout"] = 60
+    assert occupancy_module.default_config()["default_timeout"] == 300
+
     schema = occupancy_module.location_config_schema()
     assert "default_timeout" in schema["properties"]
     assert "default_trailing_timeout" in schema["properties"]
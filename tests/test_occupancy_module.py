@@ -6,6 +6,7 @@ import pytest
 
 from home_topology import Event, EventBus, LocationManager
 from home_topology.modules.occupancy import OccupancyModule
+from home_topology.modules.occupancy.models import EventType, LockMode, LockScope, OccupancyEvent
 
 
 @pytest.fixture
@@ -301,6 +302,44 @@ def test_group_events_emit_for_members_not_synthetic_authority(
     assert "dining_room" in location_ids
     assert "__occupancy_group__:main_open_area" not in location_ids
 
+    kitchen_event = next(event for event in emitted if event.location_id == "kitchen")
+    dining_event = next(event for event in emitted if event.location_id == "dining_room")
+    assert kitchen_event.payload == dining_event.payload
+    assert kitchen_event.payload is not dining_event.payload
+    assert kitchen_event.payload["occupancy_group_id"] == "main_open_area"
+
+    kitchen_event.payload["contributions"].clear()
+    assert dining_event.payload["contributions"]
+
+
+def test_group_member_signal_defaults_follow_member_config(
+    occupancy_module: OccupancyModule,
+    location_manager: LocationManager,
+) -> None:
+    kitchen_config = dict(location_manager.get_module_config("kitchen", "occupancy"))
+    kitchen_config["occupancy_group_id"] = "main_open_area"
+    kitchen_config["default_timeout"] = 45
+    dining_config = dict(location_manager.get_module_config("dining_room", "occupancy"))
+    dining_config["occupancy_group_id"] = "main_open_area"
+    dining_config.pop("default_trailing_timeout")
+    dining_config["hold_release_timeout"] = 30
+    location_manager.set_module_config("kitchen", "occupancy", kitchen_config)
+    location_manager.set_module_config("dining_room", "occupancy", dining_config)
+    occupancy_module.on_location_config_changed("kitchen", kitchen_config)
+
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", now=now)
+    occupancy_module.trigger("dining_room", "presence", timeout=None, now=now)
+    occupancy_module.clear("dining_room", "presence", now=now)
+
+    state = occupancy_module.get_location_state("kitchen")
+    assert state is not None
+    expiries = {c["origin_source_id"]: c["expires_at"] for c in state["contributions"]}
+    assert expiries == {
+        "motion": (now + timedelta(seconds=45)).isoformat(),
+        "presence": (now + timedelta(seconds=30)).isoformat(),
+    }
+
 
 def test_occupancy_changed_payload_contains_contributions(
     event_bus: EventBus,
@@ -329,12 +368,200 @@ def test_occupancy_changed_payload_contains_contributions(
     assert state is not None
     assert state["explanation"]["basis"] == "direct"
     assert state["explanation"]["latest_transition"]["cause"] == "trigger"
+    assert (
+        state["explanation"]["latest_transition"]["changed_at"]
+        == kitchen_event.timestamp.isoformat()
+    )
     assert any(
         holder.get("kind") == "source" and holder.get("source_id") == "motion"
         for holder in state["explanation"]["held_by"]
     )
 
 
+def test_contribution_only_updates_are_not_published(
+    event_bus: EventBus,
+    occupancy_module: OccupancyModule,
+) -> None:
+    emitted: list[Event] = []
+
+    def capture(event: Event) -> None:
+        if event.type == "occupancy.changed":
+            emitted.append(event)
+
+    event_bus.subscribe(capture)
+
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", timeout=60, now=now)
+    assert any(event.location_id == "kitchen" for event in emitted)
+
+    emitted.clear()
+    occupancy_module.trigger("kitchen", "motion", timeout=600, now=now + timedelta(seconds=10))
+    assert emitted == []
+
+    state = occupancy_module.get_location_state("kitchen")
+    assert state is not None
+    assert state["contributions"][0]["expires_at"] == (now + timedelta(seconds=610)).isoformat()
+
+    occupancy_module.lock("kitchen", "away_mode", now=now + timedelta(seconds=20))
+    assert [event.location_id for event in emitted] == ["kitchen"]
+    assert emitted[0].payload["is_locked"] is True
+
+
+def test_config_rebuild_reuses_unchanged_location_configs(
+    occupancy_module: OccupancyModule,
+    location_manager: LocationManager,
+) -> None:
+    engine = occupancy_module._engine
+    assert engine is not None
+    before = dict(engine.configs)
+
+    kitchen_config = dict(location_manager.get_module_config("kitchen", "occupancy"))
+    kitchen_config["default_timeout"] = 900
+    location_manager.set_module_config("kitchen", "occupancy", kitchen_config)
+    occupancy_module.on_location_config_changed("kitchen", kitchen_config)
+
+    after = occupancy_module._engine.configs
+    assert after["kitchen"] is not before["kitchen"]
+    assert after["kitchen"].default_timeout == 900
+    assert after["dining_room"] is before["dining_room"]
+    assert after["house"] is before["house"]
+
+
+def test_sibling_reorder_keeps_engine(
+    occupancy_module: OccupancyModule,
+    location_manager: LocationManager,
+) -> None:
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", timeout=60, now=now)
+    engine = occupancy_module._engine
+
+    location_manager.reorder_location("dining_room", "main_floor", 0)
+
+    assert occupancy_module._engine is engine
+    state = occupancy_module.get_location_state("kitchen")
+    assert state is not None and state["occupied"] is True
+
+    location_manager.reorder_location("reading_nook", "house", 0)
+    assert occupancy_module._engine is not engine
+    assert occupancy_module._engine.configs["reading_nook"].parent_id == "house"
+
+
+def test_single_location_changes_update_engine_in_place(
+    occupancy_module: OccupancyModule,
+    location_manager: LocationManager,
+) -> None:
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", timeout=60, now=now)
+    engine = occupancy_module._engine
+    assert engine is not None
+
+    location_manager.create_location(id="pantry", name="Pantry", parent_id="kitchen")
+    assert occupancy_module._engine is engine
+    assert engine.configs["pantry"].parent_id == "kitchen"
+    occupancy_module.trigger("pantry", "motion", timeout=60, now=now)
+    pantry = occupancy_module.get_location_state("pantry")
+    assert pantry is not None and pantry["occupied"] is True
+
+    kitchen_config = dict(location_manager.get_module_config("kitchen", "occupancy"))
+    kitchen_config["default_timeout"] = 900
+    location_manager.set_module_config("kitchen", "occupancy", kitchen_config)
+    occupancy_module.on_location_config_changed("kitchen", kitchen_config)
+    assert occupancy_module._engine is engine
+    assert engine.configs["kitchen"].default_timeout == 900
+
+    location_manager.delete_location("pantry")
+    assert occupancy_module._engine is engine
+    assert "pantry" not in engine.configs
+    assert engine._get_descendants("kitchen") == ()
+    kitchen = occupancy_module.get_location_state("kitchen")
+    assert kitchen is not None and kitchen["occupied"] is True
+
+
+def test_explanation_classifies_synthetic_holders(occupancy_module: OccupancyModule) -> None:
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", timeout=60, now=now)
+
+    floor = occupancy_module.get_location_state("main_floor")
+    assert floor is not None
+    assert floor["explanation"]["basis"] == "child_rollup"
+    assert floor["explanation"]["held_by"] == [
+        {
+            "source_id": "__child__:kitchen",
+            "expires_at": (now + timedelta(seconds=60)).isoformat(),
+            "kind": "child",
+            "origin_location_id": "kitchen",
+        }
+    ]
+
+    nook = occupancy_module.get_location_state("reading_nook")
+    assert nook is not None
+    assert nook["explanation"]["basis"] == "follow_parent"
+    assert nook["explanation"]["held_by"][0]["kind"] == "parent"
+    assert nook["explanation"]["held_by"][0]["origin_location_id"] == "main_floor"
+
+
+def test_handle_signals_applies_burst_at_latest_timestamp(
+    event_bus: EventBus,
+    occupancy_module: OccupancyModule,
+) -> None:
+    emitted: list[Event] = []
+
+    def capture(event: Event) -> None:
+        if event.type == "occupancy.changed":
+            emitted.append(event)
+
+    event_bus.subscribe(capture)
+
+    now = datetime.now(UTC)
+    occupancy_module.handle_signals(
+        [
+            Event(
+                type="occupancy.signal",
+                source="ha",
+                location_id="kitchen",
+                entity_id="binary_sensor.kitchen_door",
+                payload={"event_type": "trigger", "timeout": 30},
+                timestamp=now,
+            ),
+            Event(
+                type="occupancy.signal",
+                source="ha",
+                location_id="kitchen",
+                entity_id="binary_sensor.kitchen_motion",
+                payload={"event_type": "trigger", "timeout": 60},
+                timestamp=now + timedelta(milliseconds=10),
+            ),
+            Event(type="occupancy.signal", source="ha", location_id="kitchen", payload={}),
+        ]
+    )
+
+    assert [event.location_id for event in emitted].count("kitchen") == 1
+    state = occupancy_module.get_location_state("kitchen")
+    assert state is not None
+    batch_now = now + timedelta(milliseconds=10)
+    assert {c["source_id"]: c["expires_at"] for c in state["contributions"]} == {
+        "binary_sensor.kitchen_door": (batch_now + timedelta(seconds=30)).isoformat(),
+        "binary_sensor.kitchen_motion": (batch_now + timedelta(seconds=60)).isoformat(),
+    }
+
+
+def test_propagated_events_share_one_emit_timestamp(
+    event_bus: EventBus,
+    occupancy_module: OccupancyModule,
+) -> None:
+    emitted: list[Event] = []
+
+    def capture(event: Event) -> None:
+        if event.type == "occupancy.changed":
+            emitted.append(event)
+
+    event_bus.subscribe(capture)
+    occupancy_module.trigger("kitchen", "motion", timeout=60)
+
+    assert {"kitchen", "main_floor", "house"} <= {event.location_id for event in emitted}
+    assert len({event.timestamp for event in emitted}) == 1
+
+
 def test_public_api_rejects_negative_timeout(occupancy_module: OccupancyModule) -> None:
     with pytest.raises(ValueError):
         occupancy_module.trigger("kitchen", "motion", timeout=-1)
@@ -343,6 +570,55 @@ def test_public_api_rejects_negative_timeout(occupancy_module: OccupancyModule)
         occupancy_module.clear("kitchen", "motion", trailing_timeout=-10)
 
 
+def test_location_state_snapshots_are_independent(
+    occupancy_module: OccupancyModule,
+) -> None:
+    now = datetime.now(UTC)
+    occupancy_module.trigger("kitchen", "motion", timeout=60, now=now)
+
+    first = occupancy_module.get_location_state("kitchen")
+    assert first is not None
+    first["contributions"][0]["source_id"] = "edited"
+    first["contributions"].clear()
+
+    second = occupancy_module.get_location_state("kitchen")
+    assert second is not None
+    assert [c["source_id"] for c in second["contributions"]] == ["motion"]
+
+    occupancy_module.trigger("kitchen", "door", timeout=60, now=now)
+    third = occupancy_module.get_location_state("kitchen")
+    assert third is not None
+    assert [c["source_id"] for c in third["contributions"]] == ["door", "motion"]
+
+
+def test_public_event_rewrite_only_copies_grouped_events(
+    occupancy_module: OccupancyModule,
+    location_manager: LocationManager,
+) -> None:
+    now = datetime.now(UTC)
+    event = OccupancyEvent("kitchen", EventType.TRIGGER, "motion", now)
+    assert occupancy_module._rewrite_public_event(event) is event
+
+    kitchen_config = dict(location_manager.get_module_config("kitchen", "occupancy"))
+    kitchen_config["occupancy_group_id"] = "main_open_area"
+    location_manager.set_module_config("kitchen", "occupancy", kitchen_config)
+    occupancy_module.on_location_config_changed("kitchen", kitchen_config)
+
+    rewritten = occupancy_module._rewrite_public_event(event)
+    assert rewritten.location_id == "__occupancy_group__:main_open_area"
+    assert rewritten.timeout_set is True
+
+
+def test_public_api_requires_attach() -> None:
+    module = OccupancyModule()
+
+    with pytest.raises(RuntimeError, match="not attached"):
+        module.trigger("kitchen", "motion")
+
+    with pytest.raises(RuntimeError, match="not attached"):
+        module.lock("kitchen", "automation")
+
+
 def test_public_api_rejects_non_integer_timeout(occupancy_module: OccupancyModule) -> None:
     with pytest.raises(ValueError):
         occupancy_module.trigger("kitchen", "motion", timeout="60")  # type: ignore[arg-type]
@@ -444,3 +720,49 @@ def test_topology_mutation_rebuild_preserves_existing_state(
     pantry = occupancy_module.get_location_state("pantry")
     assert kitchen is not None and kitchen["occupied"] is True
     assert pantry is not None and pantry["occupied"] is False
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("trigger", EventType.TRIGGER),
+        (" Clear ", EventType.CLEAR),
+        ("UNLOCK_ALL", EventType.UNLOCK_ALL),
+        ("Unoccupied", EventType.VACATE),
+        ("bogus", None),
+        ("", None),
+        (EventType.LOCK, EventType.LOCK),
+        (42, None),
+    ],
+)
+def test_parse_event_type_spellings(
+    occupancy_module: OccupancyModule, raw: object, expected: EventType | None
+) -> None:
+    assert occupancy_module._parse_event_type(raw) is expected
+    # Cached lookups must return the same answer on repeat.
+    assert occupancy_module._parse_event_type(raw) is expected
+
+
+def test_parse_lock_mode_and_scope_fall_back_to_defaults(
+    occupancy_module: OccupancyModule,
+) -> None:
+    assert occupancy_module._parse_lock_mode(" Block_Vacant ") is LockMode.BLOCK_VACANT
+    assert occupancy_module._parse_lock_mode("nope") is LockMode.FREEZE
+    assert occupancy_module._parse_lock_scope("SUBTREE") is LockScope.SUBTREE
+    assert occupancy_module._parse_lock_scope(None) is LockScope.SELF
+
+
+@pytest.mark.parametrize(
+    ("reason", "cause"),
+    [
+        ("event:trigger", "trigger"),
+        ("event:", "event"),
+        ("propagation:child:kitchen", "child"),
+        ("propagation:parent", "parent"),
+        ("timeout", "timeout"),
+        ("timeout:late", "timeout:late"),
+        ("", "unknown"),
+    ],
+)
+def test_transition_cause_codes(reason: str, cause: str) -> None:
+    assert OccupancyModule._transition_cause(reason) == cause